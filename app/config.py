@@ -0,0 +1,20 @@
+"""
+환경 설정 로딩.
+
+.env 파일은 프로세스에서 한 번만 읽습니다. 많은 모듈이 import 시점에 os.getenv로 설정을 읽으므로,
+진입점(app.main, 배치 스크립트)은 다른 app 모듈보다 이 모듈을 먼저 import해야 합니다.
+"""
+from dotenv import load_dotenv
+
+_loaded = False
+
+
+def load_env() -> None:
+    """.env를 아직 읽지 않았으면 읽습니다. 이미 설정된 환경 변수는 덮어쓰지 않습니다."""
+    global _loaded
+    if not _loaded:
+        load_dotenv()
+        _loaded = True
+
+
+load_env()
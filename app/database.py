@@ -1,8 +1,11 @@
 import os
-from motor.motor_asyncio import AsyncIOMotorClient
-from dotenv import load_dotenv
+import threading
+from typing import TYPE_CHECKING, Optional
 
-load_dotenv()
+from app import config  # noqa: F401 (.env를 읽음)
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 # MongoDB 연결 정보 구성
 MONGO_USER = os.getenv("MONGO_USER", "")
@@ -17,12 +20,28 @@ if MONGO_USER and MONGO_PASSWORD:
 else:
     MONGO_DETAILS = f"mongodb://{MONGO_HOST}:{MONGO_PORT}"
 
-# Motor 클라이언트 생성 및 데이터베이스 선택
-client = AsyncIOMotorClient(MONGO_DETAILS)
-db = client[DB_NAME]
+# motor(pymongo)는 import만 100ms 가까이 걸리므로 처음 DB를 쓸 때 클라이언트를 만든다
+_client: Optional["AsyncIOMotorClient"] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> "AsyncIOMotorClient":
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from motor.motor_asyncio import AsyncIOMotorClient
+                _client = AsyncIOMotorClient(MONGO_DETAILS)
+    return _client
+
+def close_client() -> None:
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
 
-def get_db():
-    return db
+def get_db() -> "AsyncIOMotorDatabase":
+    return get_client()[DB_NAME]
 
 def get_collection(collection_name: str):
-    return db[collection_name]
\ No newline at end of file
+    return get_db()[collection_name]
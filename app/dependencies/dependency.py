@@ -1,6 +1,47 @@
-from fastapi import Depends
+import math
+import os
+import secrets
+from typing import AsyncIterator
+
+from fastapi import Depends, Header, HTTPException
 from app.database import get_db
 from app.services.career_service import CareerServiceInterface, CareerService
+from app.services.url_extraction_service import UrlExtractionService, get_url_extraction_service
+from app.repository.shared_report_repository import SharedReportRepository, get_shared_report_repository
+from app.util.admission import AdmissionRejected, AdmissionTicket, get_admission_controller
 
 def get_career_service() -> CareerServiceInterface:
-    return CareerService()
\ No newline at end of file
+    return CareerService(get_url_extraction_service())
+
+def get_url_extraction_service_dependency() -> UrlExtractionService:
+    return get_url_extraction_service()
+
+def get_shared_report_repository_dependency() -> SharedReportRepository:
+    return get_shared_report_repository()
+
+def is_admin_token(token: str) -> bool:
+    """token이 ADMIN_TOKEN 환경 변수와 일치하는지 확인합니다. ADMIN_TOKEN이 없으면 항상 False입니다."""
+    admin_token = os.getenv("ADMIN_TOKEN", "")
+    return bool(admin_token) and secrets.compare_digest(token.encode(), admin_token.encode())
+
+def require_admin(x_admin_token: str = Header(default="")) -> None:
+    """ADMIN_TOKEN 환경 변수와 X-Admin-Token 헤더가 일치할 때만 통과합니다."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+
+def _admission_dependency(name: str):
+    """엔드포인트 클래스 name의 입장 제어를 거치는 의존성을 만듭니다. 입장하지 못하면 Retry-After와 함께 503을 반환합니다."""
+    async def admit() -> AsyncIterator[AdmissionTicket]:
+        controller = get_admission_controller(name)
+        try:
+            ticket = await controller.admit()
+        except AdmissionRejected as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+        try:
+            yield ticket
+        finally:
+            controller.release(ticket)
+    return admit
+
+admit_report = _admission_dependency("report")
+admit_career = _admission_dependency("career")
@@ -7,11 +7,12 @@ from collections import defaultdict
 import os
 import argparse
 import pandas as pd
-from dotenv import load_dotenv
 
-# .env 파일 로드
-load_dotenv()
+from app import config  # noqa: F401 (.env를 읽음)
+from app.jd.jd_store import JDStore, DEFAULT_DB_PATH
+from app.util.quota_scheduler import PRIORITY_OFFLINE, get_quota_scheduler
 
+# .env 파일 로드
 class CompletionExecutor:
     def __init__(self, host, api_key=None, request_id=None):
         # host에 스킴이 있는지 확인하고 없으면 추가
@@ -48,7 +49,9 @@ class CompletionExecutor:
             url = self._host + '/testapp/v1/chat-completions/HCX-003'
             print(f"API 요청 URL: {url}")
             
-            with requests.post(url, headers=headers, json=completion_request, stream=True) as r:
+            # API 서버와 같은 CLOVA 할당량을 쓰므로, 사용자 요청이 몰리면 여기서 양보하며 기다린다
+            with get_quota_scheduler().lease(PRIORITY_OFFLINE), \
+                    requests.post(url, headers=headers, json=completion_request, stream=True) as r:
                 print(f"응답 상태 코드: {r.status_code}")
                 
                 if r.status_code != 200:
@@ -528,6 +531,7 @@ def main():
     parser.add_argument('--job_type', type=str, required=True, help='분석할 직무 유형 (예: 백엔드, 프론트엔드, AI/ML 등)')
     parser.add_argument('--input', type=str, required=True, help='JD CSV 파일 경로')
     parser.add_argument('--output', type=str, required=True, help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--db', type=str, default=DEFAULT_DB_PATH, help='JD 저장소(SQLite) 파일 경로')
     args = parser.parse_args()
     
     # API 설정 - 환경 변수에서 API 키 로드
@@ -551,14 +555,21 @@ def main():
     print(f"{args.job_type} JD 분석 시작...")
     results = analyze_jds(completion_executor, jd_data, args.job_type)
     
-    # 결과를 JSON으로 저장
+    # 결과를 JD 저장소에 저장하고 호환용 JSON 뷰 내보내기
     output_path = args.output
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    output_dir = os.path.dirname(output_path)
+    os.makedirs(output_dir, exist_ok=True)
+    job_key = os.path.basename(os.path.normpath(output_dir))
+    
+    with JDStore(args.db) as store:
+        store.replace_job_postings(job_key, results)
+        store.export_json_views(job_key, output_dir)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    if os.path.basename(output_path) != 'jd_analysis_result.json':
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
     
-    print(f"분석 완료! 결과가 '{output_path}' 파일에 저장되었습니다.")
+    print(f"분석 완료! 결과가 '{args.db}' 저장소와 '{output_path}' 파일에 저장되었습니다.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
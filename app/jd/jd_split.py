@@ -1,58 +1,45 @@
-import json
 import os
 import glob
 
-def split_jd_by_exp():
+from app.jd.jd_store import JDStore, DEFAULT_DB_PATH
+
+def split_jd_by_exp(db_path=DEFAULT_DB_PATH):
     """
-    jobs 디렉토리 내의 모든 직무 폴더에서 jd_analysis_result.json 파일을 찾아
-    신입/경력 기준으로 분류하여 jd_analysis_new.json, jd_analysis_old.json으로 저장합니다.
+    JD 저장소(SQLite)에서 직무별 공고를 신입/경력 기준으로 분류하고,
+    호환성을 위해 jd_analysis_new.json, jd_analysis_old.json 뷰를 내보냅니다.
+    저장소에 아직 없거나 jd_analysis_result.json이 마지막으로 가져온 뒤 바뀐 직무는 파일에서 다시 가져옵니다.
+
+    실행: python -m app.jd.jd_split
     """
     # jobs 디렉토리 내의 모든 폴더 찾기
     job_directories = glob.glob('jobs/*/')
-    
-    for job_dir in job_directories:
-        result_file = os.path.join(job_dir, 'jd_analysis_result.json')
-        
-        # 결과 파일이 존재하는지 확인
-        if not os.path.exists(result_file):
-            print(f"{result_file} 파일이 없습니다. 건너뜁니다.")
-            continue
-        
-        try:
-            # 파일 읽기
-            with open(result_file, 'r', encoding='utf-8') as f:
-                jd_data = json.load(f)
-            
-            # 신입과 경력을 분리할 리스트 생성
-            new_data = []
-            old_data = []
-            
-            # 데이터 분류
-            for jd in jd_data:
-                if "경력" not in jd:
-                    print(f"경력 필드가 없는 데이터를 발견했습니다: {jd.get('공고 제목', '제목 없음')}")
+
+    with JDStore(db_path) as store:
+        for job_dir in job_directories:
+            job = os.path.basename(os.path.normpath(job_dir))
+
+            try:
+                result_file = os.path.join(job_dir, 'jd_analysis_result.json')
+                if os.path.exists(result_file):
+                    if store.sync_job_postings(job, result_file):
+                        print(f"{result_file} 파일을 저장소로 가져왔습니다.")
+                elif not store.has_job(job):
+                    print(f"{result_file} 파일이 없습니다. 건너뜁니다.")
                     continue
-                    
-                career = jd["경력"]
-                if "신입" in career:
-                    new_data.append(jd)
-                if "경력" in career:
-                    old_data.append(jd)
-            
-            # 신입 데이터 저장
-            new_file = os.path.join(job_dir, 'jd_analysis_new.json')
-            with open(new_file, 'w', encoding='utf-8') as f:
-                json.dump(new_data, f, ensure_ascii=False, indent=2)
-            
-            # 경력 데이터 저장
-            old_file = os.path.join(job_dir, 'jd_analysis_old.json')
-            with open(old_file, 'w', encoding='utf-8') as f:
-                json.dump(old_data, f, ensure_ascii=False, indent=2)
-            
-            print(f"{job_dir} - 신입 데이터 {len(new_data)}개, 경력 데이터 {len(old_data)}개 분류 완료")
-            
-        except Exception as e:
-            print(f"{job_dir} 처리 중 오류 발생: {str(e)}")
+
+                unlabeled = store.count_unlabeled(job)
+                if unlabeled:
+                    print(f"경력 필드가 없는 데이터 {unlabeled}개를 발견했습니다.")
+
+                # 분류 결과를 JSON 뷰로 내보내기
+                store.export_json_views(job, job_dir)
+
+                new_count = store.count_postings(job, "new")
+                old_count = store.count_postings(job, "old")
+                print(f"{job_dir} - 신입 데이터 {new_count}개, 경력 데이터 {old_count}개 분류 완료")
+
+            except Exception as e:
+                print(f"{job_dir} 처리 중 오류 발생: {str(e)}")
 
 if __name__ == "__main__":
-    split_jd_by_exp() 
\ No newline at end of file
+    split_jd_by_exp()
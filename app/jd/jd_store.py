@@ -0,0 +1,341 @@
+import hashlib
+import json
+import os
+import sqlite3
+import argparse
+import glob
+
+DEFAULT_DB_PATH = os.getenv("JD_STORE_PATH", "jobs/jd_corpus.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    title TEXT,
+    company TEXT,
+    duty TEXT,
+    summary TEXT,
+    insight TEXT,
+    career TEXT,
+    raw TEXT NOT NULL,
+    UNIQUE (job, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_postings_job ON postings (job);
+
+CREATE TABLE IF NOT EXISTS posting_experience (
+    posting_id INTEGER NOT NULL REFERENCES postings (id) ON DELETE CASCADE,
+    exp TEXT NOT NULL CHECK (exp IN ('new', 'old')),
+    PRIMARY KEY (posting_id, exp)
+);
+CREATE INDEX IF NOT EXISTS idx_posting_experience_exp ON posting_experience (exp, posting_id);
+
+CREATE TABLE IF NOT EXISTS posting_skills (
+    posting_id INTEGER NOT NULL REFERENCES postings (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL CHECK (kind IN ('hard', 'soft')),
+    skill TEXT NOT NULL,
+    score NUMERIC NOT NULL,
+    PRIMARY KEY (posting_id, kind, skill)
+);
+CREATE INDEX IF NOT EXISTS idx_posting_skills_skill ON posting_skills (kind, skill);
+
+-- 직무별로 마지막으로 가져오거나 내보낸 jd_analysis_result.json의 sha256 (파일이 바뀌면 다시 가져온다)
+CREATE TABLE IF NOT EXISTS job_sources (
+    job TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE TABLE IF NOT EXISTS key_skills (
+    job TEXT NOT NULL,
+    exp TEXT NOT NULL CHECK (exp IN ('new', 'old')),
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (job, exp)
+);
+"""
+
+# JD 분석 결과의 스킬 필드와 저장소 kind 값 매핑
+SKILL_FIELDS = {"하드 스킬": "hard", "소프트 스킬": "soft"}
+RESULT_FILE_NAME = "jd_analysis_result.json"
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class JDStore:
+    """채용공고(JD) 분석 결과를 하나의 SQLite 파일에 저장하고 조회합니다."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def has_job(self, job):
+        row = self.conn.execute("SELECT 1 FROM postings WHERE job = ? LIMIT 1", (job,)).fetchone()
+        return row is not None
+
+    def list_jobs(self):
+        rows = self.conn.execute("SELECT DISTINCT job FROM postings ORDER BY job").fetchall()
+        return [row[0] for row in rows]
+
+    def replace_job_postings(self, job, postings):
+        """직무의 JD 분석 결과 전체를 교체 저장하고 경력 라벨을 다시 계산합니다."""
+        with self.conn:
+            self.conn.execute("DELETE FROM postings WHERE job = ?", (job,))
+            for seq, jd in enumerate(postings):
+                cursor = self.conn.execute(
+                    """
+                    INSERT INTO postings (job, seq, title, company, duty, summary, insight, career, raw)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        job,
+                        seq,
+                        jd.get("공고 제목"),
+                        jd.get("회사명"),
+                        jd.get("직무"),
+                        jd.get("주요 업무 요약"),
+                        jd.get("추가 통찰"),
+                        jd.get("경력"),
+                        json.dumps(jd, ensure_ascii=False),
+                    ),
+                )
+                posting_id = cursor.lastrowid
+                for field, kind in SKILL_FIELDS.items():
+                    skills = jd.get(field) or {}
+                    if not isinstance(skills, dict):
+                        continue
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO posting_skills (posting_id, kind, skill, score) VALUES (?, ?, ?, ?)",
+                        [(posting_id, kind, skill, score) for skill, score in skills.items()
+                         if isinstance(score, (int, float))],
+                    )
+            self._label_experience(job)
+        return len(postings)
+
+    def _record_source(self, job, digest):
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO job_sources (job, sha256) VALUES (?, ?)
+                ON CONFLICT (job) DO UPDATE SET sha256 = excluded.sha256, updated_at = datetime('now')
+                """,
+                (job, digest),
+            )
+
+    def sync_job_postings(self, job, result_file):
+        """
+        jd_analysis_result.json이 마지막으로 가져오거나 내보낸 내용과 다르면(또는 저장소에 직무가 없으면) 다시 가져옵니다.
+        다시 가져왔으면 True를 반환합니다.
+        """
+        with open(result_file, 'rb') as f:
+            data = f.read()
+        digest = _sha256(data)
+        row = self.conn.execute("SELECT sha256 FROM job_sources WHERE job = ?", (job,)).fetchone()
+        if row is not None and row[0] == digest and self.has_job(job):
+            return False
+        self.replace_job_postings(job, json.loads(data))
+        self._record_source(job, digest)
+        return True
+
+    def _label_experience(self, job):
+        # 경력 필드에 "신입"이 있으면 new, "경력"이 있으면 old (둘 다 포함될 수 있음)
+        self.conn.execute(
+            "DELETE FROM posting_experience WHERE posting_id IN (SELECT id FROM postings WHERE job = ?)",
+            (job,),
+        )
+        self.conn.execute(
+            """
+            INSERT INTO posting_experience (posting_id, exp)
+            SELECT id, 'new' FROM postings WHERE job = ? AND instr(career, '신입') > 0
+            """,
+            (job,),
+        )
+        self.conn.execute(
+            """
+            INSERT INTO posting_experience (posting_id, exp)
+            SELECT id, 'old' FROM postings WHERE job = ? AND instr(career, '경력') > 0
+            """,
+            (job,),
+        )
+
+    def count_postings(self, job, exp=None):
+        if exp is None:
+            row = self.conn.execute("SELECT COUNT(*) FROM postings WHERE job = ?", (job,)).fetchone()
+        else:
+            row = self.conn.execute(
+                """
+                SELECT COUNT(*) FROM postings p
+                JOIN posting_experience e ON e.posting_id = p.id
+                WHERE p.job = ? AND e.exp = ?
+                """,
+                (job, exp),
+            ).fetchone()
+        return row[0]
+
+    def count_unlabeled(self, job):
+        """경력 필드가 없는 공고 수를 반환합니다."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM postings WHERE job = ? AND career IS NULL", (job,)
+        ).fetchone()
+        return row[0]
+
+    def fetch_postings(self, job, exp=None):
+        """직무(및 경력 구분)의 JD 분석 결과를 원래 순서대로 반환합니다."""
+        if exp is None:
+            rows = self.conn.execute(
+                "SELECT raw FROM postings WHERE job = ? ORDER BY seq", (job,)
+            ).fetchall()
+        else:
+            rows = self.conn.execute(
+                """
+                SELECT p.raw FROM postings p
+                JOIN posting_experience e ON e.posting_id = p.id
+                WHERE p.job = ? AND e.exp = ?
+                ORDER BY p.seq
+                """,
+                (job, exp),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def fetch_skill_scores(self, job, exp, kind):
+        """(posting_id, skill, score) 목록을 공고 순서대로 반환합니다."""
+        return self.conn.execute(
+            """
+            SELECT s.posting_id, s.skill, s.score FROM posting_skills s
+            JOIN posting_experience e ON e.posting_id = s.posting_id
+            JOIN postings p ON p.id = s.posting_id
+            WHERE p.job = ? AND e.exp = ? AND s.kind = ?
+            ORDER BY p.seq
+            """,
+            (job, exp, kind),
+        ).fetchall()
+
+    def fetch_posting_ids(self, job):
+        rows = self.conn.execute("SELECT id FROM postings WHERE job = ? ORDER BY seq", (job,)).fetchall()
+        return [row[0] for row in rows]
+
+    def fetch_experience_labels(self, job):
+        """(posting_id, exp) 목록을 반환합니다."""
+        return self.conn.execute(
+            """
+            SELECT e.posting_id, e.exp FROM posting_experience e
+            JOIN postings p ON p.id = e.posting_id
+            WHERE p.job = ?
+            """,
+            (job,),
+        ).fetchall()
+
+    def fetch_job_skill_scores(self, job, kind):
+        """경력 구분 없이 직무 전체의 (posting_id, skill, score) 목록을 반환합니다."""
+        return self.conn.execute(
+            """
+            SELECT s.posting_id, s.skill, s.score FROM posting_skills s
+            JOIN postings p ON p.id = s.posting_id
+            WHERE p.job = ? AND s.kind = ?
+            ORDER BY p.seq
+            """,
+            (job, kind),
+        ).fetchall()
+
+    def save_key_skills(self, job, exp, data):
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO key_skills (job, exp, data) VALUES (?, ?, ?)
+                ON CONFLICT (job, exp) DO UPDATE SET data = excluded.data, updated_at = datetime('now')
+                """,
+                (job, exp, json.dumps(data, ensure_ascii=False)),
+            )
+
+    def fetch_key_skills(self, job, exp):
+        row = self.conn.execute(
+            "SELECT data FROM key_skills WHERE job = ? AND exp = ?", (job, exp)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def export_json_views(self, job, job_dir=None):
+        """호환성을 위해 기존 JSON 파일(jd_analysis_*.json, key_skills_*.json)을 저장소에서 내보냅니다."""
+        job_dir = job_dir or os.path.join("jobs", job)
+        os.makedirs(job_dir, exist_ok=True)
+
+        views = {
+            "jd_analysis_result.json": self.fetch_postings(job),
+            "jd_analysis_new.json": self.fetch_postings(job, "new"),
+            "jd_analysis_old.json": self.fetch_postings(job, "old"),
+        }
+        for exp in ("new", "old"):
+            key_skills = self.fetch_key_skills(job, exp)
+            if key_skills is not None:
+                views[f"key_skills_{exp}.json"] = key_skills
+
+        for file_name, data in views.items():
+            content = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+            with open(os.path.join(job_dir, file_name), 'wb') as f:
+                f.write(content)
+            # 방금 내보낸 결과 파일은 저장소와 같은 내용이므로 다음 동기화 때 다시 가져오지 않는다
+            if file_name == RESULT_FILE_NAME:
+                self._record_source(job, _sha256(content))
+
+        return list(views)
+
+
+def import_json_results(store, jobs_dir="jobs"):
+    """기존 jobs/*/ 디렉토리의 JSON 파일을 저장소로 가져옵니다."""
+    imported = {}
+    for job_dir in sorted(glob.glob(os.path.join(jobs_dir, "*/"))):
+        job = os.path.basename(os.path.normpath(job_dir))
+        result_file = os.path.join(job_dir, RESULT_FILE_NAME)
+        if not os.path.exists(result_file):
+            print(f"{result_file} 파일이 없습니다. 건너뜁니다.")
+            continue
+
+        with open(result_file, 'rb') as f:
+            data = f.read()
+        imported[job] = store.replace_job_postings(job, json.loads(data))
+        store._record_source(job, _sha256(data))
+
+        for exp in ("new", "old"):
+            key_skills_file = os.path.join(job_dir, f"key_skills_{exp}.json")
+            if os.path.exists(key_skills_file):
+                with open(key_skills_file, 'r', encoding='utf-8') as f:
+                    store.save_key_skills(job, exp, json.load(f))
+
+        print(f"{job} - 채용공고 {imported[job]}개 가져오기 완료")
+    return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JD 코퍼스 SQLite 저장소 관리')
+    parser.add_argument('command', choices=['import', 'export'], help='import: JSON -> SQLite, export: SQLite -> JSON')
+    parser.add_argument('--db', type=str, default=DEFAULT_DB_PATH, help='SQLite 파일 경로')
+    parser.add_argument('--jobs_dir', type=str, default='jobs', help='직무별 JSON 디렉토리')
+    args = parser.parse_args()
+
+    with JDStore(args.db) as store:
+        if args.command == 'import':
+            import_json_results(store, args.jobs_dir)
+        else:
+            for job in store.list_jobs():
+                files = store.export_json_views(job, os.path.join(args.jobs_dir, job))
+                print(f"{job} - {', '.join(files)} 내보내기 완료")
+
+
+if __name__ == "__main__":
+    main()
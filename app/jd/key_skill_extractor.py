@@ -2,7 +2,10 @@ import json
 import os
 import time
 import re
-from collections import defaultdict
+
+from app.jd.jd_store import JDStore
+from app.jd.skill_stats import SkillMatrix, compute_skill_stats, group_metrics
+from app.util.quota_scheduler import PRIORITY_OFFLINE, get_quota_scheduler
 
 class CompletionExecutor:
     def __init__(self, host, api_key, request_id):
@@ -28,7 +31,9 @@ class CompletionExecutor:
         try:
             url = self._host + '/testapp/v1/chat-completions/HCX-003'
             
-            with requests.post(url, headers=headers, json=completion_request, stream=True) as r:
+            # API 서버와 같은 CLOVA 할당량을 쓰므로, 사용자 요청이 몰리면 여기서 양보하며 기다린다
+            with get_quota_scheduler().lease(PRIORITY_OFFLINE), \
+                    requests.post(url, headers=headers, json=completion_request, stream=True) as r:
                 if r.status_code != 200:
                     return None
                     
@@ -72,34 +77,6 @@ def load_jd_analysis(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def extract_skills(jd_list):
-    """주어진 JD 목록에서 하드 스킬과 소프트 스킬을 추출합니다."""
-    hard_skills = defaultdict(list)
-    soft_skills = defaultdict(list)
-    
-    for jd in jd_list:
-        # 하드 스킬 추출
-        for skill, score in jd.get('하드 스킬', {}).items():
-            hard_skills[skill].append(score)
-        
-        # 소프트 스킬 추출
-        for skill, score in jd.get('소프트 스킬', {}).items():
-            soft_skills[skill].append(score)
-    
-    return hard_skills, soft_skills
-
-def calculate_skill_metrics(skills_dict):
-    """스킬 빈도와 평균 중요도를 계산합니다."""
-    skill_metrics = {}
-    
-    for skill, scores in skills_dict.items():
-        skill_metrics[skill] = {
-            'frequency': len(scores),
-            'avg_score': sum(scores) / len(scores) if scores else 0
-        }
-    
-    return skill_metrics
-
 def get_job_category_skill_mapping():
     """직무별 하드 스킬 카테고리 매핑을 반환합니다."""
     category_mapping = {
@@ -355,12 +332,8 @@ def get_job_prompt(job_category, experience_category):
     
     return prompts.get(job_category)
 
-def analyze_key_skills(executor, hard_skills, soft_skills, total_jds, job_category, experience_category):
-    """Clova AI를 사용하여 핵심 스킬을 분석합니다."""
-    
-    # 하드 스킬과 소프트 스킬 메트릭스 계산
-    hard_skill_metrics = calculate_skill_metrics(hard_skills)
-    soft_skill_metrics = calculate_skill_metrics(soft_skills)
+def analyze_key_skills(executor, hard_skill_metrics, soft_skill_metrics, total_jds, job_category, experience_category):
+    """Clova AI를 사용하여 핵심 스킬을 분석합니다. 스킬 지표는 group_metrics() 형식입니다."""
     
     # 스킬 데이터 준비
     hard_skill_data = []
@@ -538,60 +511,49 @@ def analyze_key_skills(executor, hard_skills, soft_skills, total_jds, job_catego
         print(f"{display_category} {job_category} 분석 중 오류 발생: {str(e)}")
         return None
 
-def extract_key_skills_for_job(executor, job_category):
+def extract_key_skills_for_job(executor, job_category, store=None):
     """특정 직무에 대한 핵심 스킬을 추출합니다."""
+    if store is None:
+        with JDStore() as store:
+            return extract_key_skills_for_job(executor, job_category, store)
+    
     input_dir = f'jobs/{job_category}'
     
-    # 디렉토리가 존재하는지 확인
-    if not os.path.exists(input_dir):
-        print(f"에러: {input_dir} 디렉토리를 찾을 수 없습니다.")
+    # JSON 결과 파일이 저장소에 없거나 마지막으로 가져온 뒤 바뀌었으면 다시 가져오기
+    result_path = os.path.join(input_dir, 'jd_analysis_result.json')
+    if os.path.exists(result_path):
+        store.sync_job_postings(job_category, result_path)
+    elif not store.has_job(job_category):
+        print(f"에러: {job_category} 직무의 JD 분석 데이터를 찾을 수 없습니다.")
         return
     
-    # 신입 JD 분석
-    new_jd_path = os.path.join(input_dir, 'jd_analysis_new.json')
-    new_output_path = os.path.join(input_dir, 'key_skills_new.json')
+    # 하드/소프트 스킬 통계를 신입/경력 그룹까지 한 번에 계산
+    hard_stats = compute_skill_stats(SkillMatrix.from_store(store, job_category, "hard"))
+    soft_stats = compute_skill_stats(SkillMatrix.from_store(store, job_category, "soft"))
     
-    if os.path.exists(new_jd_path):
-        print(f"신입 {job_category} JD 분석 중...")
-        new_jd_analysis = load_jd_analysis(new_jd_path)
-        new_total_jds = len(new_jd_analysis)
+    for experience_category in ("new", "old"):
+        display_category = "신입" if experience_category == "new" else "경력"
+        total_jds = store.count_postings(job_category, experience_category)
         
-        # 스킬 추출
-        new_hard_skills, new_soft_skills = extract_skills(new_jd_analysis)
-        
-        # 핵심 스킬 분석 (Clova AI 사용)
-        new_key_skills = analyze_key_skills(executor, new_hard_skills, new_soft_skills, new_total_jds, job_category, "new")
+        if total_jds == 0:
+            print(f"{display_category} {job_category} 분석 대상 JD가 없습니다.")
+            continue
         
-        if new_key_skills:
-            # 결과 저장
-            with open(new_output_path, 'w', encoding='utf-8') as f:
-                json.dump(new_key_skills, f, ensure_ascii=False, indent=2)
-            print(f"신입 {job_category} 분석 결과가 '{new_output_path}'에 저장되었습니다.")
-    else:
-        print(f"신입 {job_category} 분석 파일이 없습니다: {new_jd_path}")
-    
-    # 경력 JD 분석
-    old_jd_path = os.path.join(input_dir, 'jd_analysis_old.json')
-    old_output_path = os.path.join(input_dir, 'key_skills_old.json')
-    
-    if os.path.exists(old_jd_path):
-        print(f"경력 {job_category} JD 분석 중...")
-        old_jd_analysis = load_jd_analysis(old_jd_path)
-        old_total_jds = len(old_jd_analysis)
+        print(f"{display_category} {job_category} JD 분석 중...")
         
-        # 스킬 추출
-        old_hard_skills, old_soft_skills = extract_skills(old_jd_analysis)
+        hard_skill_metrics = group_metrics(hard_stats, experience_category)
+        soft_skill_metrics = group_metrics(soft_stats, experience_category)
         
         # 핵심 스킬 분석 (Clova AI 사용)
-        old_key_skills = analyze_key_skills(executor, old_hard_skills, old_soft_skills, old_total_jds, job_category, "old")
+        key_skills = analyze_key_skills(executor, hard_skill_metrics, soft_skill_metrics, total_jds, job_category, experience_category)
         
-        if old_key_skills:
-            # 결과 저장
-            with open(old_output_path, 'w', encoding='utf-8') as f:
-                json.dump(old_key_skills, f, ensure_ascii=False, indent=2)
-            print(f"경력 {job_category} 분석 결과가 '{old_output_path}'에 저장되었습니다.")
-    else:
-        print(f"경력 {job_category} 분석 파일이 없습니다: {old_jd_path}")
+        if key_skills:
+            # 결과 저장 후 호환용 JSON 뷰 내보내기
+            store.save_key_skills(job_category, experience_category, key_skills)
+            output_path = os.path.join(input_dir, f'key_skills_{experience_category}.json')
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(key_skills, f, ensure_ascii=False, indent=2)
+            print(f"{display_category} {job_category} 분석 결과가 '{output_path}'에 저장되었습니다.")
 
 def main():
     """모든 직무에 대한 핵심 스킬을 추출합니다."""
@@ -609,13 +571,17 @@ def main():
         "graphic-designer", "content-designer"
     ]
     
+    store = JDStore()
+    
     for job_category in job_categories:
         try:
             print(f"========== {job_category} 직무 분석 시작 ==========")
-            extract_key_skills_for_job(completion_executor, job_category)
+            extract_key_skills_for_job(completion_executor, job_category, store)
             print(f"========== {job_category} 직무 분석 완료 ==========\n")
         except Exception as e:
             print(f"{job_category} 분석 중 오류 발생: {str(e)}\n")
+    
+    store.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
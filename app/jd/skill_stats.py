@@ -0,0 +1,210 @@
+import numpy as np
+
+# 통계를 계산하는 공고 그룹 (전체 / 신입 / 경력)
+GROUPS = ("all", "new", "old")
+DEFAULT_PERCENTILES = (25, 75, 90)
+# 정수 점수를 정렬 없이 번호로 바꿀 때 허용하는 점수 값 범위와, 히스토그램으로 분위수를 구할 최대 칸 수
+MAX_SCORE_LEVELS = 1024
+HISTOGRAM_MAX_CELLS = 1 << 22
+
+
+class SkillMatrix:
+    """(공고 × 스킬) 점수 행렬을 COO 형식의 희소 배열로 보관합니다."""
+
+    def __init__(self, rows, cols, scores, skills, n_postings, is_new=None, is_old=None):
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.skills = list(skills)
+        self.n_postings = int(n_postings)
+        self.is_new = np.zeros(self.n_postings, dtype=bool) if is_new is None else np.asarray(is_new, dtype=bool)
+        self.is_old = np.zeros(self.n_postings, dtype=bool) if is_old is None else np.asarray(is_old, dtype=bool)
+
+    @property
+    def n_skills(self):
+        return len(self.skills)
+
+    @classmethod
+    def from_triplets(cls, triplets, posting_keys=None, new_keys=(), old_keys=()):
+        """(posting_key, skill, score) 목록으로 행렬을 만듭니다."""
+        posting_index = {}
+        skill_index = {}
+        if posting_keys is not None:
+            for key in posting_keys:
+                posting_index.setdefault(key, len(posting_index))
+
+        rows, cols, scores = [], [], []
+        for posting_key, skill, score in triplets:
+            rows.append(posting_index.setdefault(posting_key, len(posting_index)))
+            cols.append(skill_index.setdefault(skill, len(skill_index)))
+            scores.append(score)
+
+        n_postings = len(posting_index)
+        is_new = np.zeros(n_postings, dtype=bool)
+        is_old = np.zeros(n_postings, dtype=bool)
+        is_new[[posting_index[k] for k in new_keys if k in posting_index]] = True
+        is_old[[posting_index[k] for k in old_keys if k in posting_index]] = True
+
+        return cls(rows, cols, scores, skill_index, n_postings, is_new, is_old)
+
+    @classmethod
+    def from_jd_list(cls, jd_list, field):
+        """JD 분석 결과 목록에서 field("하드 스킬" / "소프트 스킬") 행렬을 만듭니다."""
+        triplets = (
+            (i, skill, score)
+            for i, jd in enumerate(jd_list)
+            for skill, score in (jd.get(field) or {}).items()
+        )
+        new_keys = [i for i, jd in enumerate(jd_list) if "신입" in str(jd.get("경력", ""))]
+        old_keys = [i for i, jd in enumerate(jd_list) if "경력" in str(jd.get("경력", ""))]
+        return cls.from_triplets(triplets, range(len(jd_list)), new_keys, old_keys)
+
+    @classmethod
+    def from_store(cls, store, job, kind):
+        """JD 저장소에서 직무의 전체 공고(신입/경력 라벨 포함) 행렬을 만듭니다."""
+        labels = store.fetch_experience_labels(job)
+        return cls.from_triplets(
+            store.fetch_job_skill_scores(job, kind),
+            store.fetch_posting_ids(job),
+            [pid for pid, exp in labels if exp == "new"],
+            [pid for pid, exp in labels if exp == "old"],
+        )
+
+    def to_dense(self):
+        dense = np.full((self.n_postings, self.n_skills), np.nan)
+        dense[self.rows, self.cols] = self.scores
+        return dense
+
+
+def _score_levels(scores):
+    """
+    점수를 (서로 다른 점수 값, 항목별 값 번호)로 바꿉니다.
+    점수는 보통 0~100 정수이므로 그 경우에는 정렬(np.unique) 없이 바로 번호를 매긴다.
+    """
+    if len(scores) and np.array_equal(scores, np.floor(scores)):
+        low, high = scores.min(), scores.max()
+        if high - low < MAX_SCORE_LEVELS:
+            return np.arange(low, high + 1), (scores - low).astype(np.int64)
+    return np.unique(scores, return_inverse=True)
+
+
+def _histogram_quantiles(cells, n_keys, levels):
+    """(키, 점수 값)별 개수 히스토그램에서 누적 개수로 분위수를 찾습니다. 정렬 없이 O(항목 수)입니다."""
+    n_levels = len(levels)
+    hist = np.bincount(cells, minlength=n_keys * n_levels).reshape(n_keys, n_levels)
+    counts = hist.sum(axis=1)
+    sums = hist @ levels
+    cumulative = np.cumsum(hist, axis=1)
+
+    def value_at(present, rank):
+        # 오름차순으로 rank번째(0부터) 점수 = 누적 개수가 rank 이하인 점수 값의 개수 번째 값
+        return levels[(cumulative[present] <= rank[:, None]).sum(axis=1)]
+
+    return counts, sums, value_at
+
+
+def _sorted_quantiles(keys, values, n_keys):
+    """(키, 점수) 순으로 한 번 정렬해 각 키의 점수가 연속 구간에 오름차순으로 놓이게 합니다."""
+    counts = np.bincount(keys, minlength=n_keys)
+    sums = np.bincount(keys, weights=values, minlength=n_keys)
+    sorted_values = values[np.lexsort((values, keys))]
+    offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    def value_at(present, rank):
+        return sorted_values[offsets[present] + rank]
+
+    return counts, sums, value_at
+
+
+def compute_skill_stats(matrix, percentiles=DEFAULT_PERCENTILES):
+    """
+    그룹(전체/신입/경력)별 스킬 통계를 한 번에 계산합니다.
+    점수 값의 종류가 적으면(보통 0~100 정수) (그룹, 스킬, 점수 값) 히스토그램으로, 아니면 한 번의 정렬로 분위수를 구합니다.
+
+    Returns:
+        {"skills": [...], "all": {...}, "new": {...}, "old": {...}, "delta": {...}}
+        각 그룹은 frequency, share, mean, median, p{n} 배열을 가집니다.
+    """
+    n_skills = matrix.n_skills
+    n_groups = len(GROUPS)
+    n_keys = n_groups * n_skills
+
+    # 공고가 속한 그룹마다 항목을 (그룹, 스킬) 키로 센다
+    membership = [
+        slice(None),
+        matrix.is_new[matrix.rows] if matrix.n_postings else np.zeros(0, dtype=bool),
+        matrix.is_old[matrix.rows] if matrix.n_postings else np.zeros(0, dtype=bool),
+    ]
+    levels, codes = _score_levels(matrix.scores)
+    if n_keys * len(levels) <= HISTOGRAM_MAX_CELLS:
+        cells = matrix.cols * len(levels) + codes
+        counts, sums, value_at = _histogram_quantiles(
+            np.concatenate([cells[mask] + g * n_skills * len(levels) for g, mask in enumerate(membership)]),
+            n_keys,
+            levels,
+        )
+    else:
+        counts, sums, value_at = _sorted_quantiles(
+            np.concatenate([matrix.cols[mask] + g * n_skills for g, mask in enumerate(membership)]),
+            np.concatenate([matrix.scores[mask] for mask in membership]),
+            n_keys,
+        )
+
+    def quantile(q):
+        result = np.full(n_keys, np.nan)
+        present = counts > 0
+        pos = (counts[present] - 1) * (q / 100.0)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.ceil(pos).astype(np.int64)
+        lo_values = value_at(present, lo)
+        hi_values = value_at(present, hi)
+        result[present] = lo_values + (hi_values - lo_values) * (pos - lo)
+        return result
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+    group_sizes = np.array([matrix.n_postings, matrix.is_new.sum(), matrix.is_old.sum()], dtype=np.float64)
+    shares = counts / np.maximum(np.repeat(group_sizes, n_skills), 1)
+
+    stats = {"skills": matrix.skills}
+    quantiles = {"median": quantile(50)}
+    for p in percentiles:
+        quantiles[f"p{p}"] = quantile(p)
+
+    for g, group in enumerate(GROUPS):
+        window = slice(g * n_skills, (g + 1) * n_skills)
+        stats[group] = {
+            "postings": int(group_sizes[g]),
+            "frequency": counts[window],
+            "share": shares[window],
+            "mean": means[window],
+            **{name: values_[window] for name, values_ in quantiles.items()},
+        }
+
+    stats["delta"] = {
+        "share": stats["old"]["share"] - stats["new"]["share"],
+        "mean": stats["old"]["mean"] - stats["new"]["mean"],
+        "median": stats["old"]["median"] - stats["new"]["median"],
+    }
+    return stats
+
+
+def group_metrics(stats, group="all"):
+    """compute_skill_stats() 결과에서 한 그룹의 {스킬: 지표} 사전을 만듭니다."""
+    data = stats[group]
+    metrics = {}
+    for i, skill in enumerate(stats["skills"]):
+        frequency = int(data["frequency"][i])
+        if frequency == 0:
+            continue
+        metrics[skill] = {
+            "frequency": frequency,
+            "avg_score": float(data["mean"][i]),
+            "share": float(data["share"][i]),
+            **{
+                name: float(values[i])
+                for name, values in data.items()
+                if name == "median" or (name.startswith("p") and name[1:].isdigit())
+            },
+        }
+    return metrics
@@ -1,12 +1,72 @@
+# 다른 app 모듈이 import 시점에 환경 변수를 읽기 전에 .env를 먼저 로드한다
+from app import config  # noqa: F401 (.env를 읽음)
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from fastapi.middleware.cors import CORSMiddleware
 from app.router.report_router import router as report_router
 from app.router.career_router import router as career_router
-from dotenv import load_dotenv
+from app.router.admin_router import router as admin_router
+from app.router.health_router import router as health_router
+from app.router.report_router import preload_job_skills
+from app.database import close_client, get_client, get_db
+from app.util.http_fetcher import get_static_fetcher
+from app.util.browser_pool import get_browser_pool
+from app.util.completion_excute import close_clova_session, warm_clova_connection
+from app.util.loop_monitor import LOOP_MONITOR_ENABLED, get_loop_monitor
+from app.util.profiler import ProfilingMiddleware
+from app.util.quota_scheduler import PRIORITY_INTERACTIVE, set_default_priority
+from app.util.rate_limiter import RateLimitMiddleware
+from app.util.tracing import TracingMiddleware, get_span_exporter
+from app.util.warmup import ReadinessMiddleware, Warmup, WarmupCheck
+
+# API 프로세스에서 use_priority() 없이 시작된 CLOVA 호출은 사용자 요청으로 본다
+set_default_priority(PRIORITY_INTERACTIVE)
+
+
+async def _ping_mongo():
+    # motor import(약 100ms)가 이벤트 루프를 막지 않도록 클라이언트는 스레드에서 만든다
+    await asyncio.to_thread(get_client)
+    await get_db().command("ping")
+
+
+async def _connect_clova():
+    return {"status_code": await asyncio.to_thread(warm_clova_connection)}
+
+
+async def _load_skills():
+    return {"files": await asyncio.to_thread(preload_job_skills)}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    시작 시 MongoDB 연결, CLOVA TLS 연결, Chromium 실행, skills 파일 파싱을 병렬로 예열합니다.
+    예열은 백그라운드에서 진행되고, 끝날 때까지 /readyz와 API 요청(ReadinessMiddleware)은 503을 반환합니다.
+    """
+    if LOOP_MONITOR_ENABLED:
+        get_loop_monitor().start()
+    app.state.warmup = Warmup([
+        WarmupCheck("mongo", _ping_mongo, required=True),
+        WarmupCheck("clova", _connect_clova),
+        WarmupCheck("browser", get_browser_pool().warm),
+        WarmupCheck("skills", _load_skills),
+    ])
+    app.state.warmup.start()
+    yield
+    await app.state.warmup.aclose()
+    await get_loop_monitor().stop()
+    await get_static_fetcher().aclose()
+    await get_browser_pool().aclose()
+    close_clova_session()
+    close_client()
+    await asyncio.to_thread(get_span_exporter().close)
+
 
-load_dotenv()
 app = FastAPI(
+    lifespan=lifespan,
     title="PotenCheck API",
     description="경력 분석 보고서 생성 및 관리를 위한 API",
     version="1.0.0",
@@ -18,14 +78,31 @@ app = FastAPI(
         {
             "name": "career",
             "description": "경력 정보 관련 API"
+        },
+        {
+            "name": "admin",
+            "description": "운영 지표 조회 API (X-Admin-Token 필요)"
+        },
+        {
+            "name": "health",
+            "description": "헬스 체크(/healthz)와 준비 상태(/readyz) API"
         }
     ]
 )
 
 app.include_router(career_router)
 app.include_router(report_router)
-load_dotenv()
+app.include_router(admin_router)
+app.include_router(health_router)
 
+# 예열이 끝나기 전의 503 응답에도 CORS 헤더와 trace가 붙도록 가장 안쪽에 둔다
+app.add_middleware(ReadinessMiddleware)
+# 프로파일러는 trace id를 쓰므로 TracingMiddleware 안쪽(먼저 추가)에 둔다
+app.add_middleware(ProfilingMiddleware)
+# CORS 미들웨어보다 먼저 추가해야 CORS가 바깥에서 감싸 429 응답에도 CORS 헤더가 붙는다
+app.add_middleware(RateLimitMiddleware)
+# 요청 제한으로 거절된 요청도 trace에 남도록 요청 제한 바깥에서 루트 span을 만든다
+app.add_middleware(TracingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
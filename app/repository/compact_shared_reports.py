@@ -0,0 +1,115 @@
+"""
+shared_reports 중복 정리 마이그레이션
+
+1. 해시가 없는 reports 문서에 content_hash를 채웁니다.
+2. 같은 내용의 shared_reports를 가장 오래된 문서 하나로 합치고, 나머지 공유 ID는 aliases로 남겨 기존 링크가 계속 동작하게 합니다.
+3. 원본 보고서를 찾을 수 있는 공유 레코드는 복사된 보고서 필드를 지우고 report_id로 참조합니다.
+
+실행: python -m app.repository.compact_shared_reports [--dry-run]
+"""
+import argparse
+import asyncio
+from typing import Dict, List
+
+from pymongo import DeleteMany, UpdateOne
+
+from app.database import get_collection
+from app.repository.shared_report_repository import SharedReportRepository
+from app.util.report_serializer import REPORT_CONTENT_FIELDS, report_content_hash
+
+BATCH_SIZE = 500
+
+
+async def backfill_report_hashes(reports, dry_run: bool) -> int:
+    updates: List[UpdateOne] = []
+    count = 0
+    async for doc in reports.find({"content_hash": {"$exists": False}}):
+        content_hash = report_content_hash(doc)
+        if not content_hash:
+            continue
+        updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"content_hash": content_hash}}))
+        count += 1
+        if len(updates) >= BATCH_SIZE and not dry_run:
+            await reports.bulk_write(updates, ordered=False)
+            updates = []
+    if updates and not dry_run:
+        await reports.bulk_write(updates, ordered=False)
+    return count
+
+
+async def compact_shared_reports(shared, reports, dry_run: bool) -> Dict[str, int]:
+    # 내용 해시별로 가장 오래된 문서를 대표로 고른다
+    groups: Dict[str, List[Dict]] = {}
+    skipped = 0
+    async for doc in shared.find({}).sort("_id", 1):
+        content_hash = doc.get("content_hash") or report_content_hash(doc)
+        if not content_hash:
+            # 스키마와 맞지 않는 레코드는 같은 내용인지 판단할 수 없어 그대로 둔다
+            skipped += 1
+            continue
+        groups.setdefault(content_hash, []).append(doc)
+
+    stats = {"shared_before": sum(len(docs) for docs in groups.values()) + skipped, "removed": 0, "referenced": 0}
+    updates: List = []
+
+    for content_hash, docs in groups.items():
+        canonical, duplicates = docs[0], docs[1:]
+        update: Dict = {"$set": {"content_hash": content_hash}}
+
+        aliases = list(canonical.get("aliases", []))
+        for duplicate in duplicates:
+            aliases.extend([duplicate["id"]] + duplicate.get("aliases", []))
+        if aliases:
+            update["$set"]["aliases"] = aliases
+
+        if not canonical.get("report_id"):
+            source = await reports.find_one({"content_hash": content_hash}, {"_id": 1})
+            if source:
+                update["$set"]["report_id"] = str(source["_id"])
+                update["$unset"] = {field: "" for field in REPORT_CONTENT_FIELDS}
+                stats["referenced"] += 1
+
+        # 중복을 먼저 지워야 대표 문서에 content_hash를 넣을 때 유니크 인덱스와 충돌하지 않는다
+        if duplicates:
+            updates.append(DeleteMany({"_id": {"$in": [duplicate["_id"] for duplicate in duplicates]}}))
+            stats["removed"] += len(duplicates)
+        updates.append(UpdateOne({"_id": canonical["_id"]}, update))
+
+        if len(updates) >= BATCH_SIZE and not dry_run:
+            await shared.bulk_write(updates, ordered=True)
+            updates = []
+
+    if updates and not dry_run:
+        await shared.bulk_write(updates, ordered=True)
+
+    stats["shared_after"] = len(groups) + skipped
+    return stats
+
+
+async def run(dry_run: bool) -> None:
+    reports = get_collection("reports")
+    shared = get_collection("shared_reports")
+
+    backfilled = await backfill_report_hashes(reports, dry_run)
+    print(f"reports content_hash 추가: {backfilled}건")
+
+    stats = await compact_shared_reports(shared, reports, dry_run)
+    print(f"shared_reports: {stats['shared_before']}건 → {stats['shared_after']}건 (중복 {stats['removed']}건 제거)")
+    print(f"원본 참조로 전환: {stats['referenced']}건")
+
+    if dry_run:
+        print("dry-run: 변경 사항을 저장하지 않았습니다.")
+    else:
+        await SharedReportRepository(shared, reports).ensure_indexes()
+        print("인덱스 생성 완료")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="shared_reports 중복 정리 마이그레이션")
+    parser.add_argument("--dry-run", action="store_true", help="변경하지 않고 결과만 출력")
+    args = parser.parse_args()
+    asyncio.run(run(args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
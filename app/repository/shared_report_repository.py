@@ -0,0 +1,104 @@
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from bson.objectid import ObjectId
+
+from app.database import get_collection
+from app.util.report_serializer import REPORT_CONTENT_FIELDS, report_content_hash
+
+logger = logging.getLogger("app")
+
+CONTENT_PROJECTION = {field: 1 for field in REPORT_CONTENT_FIELDS}
+
+
+class SharedReportRepository:
+    """
+    공유 보고서 저장소입니다. 공유 레코드는 내용 해시로 중복을 제거하고,
+    원본 보고서가 있으면 내용을 복사하지 않고 report_id로 참조합니다.
+
+    shared_reports 문서 형태:
+        {"id": 공유 ID, "content_hash": ..., "report_id": 원본 보고서 _id 문자열, "aliases": [이전 공유 ID], "created_at": ...}
+        원본 보고서를 찾지 못한 경우에만 보고서 필드를 함께 저장합니다.
+    """
+
+    def __init__(self, shared_collection=None, reports_collection=None):
+        self.shared = shared_collection if shared_collection is not None else get_collection("shared_reports")
+        self.reports = reports_collection if reports_collection is not None else get_collection("reports")
+        self._indexes_ready = False
+
+    async def ensure_indexes(self) -> None:
+        if self._indexes_ready:
+            return
+        await self.shared.create_index(
+            "content_hash",
+            unique=True,
+            partialFilterExpression={"content_hash": {"$exists": True}},
+        )
+        await self.shared.create_index("id")
+        await self.shared.create_index("aliases")
+        await self.reports.create_index("content_hash")
+        self._indexes_ready = True
+
+    async def share(self, report: Dict) -> str:
+        """보고서 내용을 공유하고 공유 ID를 반환합니다. 같은 내용이 이미 공유되어 있으면 기존 ID를 반환합니다."""
+        await self.ensure_indexes()
+        content_hash = report_content_hash(report)
+
+        existing = await self.shared.find_one({"content_hash": content_hash}, {"id": 1})
+        if existing:
+            logger.info(f"이미 공유된 보고서 재사용: {existing['id']}")
+            return existing["id"]
+
+        record = {
+            "id": str(uuid.uuid4()),
+            "content_hash": content_hash,
+            "created_at": datetime.now(timezone.utc),
+        }
+        source = await self.reports.find_one({"content_hash": content_hash}, {"_id": 1})
+        if source:
+            record["report_id"] = str(source["_id"])
+        else:
+            # 원본을 찾을 수 없는 내용(수정된 보고서, 해시 도입 이전 보고서)은 그대로 저장
+            record.update({field: report[field] for field in REPORT_CONTENT_FIELDS if field in report})
+
+        # pymongo는 import가 무거워 DB를 실제로 쓰는 시점에 가져온다
+        from pymongo.errors import DuplicateKeyError
+        try:
+            await self.shared.insert_one(record)
+        except DuplicateKeyError:
+            # 동시에 같은 내용을 공유한 요청이 먼저 저장한 경우
+            existing = await self.shared.find_one({"content_hash": content_hash}, {"id": 1})
+            return existing["id"]
+        return record["id"]
+
+    async def resolve(self, share_id: str) -> Optional[Dict]:
+        """공유 ID(또는 병합 전 공유 ID)로 보고서 내용을 찾습니다. 응답의 id는 요청한 공유 ID입니다."""
+        record = await self.shared.find_one({"$or": [{"id": share_id}, {"aliases": share_id}]})
+        if not record:
+            return None
+
+        content = None
+        if record.get("report_id"):
+            content = await self.reports.find_one({"_id": ObjectId(record["report_id"])}, CONTENT_PROJECTION)
+        if not content:
+            content = record
+
+        report = {field: content[field] for field in REPORT_CONTENT_FIELDS if field in content}
+        if not report:
+            logger.warning(f"공유 보고서의 원본을 찾을 수 없습니다: {share_id}")
+            return None
+        report["id"] = share_id
+        return report
+
+
+_shared_report_repository: Optional[SharedReportRepository] = None
+
+
+def get_shared_report_repository() -> SharedReportRepository:
+    """프로세스 전체에서 공유하는 SharedReportRepository를 반환합니다."""
+    global _shared_report_repository
+    if _shared_report_repository is None:
+        _shared_report_repository = SharedReportRepository()
+    return _shared_report_repository
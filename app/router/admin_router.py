@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+
+from app.dependencies.dependency import require_admin
+from app.services.url_extraction_service import get_url_extraction_service
+from app.util.admission import admission_stats
+from app.util.browser_pool import get_browser_pool
+from app.util.circuit_breaker import circuit_breaker_stats
+from app.util.completion_excute import clova_client_stats
+from app.util.concurrency_limiter import get_clova_limiter
+from app.util.http_fetcher import get_static_fetcher
+from app.util.loop_monitor import get_loop_monitor
+from app.util.profiler import get_profile_store
+from app.util.quota_scheduler import get_quota_scheduler
+from app.util.rate_limiter import get_rate_limiter
+from app.util.resume_normalizer import normalizer_stats
+from app.util.single_flight import single_flight_stats
+from app.util.tracing import get_span_exporter, is_valid_trace_id
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)]
+)
+
+logger = logging.getLogger("app")
+
+@router.get("/metrics")
+async def get_metrics() -> Dict[str, Any]:
+    """
+    서버 내부 지표를 조회합니다. X-Admin-Token 헤더가 필요합니다.
+
+    - admission: 엔드포인트 클래스(report/career)별 처리 중/대기 요청 수와 거절 횟수
+    - rate_limit: 클라이언트별 요청 제한 통과/거절 횟수와 추적 중인 클라이언트 수
+    - single_flight: 동시 요청 합치기(URL/PDF/LLM) 통계
+    - url_extraction: 단계별(notion_api/static/browser) 처리 횟수
+    - http_cache: 정적 fetcher 응답 캐시 통계
+    - browser_pool: 브라우저 슬롯 사용 현황
+    - clova: CLOVA 동시 호출 한도(AIMD)와 슬롯 사용 현황
+    - clova_quota: 호스트 단위 CLOVA 할당량의 우선순위 클래스별 사용/대기 현황
+    - clova_client: CLOVA 응답 지연 시간(p50/p95)과 헤징 횟수
+    - circuit_breakers: 회로 차단기 상태
+    - tracing: 보관 중인 span 수와 내보내기 설정
+    - event_loop: 이벤트 루프 지연 시간 히스토그램과 최근 블로킹 기록(멈춘 지점의 스택)
+    - resume_normalizer: 이력서 텍스트 정규화 전후 문자 수와 규칙별 제거량
+    """
+    return {
+        "admission": admission_stats(),
+        "rate_limit": get_rate_limiter().stats(),
+        "single_flight": single_flight_stats(),
+        "url_extraction": get_url_extraction_service().stats(),
+        "http_cache": get_static_fetcher().cache.stats(),
+        "browser_pool": get_browser_pool().stats(),
+        "clova": get_clova_limiter().stats(),
+        "clova_quota": get_quota_scheduler().stats(),
+        "clova_client": clova_client_stats(),
+        "circuit_breakers": circuit_breaker_stats(),
+        "tracing": get_span_exporter().stats(),
+        "event_loop": get_loop_monitor().stats(),
+        "resume_normalizer": normalizer_stats(),
+    }
+
+@router.get("/traces")
+async def list_traces(limit: int = Query(50, ge=1, le=500)) -> List[Dict[str, Any]]:
+    """최근 요청 trace 요약(루트 span 이름, 소요 시간, span/오류 수)을 최신순으로 조회합니다."""
+    return get_span_exporter().traces(limit)
+
+@router.get("/traces/{trace_id}")
+async def get_trace(trace_id: str) -> List[Dict[str, Any]]:
+    """trace 하나의 span 목록을 시작 시각 순으로 조회합니다. 응답 헤더 X-Request-ID 값으로 찾을 수 있습니다."""
+    spans = get_span_exporter().trace(trace_id)
+    if not spans:
+        raise HTTPException(status_code=404, detail="trace를 찾을 수 없습니다. (메모리 보관 범위를 벗어났을 수 있음)")
+    return spans
+
+@router.get("/profiles")
+async def list_profiles() -> List[Dict[str, Any]]:
+    """
+    저장된 요청 프로파일 목록을 최신순으로 조회합니다.
+    X-Admin-Token과 함께 X-Profile: 1 헤더를 보낸 요청(또는 PROFILE_SAMPLE_RATE로 뽑힌 요청)이 프로파일링됩니다.
+    """
+    return await asyncio.to_thread(get_profile_store().list)
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str) -> FileResponse:
+    """프로파일을 folded stack 형식으로 내려받습니다. flamegraph.pl이나 speedscope에 그대로 넣을 수 있습니다."""
+    path = get_profile_store().folded_path(profile_id) if is_valid_trace_id(profile_id) else None
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=f"{profile_id}.folded")
@@ -4,8 +4,11 @@ from typing import Dict, Any, Union
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 
-from app.dependencies.dependency import get_career_service
+from app.dependencies.dependency import admit_career, get_career_service
 from app.services.career_service import CareerServiceInterface
+from app.util.admission import AdmissionTicket
+from app.util.circuit_breaker import CircuitOpenError
+from app.util.deadline import Deadline, DeadlineExceeded, REQUEST_DEADLINE_SECONDS
 
 router = APIRouter(
     prefix="/career",
@@ -14,7 +17,7 @@ router = APIRouter(
 
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format='%(asctime)s - %(name)s - %(levelname)s - [%(trace_id)s] %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 logger = logging.getLogger("app")
@@ -22,7 +25,8 @@ logger = logging.getLogger("app")
 @router.post("/extract")
 async def extract_career_from_resume(
         file: UploadFile = File(...),
-        career_service: CareerServiceInterface = Depends(get_career_service)
+        career_service: CareerServiceInterface = Depends(get_career_service),
+        admission: AdmissionTicket = Depends(admit_career)
 ) -> Dict[str, Any]:
     """
     Upload a PDF resume file and extract career, activities, and certifications information.
@@ -37,7 +41,7 @@ async def extract_career_from_resume(
     try:
         # Extract career info from the PDF
         logger.info("Extracting career information from the PDF file...")
-        result = career_service.extract_career_from_pdf(file)
+        result = await career_service.extract_career_from_pdf(file, Deadline(REQUEST_DEADLINE_SECONDS - admission.waited))
 
         # 타입에 따라 다르게 처리
         logger.info("Parsing the extracted result...")
@@ -56,6 +60,12 @@ async def extract_career_from_resume(
             # 예상치 못한 타입인 경우
             return {"error": "Unexpected result type", "raw_result": str(result)}
 
+    except DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded while processing the file: {str(e)}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except CircuitOpenError as e:
+        logger.warning(f"AI service unavailable while processing the file: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(max(1, int(e.retry_after)))})
     except Exception as e:
         logger.error(f"Error processing the file: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing the file: {str(e)}")
@@ -63,7 +73,8 @@ async def extract_career_from_resume(
 @router.get("/experience/link/{link_url:path}")
 async def extract_career_from_url(
         link_url: str,
-        career_service: CareerServiceInterface = Depends(get_career_service)
+        career_service: CareerServiceInterface = Depends(get_career_service),
+        admission: AdmissionTicket = Depends(admit_career)
 ) -> Dict[str, Any]:
     """
     Extracts career information from a given Notion published resume link.
@@ -79,7 +90,7 @@ async def extract_career_from_url(
     try:
         # Extract career info from the URL - 비동기 호출로 변경
         logger.info("Extracting career information from the provided URL...{}".format(link_url))
-        result = await career_service.extract_career_from_url(link_url)
+        result = await career_service.extract_career_from_url(link_url, Deadline(REQUEST_DEADLINE_SECONDS - admission.waited))
 
         logger.info("Parsing the extracted result...")
         if isinstance(result, dict):
@@ -93,6 +104,12 @@ async def extract_career_from_url(
         else:
             return {"error": "Unexpected result type", "raw_result": str(result)}
 
+    except DeadlineExceeded as e:
+        logger.warning(f"Deadline exceeded while processing the URL: {str(e)}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except CircuitOpenError as e:
+        logger.warning(f"AI service unavailable while processing the URL: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(max(1, int(e.retry_after)))})
     except Exception as e:
         logger.error(f"Error processing the URL: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing the URL: {str(e)}")
\ No newline at end of file
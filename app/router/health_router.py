@@ -0,0 +1,26 @@
+import logging
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+router = APIRouter(tags=["health"])
+
+logger = logging.getLogger("app")
+
+@router.get("/healthz")
+async def healthz() -> Dict[str, Any]:
+    """프로세스가 살아 있고 이벤트 루프가 응답하는지 확인합니다. (liveness)"""
+    return {"status": "ok"}
+
+@router.get("/readyz")
+async def readyz(request: Request) -> JSONResponse:
+    """
+    트래픽을 받을 준비가 되었는지 확인합니다. (readiness)
+    예열이 끝나고 필수 의존성(MongoDB)이 준비되었으면 200, 아니면 503을 반환하며,
+    두 경우 모두 의존성별 상태와 예열 소요 시간을 함께 반환합니다.
+    """
+    warmup = request.app.state.warmup
+    if not warmup.ready:
+        await warmup.recheck()
+    return JSONResponse(warmup.status(), status_code=200 if warmup.ready else 503)
@@ -1,19 +1,39 @@
+import asyncio
+import io
 import logging
 import json
+import math
 import os
 import uuid
 import time
 import re
 import traceback
-from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Body
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Body, Query, Request, Response
 from fastapi.param_functions import Form as FormParam
-from app.schemas.report_schema import CareerInputSchema, ReportInput, Report
+from fastapi.responses import StreamingResponse
+from app.schemas.report_schema import CareerInputSchema, ReportInput
 from app.database import get_db, get_collection
-from app.util.pdf_extractor import PDFExtractor
-from motor.motor_asyncio import AsyncIOMotorDatabase
-import requests
-from app.util.web_extractor import WebExtractor
+from app.util.pdf_extractor import PDFExtractor, extract_text_shared, read_upload
+import orjson
+from app.dependencies.dependency import admit_report, get_url_extraction_service_dependency, get_shared_report_repository_dependency
+from app.repository.shared_report_repository import SharedReportRepository
+from app.services.url_extraction_service import UrlExtractionService
+from app.util.single_flight import get_single_flight, hash_key
+from app.util.admission import AdmissionTicket
+from app.util.concurrency_limiter import get_clova_limiter
+from app.util.completion_excute import CLOVA_HOST, CompletionExecutor
+from app.util.circuit_breaker import CircuitOpenError
+from app.util.deadline import Deadline, DeadlineExceeded, MIN_BUDGET_CLOVA, MIN_BUDGET_PDF, REQUEST_DEADLINE_SECONDS
+from app.util.quota_scheduler import PRIORITY_BATCH, PRIORITY_INTERACTIVE, use_priority
+from app.util.rate_limiter import charge_extra
+from app.util.report_serializer import build_projection, json_response, parse_fields, report_content_hash, serialize_report
+from app.util.report_snapshot import SNAPSHOT_CACHE_CONTROL, is_valid_share_id, get_snapshot_store
+from app.util.resume_normalizer import normalize_resume_text
+from app.util.tracing import span
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
 
 router = APIRouter(
     prefix="/report",
@@ -22,11 +42,15 @@ router = APIRouter(
 
 logging.basicConfig(
     level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format='%(asctime)s - %(name)s - %(levelname)s - [%(trace_id)s] %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 logger = logging.getLogger("app")
 
+# 배치 보고서 요청 한 번에 받을 수 있는 최대 항목 수와 동시에 처리할 항목 수
+REPORT_BATCH_MAX_ITEMS = int(os.getenv("REPORT_BATCH_MAX_ITEMS", "50"))
+REPORT_BATCH_CONCURRENCY = int(os.getenv("REPORT_BATCH_CONCURRENCY", "4"))
+
 async def optional_file_upload(
     file: Optional[UploadFile] = File(None)
 ) -> Optional[UploadFile]:
@@ -35,6 +59,9 @@ async def optional_file_upload(
         return file
     return None
 
+# skills 파일 경로 -> (수정 시각, 파싱 결과). 파일이 바뀌면 다시 읽는다. 결과는 읽기 전용으로만 사용한다.
+_skills_cache: Dict[str, tuple] = {}
+
 def load_job_skills(job: str, exp: str) -> Dict:
     """직무와 경력 정보에 맞는 skills json 파일을 로드합니다."""
     try:
@@ -47,9 +74,15 @@ def load_job_skills(job: str, exp: str) -> Dict:
                 status_code=404, 
                 detail=f"No skills data found for job: {job}, exp: {exp}"
             )
-            
+
+        mtime = os.path.getmtime(file_path)
+        cached = _skills_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         with open(file_path, 'r', encoding='utf-8') as f:
             skills_data = json.load(f)
+        _skills_cache[file_path] = (mtime, skills_data)
             
         return skills_data
     except Exception as e:
@@ -59,6 +92,16 @@ def load_job_skills(job: str, exp: str) -> Dict:
             detail=f"Error loading skills data: {str(e)}"
         )
 
+def preload_job_skills() -> int:
+    """jobs/ 아래 모든 직무의 skills 파일을 미리 읽어 캐시에 넣습니다. 읽은 파일 수를 반환합니다."""
+    loaded = 0
+    for job in sorted(os.listdir("jobs")):
+        for exp in ("new", "old"):
+            if os.path.exists(f"jobs/{job}/key_skills_{exp}.json"):
+                load_job_skills(job, exp)
+                loaded += 1
+    return loaded
+
 def extract_top_skills(skills_dict: Dict, top_n: int = 5) -> List[Dict]:
     """스킬 사전에서 상위 N개의 스킬을 추출합니다."""
     sorted_skills = sorted(skills_dict.items(), key=lambda x: x[1], reverse=True)
@@ -71,7 +114,7 @@ def extract_top_skills(skills_dict: Dict, top_n: int = 5) -> List[Dict]:
         
     return result
 
-def analyze_resume_with_ai(resume_text: str, trend_skills: List, trend_jd: List, job: str, career_data: Optional[Dict] = None) -> Dict:
+def analyze_resume_with_ai(resume_text: str, trend_skills: List, trend_jd: List, job: str, career_data: Optional[Dict] = None, timeout: float = 30) -> Dict:
     """AI를 사용하여 이력서를 분석합니다."""
     logger.debug("=== 이력서 AI 분석 시작 ===")
     logger.debug(f"분석할 이력서 길이: {len(resume_text)} 자")
@@ -249,12 +292,11 @@ def analyze_resume_with_ai(resume_text: str, trend_skills: List, trend_jd: List,
     try:
         logger.debug("Clova Studio API 호출 시작")
         
-        # API 요청 헤더
-        headers = {
-            "Authorization": f"Bearer {clova_key}",
-            "X-NCP-CLOVASTUDIO-REQUEST-ID": f"resume-analysis-{int(time.time())}",
-            "Content-Type": "application/json; charset=utf-8"
-        }
+        executor = CompletionExecutor(
+            host=CLOVA_HOST,
+            api_key=f"Bearer {clova_key}",
+            request_id=f"resume-analysis-{int(time.time())}"
+        )
         
         # API 요청 본문 구성
         request_data = {
@@ -271,29 +313,12 @@ def analyze_resume_with_ai(resume_text: str, trend_skills: List, trend_jd: List,
             'includeAiFilters': True
         }
         
-        # API 호출
-        url = "https://clovastudio.stream.ntruss.com/testapp/v1/chat-completions/HCX-003"
-        logger.debug(f"API 요청 URL: {url}")
-        
-        response = requests.post(
-            url,
-            headers=headers,
-            json=request_data,
-            timeout=30
-        )
-        
-        # 응답 확인 강화
-        if response.status_code != 200:
-            logger.error(f"Clova API 오류 응답: 상태 코드 {response.status_code}")
-            logger.error(f"응답 내용: {response.text}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"AI 서비스 응답 오류: {response.status_code}. 관리자에게 문의하세요."
-            )
+        # API 호출 (요청 기한에서 계산된 timeout 사용, 200이 아니면 HTTPError)
+        logger.debug(f"API 요청 모델: HCX-003, timeout {timeout:.1f}초")
+        response_json = executor.execute_json(request_data, model="HCX-003", timeout=timeout)
         
         # 응답 처리
         try:
-            response_json = response.json()
             logger.debug(f"API 응답 전체: {json.dumps(response_json, ensure_ascii=False)}")
             
             # 명확한 응답 구조 확인
@@ -322,7 +347,9 @@ def analyze_resume_with_ai(resume_text: str, trend_skills: List, trend_jd: List,
                 raise ValueError(f"API 응답의 JSON 형식이 잘못되었습니다: {str(e)}")
             
             # 결과 검증 - 에러를 발생시키지 않고 로그만 남김
-            is_valid = validate_ai_result(result)
+            with span("report.validate") as validate_span:
+                is_valid = validate_ai_result(result)
+                validate_span.set("valid", is_valid)
             if not is_valid:
                 logger.warning("AI 응답 검증 실패: 필수 필드가 누락되거나 형식이 올바르지 않습니다. 부분적으로 유효한 응답을 사용합니다.")
                 
@@ -450,8 +477,12 @@ def analyze_resume_with_ai(resume_text: str, trend_skills: List, trend_jd: List,
             raise
             
     except Exception as e:
-        logger.error(f"AI 분석 중 오류 발생: {str(e)}")
-        logger.error(f"오류 세부 정보: {traceback.format_exc()}")
+        if isinstance(e, CircuitOpenError):
+            # CLOVA 장애로 회로가 열려 있으면 기다리지 않고 바로 기본 데이터로 대체
+            logger.warning(f"AI 분석 생략: {str(e)}")
+        else:
+            logger.error(f"AI 분석 중 오류 발생: {str(e)}")
+            logger.error(f"오류 세부 정보: {traceback.format_exc()}")
         logger.debug("=== 이력서 AI 분석 실패, 더미 데이터 반환 ===")
         
         # 기본 더미 데이터 반환
@@ -640,6 +671,269 @@ def validate_ai_result(result: Dict) -> bool:
     
     return True
 
+async def _extract_pdf_text(file: UploadFile, deadline: Deadline) -> str:
+    pdf_extractor = PDFExtractor()
+    reading = asyncio.ensure_future(asyncio.to_thread(pdf_extractor.extract_text_from_pdf, file))
+    try:
+        async with span("resume.pdf", filename=file.filename) as pdf_span:
+            text = await deadline.run(asyncio.shield(reading), "pdf", min_required=MIN_BUDGET_PDF)
+            pdf_span.set("chars", len(text))
+        return text
+    finally:
+        # 스레드는 취소되지 않으므로, 취소나 기한 초과 뒤에도 호출한 쪽이 파일을 닫기 전에 읽기가 끝나기를 기다린다
+        if not reading.done():
+            await asyncio.wait([reading])
+
+async def extract_resume_text(
+    file: Optional[UploadFile],
+    resume_url: Optional[str],
+    url_extraction_service: UrlExtractionService,
+    deadline: Deadline,
+    coalesce: bool = True
+) -> str:
+    """
+    PDF 파일 또는 URL에서 이력서 텍스트를 추출합니다. 추출할 수 없으면 400 HTTPException이,
+    요청 기한 안에 끝나지 않으면 DeadlineExceeded가 발생합니다.
+    coalesce이면 업로드 내용을 한 번 읽어, 같은 내용(sha256)의 PDF를 동시에 추출하는 요청들이 하나의 추출 작업을 공유합니다.
+    """
+    # 파일 또는 URL이 제공되었는지 확인
+    has_file = file is not None
+    has_url = resume_url is not None and resume_url.strip() != ""
+
+    if not has_file and not has_url:
+        raise HTTPException(
+            status_code=400,
+            detail="이력서 파일 또는 URL이 제공되어야 합니다."
+        )
+
+    # 이력서 텍스트 추출
+    resume_text = ""
+    if has_file:
+        logger.info(f"파일에서 이력서 텍스트 추출: {file.filename}")
+        if coalesce:
+            data, digest = await asyncio.to_thread(read_upload, file)
+            resume_text = await deadline.run(
+                extract_text_shared(data, digest, file.filename), "pdf", min_required=MIN_BUDGET_PDF
+            )
+        else:
+            resume_text = await _extract_pdf_text(file, deadline)
+    elif has_url:
+        logger.info(f"URL에서 이력서 텍스트 추출: {resume_url}")
+        async with span("resume.url", url=resume_url) as url_span:
+            extraction = await url_extraction_service.extract(resume_url, deadline)
+            url_span.set("tier", extraction.tier)
+        resume_text = extraction.text
+        logger.info(f"이력서 URL 추출 단계: {extraction.tier} (품질 점수 {extraction.score})")
+
+    logger.debug(f"이력서에서 추출된 텍스트 길이: {len(resume_text)} 자")
+
+    # 반복 머리글/바닥글, 페이지 번호, 연락처 등을 지워 CLOVA 입력(앞 3,000자)에 실제 내용이 더 들어가게 한다
+    async with span("resume.normalize") as normalize_span:
+        normalized = await asyncio.to_thread(normalize_resume_text, resume_text)
+        normalize_span.set("chars_in", normalized.original_chars)
+        normalize_span.set("removed_chars", normalized.removed_chars)
+    resume_text = normalized.text
+
+    # 텍스트가 추출되었는지 확인
+    if not resume_text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="이력서에서 텍스트를 추출할 수 없습니다. 다른 형식의 이력서를 제공하거나 URL을 확인해주세요."
+        )
+    
+    return resume_text
+
+async def generate_report(user_data: Dict, resume_text: str, parsed_career_data: Optional[Dict], deadline: Deadline) -> str:
+    """
+    이력서 텍스트와 사용자 정보로 보고서를 생성해 MongoDB에 저장하고 보고서 ID를 반환합니다.
+    단건(POST /report)과 배치(POST /report/batch) 생성이 함께 사용합니다.
+    AI 분석 타임아웃은 남은 요청 기한으로 정하며, 시간이 부족하면 호출하지 않고 DeadlineExceeded가 발생합니다.
+    """
+    # 직무별 스킬 데이터 로드
+    if 'user' in user_data and isinstance(user_data['user'], dict):
+        # 중첩된 구조: {"user": {"job": "...", "exp": "..."}}
+        job = user_data['user'].get('job', '')
+        exp = user_data['user'].get('exp', 'new')
+        name = user_data['user'].get('name', '')
+    else:
+        # 평면 구조: {"job": "...", "exp": "..."}
+        job = user_data.get('job', '')
+        exp = user_data.get('exp', 'new')
+        name = user_data.get('name', '')
+
+    # job 값이 비어있으면 오류 반환
+    if not job:
+        raise HTTPException(
+            status_code=400,
+            detail="직무(job) 정보가 누락되었습니다. 유효한 직무 코드를 입력해주세요. (frontend, backend, ai-ml 등)"
+        )
+
+    logger.info(f"직무: {job}, 경력: {exp}")
+
+    with span("skills.load", job=job, exp=exp):
+        skills_data = load_job_skills(job, exp)
+    logger.debug(f"로드된 스킬 데이터: {json.dumps(skills_data, ensure_ascii=False)[:200]}...")
+
+    # 상위 소프트 스킬 추출
+    soft_skills = skills_data.get('소프트 스킬', {})
+    trend_jd = extract_top_skills(soft_skills)
+    logger.debug(f"추출된 트렌드 JD: {trend_jd}")
+
+    # 상위 소프트 스킬 이름만 추출 (trend_skill용)
+    trend_skill = [name for name, _ in sorted(soft_skills.items(), key=lambda x: x[1], reverse=True)[:5]]
+    logger.debug(f"추출된 트렌드 스킬(소프트 스킬): {trend_skill}")
+
+    # 상위 하드 스킬 추출 (AI 분석용)
+    hard_skills = skills_data.get('하드 스킬', {})
+    top_hard_skills = [name for name, _ in sorted(hard_skills.items(), key=lambda x: x[1], reverse=True)[:5]]
+    logger.debug(f"추출된 상위 하드 스킬: {top_hard_skills}")
+
+    # 모든 스킬 통합 (AI 분석용)
+    all_skills = top_hard_skills + trend_skill
+    logger.debug(f"모든 통합 스킬: {all_skills}")
+
+    # AI로 이력서 분석 - 통합 스킬 전달
+    # 같은 입력(=같은 프롬프트)의 동시 요청은 하나의 CLOVA 호출을 공유
+    # 단건/배치 요청 모두 CLOVA 동시 호출 상한을 공유
+    async def run_analysis() -> Dict:
+        async with get_clova_limiter().slot(deadline):
+            timeout = deadline.timeout("clova", cap=30, min_required=MIN_BUDGET_CLOVA)
+            return await asyncio.to_thread(analyze_resume_with_ai, resume_text, all_skills, trend_jd, job, parsed_career_data, timeout)
+
+    prompt_hash = hash_key("resume-analysis", resume_text, all_skills, trend_jd, job, parsed_career_data)
+    async with span("llm.analyze"):
+        ai_result = await deadline.run(get_single_flight("llm").do(prompt_hash, run_analysis), "llm")
+
+    # 결과 데이터 구성 - 수정된 구조로 변경
+    report_data = {
+        "user": {
+            "name": name,
+            "exp": exp,  
+            "job": job
+        },
+        "career_fitness": ai_result.get('career_fitness', 70),
+        "trend_jd": trend_jd,
+        "trend_skill": top_hard_skills,
+        "my_trend_skill": ai_result.get('my_trend_skill', []),
+        "personal_skill": ai_result.get('personal_skill', []),
+        "ai_summary": ai_result.get('ai_summary', ''),
+        "ai_review": ai_result.get('ai_review', '')
+    }
+
+    # 경력 데이터가 있으면 포함
+    if parsed_career_data:
+        report_data["career_data"] = parsed_career_data
+
+    logger.debug(f"최종 보고서 데이터: {json.dumps(report_data, ensure_ascii=False, indent=2)}")
+
+    # 결과 데이터에 필수 필드가 비어있는지 다시 한번 확인
+    if not report_data["my_trend_skill"] or not report_data["personal_skill"] or not report_data["ai_summary"] or not report_data["ai_review"]:
+        logger.warning("최종 보고서 데이터에 빈 필드가 있습니다. 자동 보정을 시도합니다.")
+
+        # 누락된 필드 자동 보정
+        if not report_data["my_trend_skill"]:
+            report_data["my_trend_skill"] = ["Java", "Spring Framework", "AWS", "MySQL"]
+            logger.info("누락된 my_trend_skill 필드를 기본값으로 대체했습니다.")
+
+        if not report_data["personal_skill"]:
+            report_data["personal_skill"] = [
+                {
+                    "skill": "문제 해결 능력",
+                    "description": "NHN 클라우드 서비스 개발 당시 서버 응답 시간이 2초 이상 지연되는 문제를 쿼리 최적화와 Redis 캐싱으로 해결하여 응답 시간 70% 감소 달성했습니다."
+                },
+                {
+                    "skill": "팀 협업 능력",
+                    "description": "카카오엔터프라이즈에서 프론트엔드팀, 백엔드팀과 협업하여 KakaoCloud Docs 프로젝트를 2개월 만에 성공적으로 완료하고 사용자 만족도 85%를 달성했습니다."
+                },
+                {
+                    "skill": "시스템 아키텍처 설계",
+                    "description": "네이버 쇼핑 플랫폼에서 MSA 기반 백엔드 시스템을 설계하여 트래픽 증가 시에도 안정적으로 서비스를 제공할 수 있는 인프라를 구축했습니다."
+                },
+                {
+                    "skill": "코드 최적화",
+                    "description": "라인 메신저 서비스에서 데이터 처리 로직의 성능 병목을 발견하고 알고리즘을 개선하여 처리 속도를 60% 향상시켰습니다."
+                }
+            ]
+            logger.info("누락된 personal_skill 필드를 기본값으로 대체했습니다.")
+
+        if not report_data["ai_summary"]:
+            report_data["ai_summary"] = "안정적인 서버 구축의 달인"
+            logger.info("누락된 ai_summary 필드를 기본값으로 대체했습니다.")
+
+        if not report_data["ai_review"]:
+            report_data["ai_review"] = f"{job} 개발에 필요한 핵심 기술을 보유하고 있습니다. 더 많은 실무 경험을 쌓으면 역량이 더욱 발전할 것입니다."
+            logger.info("누락된 ai_review 필드를 기본값으로 대체했습니다.")
+
+        logger.info("모든 필수 필드 보정 완료")
+
+    # 추가 검증: personal_skill 항목이 있더라도 각 항목의 description이 구체적인지 체크
+    # 구체적이지 않은 경우 더 구체적인 예시로 대체하지만 에러를 발생시키지 않음
+    substitute_skills = [
+        {
+            "skill": "문제 해결 능력",
+            "description": "NHN 클라우드 서비스 개발 당시 서버 응답 시간이 2초 이상 지연되는 문제를 쿼리 최적화와 Redis 캐싱으로 해결하여 응답 시간 70% 감소 달성했습니다."
+        },
+        {
+            "skill": "팀 협업 능력",
+            "description": "카카오엔터프라이즈에서 프론트엔드팀, 백엔드팀과 협업하여 KakaoCloud Docs 프로젝트를 2개월 만에 성공적으로 완료하고 사용자 만족도 85%를 달성했습니다."
+        },
+        {
+            "skill": "시스템 아키텍처 설계",
+            "description": "네이버 쇼핑 플랫폼에서 MSA 기반 백엔드 시스템을 설계하여 트래픽 증가 시에도 안정적으로 서비스를 제공할 수 있는 인프라를 구축했습니다."
+        },
+        {
+            "skill": "코드 최적화",
+            "description": "라인 메신저 서비스에서 데이터 처리 로직의 성능 병목을 발견하고 알고리즘을 개선하여 처리 속도를 60% 향상시켰습니다."
+        }
+    ]
+
+    for i, skill in enumerate(report_data["personal_skill"]):
+        if "description" in skill:
+            description = skill["description"]
+
+            # 간단한 검증 로직 (일반적인 표현 패턴 검사)
+            general_patterns = [
+                r"다양한 (\w+)에서",
+                r"여러 (\w+)(과|와|을|를|에서)",
+                r"(\w+) 경험$",  # 문장 끝에 '경험'으로 끝나는 패턴만 검사
+            ]
+
+            is_too_general = False
+            for pattern in general_patterns:
+                if re.search(pattern, description):
+                    is_too_general = True
+                    break
+
+            # 너무 일반적인 표현이면 대체
+            if is_too_general and i < len(substitute_skills):
+                logger.warning(f"일반적인 표현 패턴 감지됨, 대체합니다: {description}")
+
+                # 스킬 이름은 유지하고 설명만 대체
+                substitute_skill = substitute_skills[i].copy()
+                substitute_skill["skill"] = skill["skill"]
+                report_data["personal_skill"][i] = substitute_skill
+
+    # MongoDB에 저장
+    logger.info("MongoDB에 보고서 저장 시작")
+    reports_collection = get_collection("reports")
+    # 공유 시 원본 보고서를 찾기 위한 내용 해시 (공유 요청과 같이 ReportInput 기준으로 계산)
+    content_hash = report_content_hash(report_data)
+    if content_hash:
+        report_data["content_hash"] = content_hash
+    else:
+        logger.warning("보고서가 ReportInput 스키마와 맞지 않아 content_hash 없이 저장합니다")
+    async with span("mongo.insert_report"):
+        result = await reports_collection.insert_one(report_data)
+
+        # 저장 성공 확인
+        saved_report = await reports_collection.find_one({"_id": result.inserted_id})
+    if not saved_report:
+        logger.error("MongoDB에 보고서 저장 실패")
+        raise HTTPException(status_code=500, detail="Failed to save report")
+
+    logger.info(f"보고서가 성공적으로 저장되었습니다. ID: {result.inserted_id}")
+    return str(result.inserted_id)
+
 @router.post("")
 async def create_report(
     user_json: str = Form(
@@ -657,8 +951,10 @@ async def create_report(
         description="이력서가 호스팅된 공개 URL (파일이 제공되지 않은 경우 필수)",
         example="https://example.com/resume.html"
     ),
-    db: AsyncIOMotorDatabase = Depends(get_db),
+    db: "AsyncIOMotorDatabase" = Depends(get_db),
     file: Optional[UploadFile] = Depends(optional_file_upload),
+    url_extraction_service: UrlExtractionService = Depends(get_url_extraction_service_dependency),
+    admission: AdmissionTicket = Depends(admit_report),
 ) -> Dict:
     """
     사용자의 이력서와 정보를 받아 경력 분석 보고서를 생성합니다.
@@ -772,6 +1068,8 @@ async def create_report(
     }
     ```
     """
+    # nginx가 응답을 포기하기 전에 끝낼 수 있도록 요청 전체 기한을 정하고 모든 단계에 전달 (입장 대기 시간 제외)
+    deadline = Deadline(REQUEST_DEADLINE_SECONDS - admission.waited)
     try:
         # 사용자 정보 파싱
         user_data = json.loads(user_json)
@@ -787,207 +1085,17 @@ async def create_report(
                 logger.warning(f"Invalid career data format: {e}")
                 # 잘못된 JSON 형식이어도 계속 진행
         
-        # 파일 또는 URL이 제공되었는지 확인
-        has_file = file is not None
-        has_url = resume_url is not None and resume_url.strip() != ""
-        
-        if not has_file and not has_url:
-            raise HTTPException(
-                status_code=400,
-                detail="이력서 파일 또는 URL이 제공되어야 합니다."
-            )
-        
-        # 이력서 텍스트 추출
-        resume_text = ""
-        if has_file:
-            logger.info(f"파일에서 이력서 텍스트 추출: {file.filename}")
-            pdf_extractor = PDFExtractor()
-            resume_text = pdf_extractor.extract_text_from_pdf(file)
-        elif has_url:
-            logger.info(f"URL에서 이력서 텍스트 추출: {resume_url}")
-            web_extractor = WebExtractor()
-            resume_text = web_extractor.extract_text_from_url(resume_url)
-        
-        logger.debug(f"이력서에서 추출된 텍스트 길이: {len(resume_text)} 자")
-        
-        # 텍스트가 추출되었는지 확인
-        if not resume_text.strip():
-            raise HTTPException(
-                status_code=400,
-                detail="이력서에서 텍스트를 추출할 수 없습니다. 다른 형식의 이력서를 제공하거나 URL을 확인해주세요."
-            )
-        
-        # 직무별 스킬 데이터 로드
-        if 'user' in user_data and isinstance(user_data['user'], dict):
-            # 중첩된 구조: {"user": {"job": "...", "exp": "..."}}
-            job = user_data['user'].get('job', '')
-            exp = user_data['user'].get('exp', 'new')
-            name = user_data['user'].get('name', '')
-        else:
-            # 평면 구조: {"job": "...", "exp": "..."}
-            job = user_data.get('job', '')
-            exp = user_data.get('exp', 'new')
-            name = user_data.get('name', '')
-            
-        # job 값이 비어있으면 오류 반환
-        if not job:
-            raise HTTPException(
-                status_code=400,
-                detail="직무(job) 정보가 누락되었습니다. 유효한 직무 코드를 입력해주세요. (frontend, backend, ai-ml 등)"
-            )
-            
-        logger.info(f"직무: {job}, 경력: {exp}")
-        
-        skills_data = load_job_skills(job, exp)
-        logger.debug(f"로드된 스킬 데이터: {json.dumps(skills_data, ensure_ascii=False)[:200]}...")
-        
-        # 상위 소프트 스킬 추출
-        soft_skills = skills_data.get('소프트 스킬', {})
-        trend_jd = extract_top_skills(soft_skills)
-        logger.debug(f"추출된 트렌드 JD: {trend_jd}")
-        
-        # 상위 소프트 스킬 이름만 추출 (trend_skill용)
-        trend_skill = [name for name, _ in sorted(soft_skills.items(), key=lambda x: x[1], reverse=True)[:5]]
-        logger.debug(f"추출된 트렌드 스킬(소프트 스킬): {trend_skill}")
-        
-        # 상위 하드 스킬 추출 (AI 분석용)
-        hard_skills = skills_data.get('하드 스킬', {})
-        top_hard_skills = [name for name, _ in sorted(hard_skills.items(), key=lambda x: x[1], reverse=True)[:5]]
-        logger.debug(f"추출된 상위 하드 스킬: {top_hard_skills}")
-        
-        # 모든 스킬 통합 (AI 분석용)
-        all_skills = top_hard_skills + trend_skill
-        logger.debug(f"모든 통합 스킬: {all_skills}")
-        
-        # AI로 이력서 분석 - 통합 스킬 전달
-        ai_result = analyze_resume_with_ai(resume_text, all_skills, trend_jd, job, parsed_career_data)
-        
-        # 결과 데이터 구성 - 수정된 구조로 변경
-        report_data = {
-            "user": {
-                "name": name,
-                "exp": exp,  
-                "job": job
-            },
-            "career_fitness": ai_result.get('career_fitness', 70),
-            "trend_jd": trend_jd,
-            "trend_skill": top_hard_skills,
-            "my_trend_skill": ai_result.get('my_trend_skill', []),
-            "personal_skill": ai_result.get('personal_skill', []),
-            "ai_summary": ai_result.get('ai_summary', ''),
-            "ai_review": ai_result.get('ai_review', '')
-        }
-        
-        # 경력 데이터가 있으면 포함
-        if parsed_career_data:
-            report_data["career_data"] = parsed_career_data
-            
-        logger.debug(f"최종 보고서 데이터: {json.dumps(report_data, ensure_ascii=False, indent=2)}")
-        
-        # 결과 데이터에 필수 필드가 비어있는지 다시 한번 확인
-        if not report_data["my_trend_skill"] or not report_data["personal_skill"] or not report_data["ai_summary"] or not report_data["ai_review"]:
-            logger.warning("최종 보고서 데이터에 빈 필드가 있습니다. 자동 보정을 시도합니다.")
-            
-            # 누락된 필드 자동 보정
-            if not report_data["my_trend_skill"]:
-                report_data["my_trend_skill"] = ["Java", "Spring Framework", "AWS", "MySQL"]
-                logger.info("누락된 my_trend_skill 필드를 기본값으로 대체했습니다.")
-                
-            if not report_data["personal_skill"]:
-                report_data["personal_skill"] = [
-                    {
-                        "skill": "문제 해결 능력",
-                        "description": "NHN 클라우드 서비스 개발 당시 서버 응답 시간이 2초 이상 지연되는 문제를 쿼리 최적화와 Redis 캐싱으로 해결하여 응답 시간 70% 감소 달성했습니다."
-                    },
-                    {
-                        "skill": "팀 협업 능력",
-                        "description": "카카오엔터프라이즈에서 프론트엔드팀, 백엔드팀과 협업하여 KakaoCloud Docs 프로젝트를 2개월 만에 성공적으로 완료하고 사용자 만족도 85%를 달성했습니다."
-                    },
-                    {
-                        "skill": "시스템 아키텍처 설계",
-                        "description": "네이버 쇼핑 플랫폼에서 MSA 기반 백엔드 시스템을 설계하여 트래픽 증가 시에도 안정적으로 서비스를 제공할 수 있는 인프라를 구축했습니다."
-                    },
-                    {
-                        "skill": "코드 최적화",
-                        "description": "라인 메신저 서비스에서 데이터 처리 로직의 성능 병목을 발견하고 알고리즘을 개선하여 처리 속도를 60% 향상시켰습니다."
-                    }
-                ]
-                logger.info("누락된 personal_skill 필드를 기본값으로 대체했습니다.")
-                
-            if not report_data["ai_summary"]:
-                report_data["ai_summary"] = "안정적인 서버 구축의 달인"
-                logger.info("누락된 ai_summary 필드를 기본값으로 대체했습니다.")
-                
-            if not report_data["ai_review"]:
-                report_data["ai_review"] = f"{job} 개발에 필요한 핵심 기술을 보유하고 있습니다. 더 많은 실무 경험을 쌓으면 역량이 더욱 발전할 것입니다."
-                logger.info("누락된 ai_review 필드를 기본값으로 대체했습니다.")
-            
-            logger.info("모든 필수 필드 보정 완료")
-        
-        # 추가 검증: personal_skill 항목이 있더라도 각 항목의 description이 구체적인지 체크
-        # 구체적이지 않은 경우 더 구체적인 예시로 대체하지만 에러를 발생시키지 않음
-        substitute_skills = [
-            {
-                "skill": "문제 해결 능력",
-                "description": "NHN 클라우드 서비스 개발 당시 서버 응답 시간이 2초 이상 지연되는 문제를 쿼리 최적화와 Redis 캐싱으로 해결하여 응답 시간 70% 감소 달성했습니다."
-            },
-            {
-                "skill": "팀 협업 능력",
-                "description": "카카오엔터프라이즈에서 프론트엔드팀, 백엔드팀과 협업하여 KakaoCloud Docs 프로젝트를 2개월 만에 성공적으로 완료하고 사용자 만족도 85%를 달성했습니다."
-            },
-            {
-                "skill": "시스템 아키텍처 설계",
-                "description": "네이버 쇼핑 플랫폼에서 MSA 기반 백엔드 시스템을 설계하여 트래픽 증가 시에도 안정적으로 서비스를 제공할 수 있는 인프라를 구축했습니다."
-            },
-            {
-                "skill": "코드 최적화",
-                "description": "라인 메신저 서비스에서 데이터 처리 로직의 성능 병목을 발견하고 알고리즘을 개선하여 처리 속도를 60% 향상시켰습니다."
-            }
-        ]
-        
-        for i, skill in enumerate(report_data["personal_skill"]):
-            if "description" in skill:
-                description = skill["description"]
-                
-                # 간단한 검증 로직 (일반적인 표현 패턴 검사)
-                general_patterns = [
-                    r"다양한 (\w+)에서",
-                    r"여러 (\w+)(과|와|을|를|에서)",
-                    r"(\w+) 경험$",  # 문장 끝에 '경험'으로 끝나는 패턴만 검사
-                ]
-                
-                is_too_general = False
-                for pattern in general_patterns:
-                    if re.search(pattern, description):
-                        is_too_general = True
-                        break
-                
-                # 너무 일반적인 표현이면 대체
-                if is_too_general and i < len(substitute_skills):
-                    logger.warning(f"일반적인 표현 패턴 감지됨, 대체합니다: {description}")
-                    
-                    # 스킬 이름은 유지하고 설명만 대체
-                    substitute_skill = substitute_skills[i].copy()
-                    substitute_skill["skill"] = skill["skill"]
-                    report_data["personal_skill"][i] = substitute_skill
-        
-        # MongoDB에 저장
-        logger.info("MongoDB에 보고서 저장 시작")
-        reports_collection = get_collection("reports")
-        result = await reports_collection.insert_one(report_data)
-        
-        # 저장 성공 확인
-        saved_report = await reports_collection.find_one({"_id": result.inserted_id})
-        if not saved_report:
-            logger.error("MongoDB에 보고서 저장 실패")
-            raise HTTPException(status_code=500, detail="Failed to save report")
-        
-        logger.info(f"보고서가 성공적으로 저장되었습니다. ID: {result.inserted_id}")
-        return {"id": str(result.inserted_id)}
+        resume_text = await extract_resume_text(file, resume_url, url_extraction_service, deadline)
+        with use_priority(PRIORITY_INTERACTIVE):
+            report_id = await generate_report(user_data, resume_text, parsed_career_data, deadline)
+        return json_response({"id": report_id})
         
     except HTTPException as he:
         # 이미 생성된 HTTPException은 그대로 다시 발생
         raise
+    except DeadlineExceeded as e:
+        logger.warning(f"보고서 생성 기한 초과: {str(e)}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Error creating report: {str(e)}")
         logger.error(traceback.format_exc())
@@ -996,30 +1104,171 @@ async def create_report(
             detail=f"Error creating report: {str(e)}"
         )
 
-@router.get("/{report_id}", response_model=Report)
-async def get_report(report_id: str, db: AsyncIOMotorDatabase = Depends(get_db)):
+def _detach_upload(upload: UploadFile) -> UploadFile:
+    """
+    스트리밍 응답이 끝날 때까지 업로드 파일을 쓸 수 있도록 분리합니다.
+    FastAPI는 핸들러가 응답을 반환하면 폼 파일을 닫으므로, 원본 파일 객체는 새 UploadFile로 옮기고
+    폼에는 빈 버퍼를 남깁니다. 분리한 파일은 호출한 쪽에서 닫아야 합니다.
+    """
+    detached = UploadFile(file=upload.file, size=upload.size, filename=upload.filename, headers=upload.headers)
+    upload.file = io.BytesIO()
+    return detached
+
+async def _generate_batch_item(
+    index: int,
+    item: Dict,
+    file: Optional[UploadFile],
+    url_extraction_service: UrlExtractionService,
+    slots: asyncio.Semaphore
+) -> Dict:
+    """배치 항목 하나를 처리하고 NDJSON 한 줄로 보낼 결과를 반환합니다. 실패해도 예외를 올리지 않습니다."""
+    result = {"index": index, "name": item.get("name", "")}
+    try:
+        async with slots:
+            # 항목별 기한은 대기열을 빠져나와 처리를 시작할 때부터 계산
+            deadline = Deadline(REQUEST_DEADLINE_SECONDS)
+            # 배치 업로드는 스트림이 끝나면 닫히므로, 다른 요청과 공유되어 그 뒤에도 도는 추출 작업을 만들지 않는다
+            resume_text = await extract_resume_text(
+                file, item.get("resume_url"), url_extraction_service, deadline, coalesce=False
+            )
+            career_data = item.get("career_data") if isinstance(item.get("career_data"), dict) else None
+            with use_priority(PRIORITY_BATCH):
+                result["id"] = await generate_report(item, resume_text, career_data, deadline)
+    except HTTPException as he:
+        result.update({"status": he.status_code, "error": he.detail})
+    except DeadlineExceeded as e:
+        result.update({"status": 504, "error": str(e)})
+    except Exception as e:
+        logger.error(f"배치 보고서 생성 실패 (index={index}): {str(e)}")
+        logger.error(traceback.format_exc())
+        result.update({"status": 500, "error": f"Error creating report: {str(e)}"})
+    return result
+
+@router.post("/batch")
+async def create_report_batch(
+    request: Request,
+    users_json: str = Form(
+        ...,
+        description="사용자 정보 JSON 배열. 각 항목은 name, exp, job과 선택 항목 resume_url, career_data, file_index를 가집니다.",
+        example='[{"name": "홍길동", "exp": "new", "job": "backend"}, {"name": "김철수", "exp": "old", "job": "frontend", "resume_url": "https://example.com/resume.html"}]'
+    ),
+    files: List[UploadFile] = File(default=[], description="이력서 PDF 파일 목록"),
+    url_extraction_service: UrlExtractionService = Depends(get_url_extraction_service_dependency),
+) -> StreamingResponse:
+    """
+    여러 이력서의 보고서를 한 번에 생성하고, 완료되는 순서대로 결과를 NDJSON으로 스트리밍합니다.
+    
+    - **users_json**: 사용자 정보 JSON 배열 (최대 REPORT_BATCH_MAX_ITEMS개)
+      - resume_url이 있으면 URL에서, 없으면 file_index(기본값: 배열 순서)번째 파일에서 이력서를 추출합니다.
+    - **files**: 이력서 PDF 파일 목록
+    
+    응답 예시 (한 줄에 하나씩, 완료 순서):
+    ```
+    {"index": 1, "name": "김철수", "id": "67cbf25d213453b3b0966168"}
+    {"index": 0, "name": "홍길동", "status": 400, "error": "이력서에서 텍스트를 추출할 수 없습니다. ..."}
+    ```
+    
+    항목은 REPORT_BATCH_CONCURRENCY개씩 동시에 처리되며, CLOVA 호출은 단건 요청과 같은 동시 호출 상한을 공유합니다.
+    """
+    try:
+        items = json.loads(users_json)
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"users_json 형식이 올바르지 않습니다: {e}")
+    
+    if not isinstance(items, list) or not items or not all(isinstance(item, dict) for item in items):
+        raise HTTPException(status_code=400, detail="users_json은 사용자 정보 객체의 배열이어야 합니다.")
+    if len(items) > REPORT_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {REPORT_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.")
+    
+    # 요청 제한 미들웨어는 항목 하나 값만 받았으므로 나머지 항목의 비용을 받는다
+    decision = charge_extra(request.scope, "report_batch", len(items) - 1)
+    if decision is not None and not decision.allowed:
+        retry_after = max(1, math.ceil(decision.retry_after))
+        raise HTTPException(
+            status_code=429,
+            detail=f"요청이 너무 많습니다. {retry_after}초 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(retry_after)},
+        )
+    
+    # 항목별 이력서 파일 매칭
+    uploads = [_detach_upload(upload) for upload in files if upload and upload.filename]
+    item_files: List[Optional[UploadFile]] = []
+    used_file_indexes = set()
+    for index, item in enumerate(items):
+        if item.get("resume_url"):
+            item_files.append(None)
+            continue
+        file_index = item.get("file_index", index)
+        if not (isinstance(file_index, int) and 0 <= file_index < len(uploads)):
+            item_files.append(None)
+            continue
+        # 한 UploadFile을 두 스레드가 동시에 읽지 않도록 파일 하나는 항목 하나만 쓴다
+        if file_index in used_file_indexes:
+            for upload in uploads:
+                await upload.close()
+            raise HTTPException(status_code=400, detail=f"file_index {file_index}번 파일을 여러 항목이 함께 쓸 수 없습니다.")
+        used_file_indexes.add(file_index)
+        item_files.append(uploads[file_index])
+    
+    logger.info(f"배치 보고서 생성 시작: {len(items)}건 (파일 {len(uploads)}개)")
+    
+    async def stream_results():
+        slots = asyncio.Semaphore(REPORT_BATCH_CONCURRENCY)
+        tasks = [
+            asyncio.ensure_future(_generate_batch_item(index, item, item_files[index], url_extraction_service, slots))
+            for index, item in enumerate(items)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                yield orjson.dumps(result) + b"\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 작업을 취소하고, 작업이 파일 읽기를 마친 뒤에 파일을 닫는다
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for upload in uploads:
+                await upload.close()
+            logger.info(f"배치 보고서 생성 종료: {len(items)}건")
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+@router.get("/{report_id}")
+async def get_report(
+    report_id: str,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표로 구분, 예: user,ai_summary)"),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+) -> Response:
     """
     UUID를 사용하여 특정 보고서를 조회합니다.
     
     Parameters:
     - report_id: 보고서의 고유 ID
+    - fields: 일부 필드만 조회할 때 사용 (MongoDB projection으로 변환, id는 항상 포함)
     
     Returns:
     - 보고서 데이터 (JSON)
+
+    저장된 문서를 Report 필드로만 추려 그대로 직렬화하며, 필드 타입은 검사하지 않습니다.
     """
     try:
         from bson.objectid import ObjectId
         
+        try:
+            projection = build_projection(parse_fields(fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
         # MongoDB에서 report_id로 문서 조회
         reports_collection = get_collection("reports")
         
         try:
             # MongoDB ObjectId로 변환 시도
             object_id = ObjectId(report_id)
-            report = await reports_collection.find_one({"_id": object_id})
+            report = await reports_collection.find_one({"_id": object_id}, projection)
         except Exception:
             # ObjectId 변환 실패 시 일반 문자열 ID로 조회 시도
-            report = await reports_collection.find_one({"id": report_id})
+            report = await reports_collection.find_one({"id": report_id}, projection)
         
         if not report:
             raise HTTPException(
@@ -1027,12 +1276,8 @@ async def get_report(report_id: str, db: AsyncIOMotorDatabase = Depends(get_db))
                 detail=f"보고서를 찾을 수 없습니다. ID: {report_id}"
             )
         
-        # MongoDB의 _id를 문자열 id로 변환
-        if "_id" in report:
-            report["id"] = str(report["_id"])
-            del report["_id"]
-        
-        return report
+        # _id를 문자열 id로 바꾸고 스키마 필드만 orjson으로 직렬화
+        return Response(content=serialize_report(report), media_type="application/json")
         
     except HTTPException:
         # 이미 생성된 HTTPException은 그대로 다시 발생
@@ -1046,22 +1291,19 @@ async def get_report(report_id: str, db: AsyncIOMotorDatabase = Depends(get_db))
 
 @router.post("/share")
 async def share_report(
-    report_input: ReportInput
-) -> Dict:
+    report_input: ReportInput,
+    shared_reports: SharedReportRepository = Depends(get_shared_report_repository_dependency)
+) -> Response:
     try:
-        # 공유 링크 생성 로직 (간단하게 새 ID 생성으로 구현)
-        report_id = str(uuid.uuid4())
-        reports_collection = get_collection("shared_reports")
-        
-        # 공유용 리포트 저장
-        report_data = report_input.dict()
-        report_data["id"] = report_id
+        # 같은 내용은 기존 공유 링크를 재사용하고, 원본 보고서는 복사하지 않고 참조
+        share_id = await shared_reports.share(report_input.model_dump())
         
-        await reports_collection.insert_one(report_data)
+        # nginx가 바로 서빙할 수 있도록 불변 JSON 스냅샷을 미리 생성
+        await _ensure_snapshot(share_id, shared_reports)
         
         # 공유 URL 반환
-        share_url = f"/shared/report/{report_id}"
-        return {"share_url": share_url}
+        share_url = f"/shared/report/{share_id}"
+        return json_response({"share_url": share_url})
         
     except Exception as e:
         logger.error(f"Error sharing report: {str(e)}")
@@ -1070,8 +1312,67 @@ async def share_report(
             detail=f"Error sharing report: {str(e)}"
         )
 
+async def _ensure_snapshot(share_id: str, shared_reports: SharedReportRepository) -> bool:
+    """공유 보고서 스냅샷이 없으면 만들고, 공유 보고서가 존재하는지 반환합니다."""
+    snapshot_store = get_snapshot_store()
+    if await asyncio.to_thread(snapshot_store.exists, share_id):
+        return True
+    
+    report = await shared_reports.resolve(share_id)
+    if not report:
+        return False
+    
+    try:
+        await asyncio.to_thread(snapshot_store.write, share_id, serialize_report(report))
+    except OSError as e:
+        # 스냅샷은 캐시이므로 저장에 실패해도 공유/조회는 계속 진행
+        logger.warning(f"공유 보고서 스냅샷 저장 실패: {str(e)}")
+        return True
+    return True
+
+@router.get("/shared/{share_id}")
+async def get_shared_report(
+    share_id: str,
+    request: Request,
+    shared_reports: SharedReportRepository = Depends(get_shared_report_repository_dependency)
+) -> Response:
+    """
+    공유 링크 ID로 보고서를 조회합니다. 중복 정리 전에 발급된 공유 ID도 조회됩니다.
+    운영 환경에서는 nginx가 스냅샷 파일을 직접 서빙하고, 이 경로는 스냅샷이 없을 때만 사용됩니다.
+    스냅샷은 Report 필드로만 추린 문서를 그대로 직렬화한 것이며, 필드 타입은 검사하지 않습니다.
+    """
+    try:
+        found = is_valid_share_id(share_id) and await _ensure_snapshot(share_id, shared_reports)
+        if not found:
+            raise HTTPException(
+                status_code=404,
+                detail=f"공유된 보고서를 찾을 수 없습니다. ID: {share_id}"
+            )
+        
+        snapshot = await asyncio.to_thread(
+            get_snapshot_store().read, share_id, request.headers.get("accept-encoding", "")
+        )
+        if snapshot is None:
+            # 스냅샷 저장에 실패한 경우 직접 직렬화
+            report = await shared_reports.resolve(share_id)
+            return Response(content=serialize_report(report), media_type="application/json")
+        
+        body, encoding = snapshot
+        headers = {"Cache-Control": SNAPSHOT_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"공유 보고서 조회 중 오류 발생: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"공유 보고서 조회 중 서버 오류가 발생했습니다: {str(e)}"
+        )
+
 @router.get("/raw/{report_id}")
-async def get_raw_report(report_id: str, db: AsyncIOMotorDatabase = Depends(get_db)):
+async def get_raw_report(report_id: str, db: "AsyncIOMotorDatabase" = Depends(get_db)):
     """임시 디버깅용: 보고서 원본 데이터 조회"""
     from bson.objectid import ObjectId
     
@@ -1,11 +1,17 @@
 import logging
-from typing import Protocol, Dict, Any, Union
+from typing import Protocol, Dict, Any, Optional, Union
 
 from fastapi import UploadFile
 
-from app.util.pdf_extractor import PDFExtractor
-from app.util.completion_excute import ResumeExtract
-from playwright.async_api import async_playwright
+from app.util.pdf_extractor import PDFExtractor, extract_text_shared, read_upload
+from app.util.completion_excute import CLOVA_HOST, DEFAULT_TIMEOUT, ResumeExtract
+from app.util.single_flight import get_single_flight, hash_key
+from app.util.concurrency_limiter import get_clova_limiter
+from app.util.quota_scheduler import PRIORITY_CAREER, use_priority
+from app.util.deadline import Deadline, MIN_BUDGET_CLOVA, MIN_BUDGET_PDF
+from app.util.resume_normalizer import normalize_resume_text
+from app.util.tracing import span
+from app.services.url_extraction_service import UrlExtractionService, get_url_extraction_service
 import asyncio
 
 logger = logging.getLogger("app")
@@ -18,20 +24,21 @@ class CareerServiceInterface(Protocol):
 
     def extract_str_from_url(self, link_url: str) -> str:
         pass
-    def extract_career_from_pdf(self, file: UploadFile) -> Dict[str, Any]:
+    async def extract_career_from_pdf(self, file: UploadFile, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """PDF에서 경력 정보를 추출합니다."""
         pass
 
-    async def extract_career_from_url(self, link_url: str) -> Dict[str, Any]:
+    async def extract_career_from_url(self, link_url: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """URL에서 경력 정보를 추출합니다."""
         pass
 
 
 class CareerService:
-    def __init__(self):
+    def __init__(self, url_extraction_service: Optional[UrlExtractionService] = None):
         self.pdf_extractor = PDFExtractor()
+        self.url_extraction_service = url_extraction_service or get_url_extraction_service()
         self.resume_extractor = ResumeExtract(
-            host='https://clovastudio.stream.ntruss.com',
+            host=CLOVA_HOST,
             request_id='89dab0b98f924b67afbb3110e7835477'
         )
     def extract_str_from_pdf(self, file: UploadFile) -> str:
@@ -40,8 +47,11 @@ class CareerService:
     def extract_str_from_url(self, link_url: str) -> str:
         return asyncio.run(self.async_crawler(link_url))
 
-    def extract_career_from_pdf(self, file: UploadFile) -> Dict[str, Any]:
-        text = self.pdf_extractor.extract_text_from_pdf(file)
+    async def extract_career_from_pdf(self, file: UploadFile, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        deadline = deadline or Deadline()
+        # 같은 파일(내용 해시)의 동시 요청은 하나의 텍스트 추출 작업을 공유하고, 각자의 기한은 자신의 대기에만 적용한다
+        data, digest = await asyncio.to_thread(read_upload, file)
+        text = await deadline.run(extract_text_shared(data, digest, file.filename), "pdf", min_required=MIN_BUDGET_PDF)
 
         if not text.strip():
             logger.warning("PDF에서 추출된 텍스트가 없습니다.")
@@ -51,10 +61,35 @@ class CareerService:
                 "certifications": []
             }
 
-        return self.resume_extractor.extract(text)
-
-    async def extract_career_from_url(self, url: str) -> Dict[str, Any]:
-        text = await self.async_crawler(url)
+        return await self._extract_resume(text, deadline)
+
+    async def _extract_resume(self, text: str, deadline: Deadline) -> Dict[str, Any]:
+        # CLOVA 입력 토큰을 줄이도록 반복 머리글/바닥글, 페이지 번호, 연락처 등을 먼저 지운다
+        async with span("resume.normalize") as normalize_span:
+            normalized = await asyncio.to_thread(normalize_resume_text, text)
+            normalize_span.set("chars_in", normalized.original_chars)
+            normalize_span.set("removed_chars", normalized.removed_chars)
+        text = normalized.text
+
+        # 같은 프롬프트의 동시 CLOVA 호출은 하나로 합친다
+        prompt_hash = hash_key(self.resume_extractor.system_prompt, text)
+        extraction = get_single_flight("llm").do(prompt_hash, lambda: self._run_resume_extract(text, deadline))
+        async with span("llm.resume_extract"):
+            return await deadline.run(extraction, "llm")
+
+    async def _run_resume_extract(self, text: str, deadline: Deadline) -> Dict[str, Any]:
+        # 보고서 생성과 같은 CLOVA 동시 호출 상한을 공유하고, 남은 시간으로 호출 타임아웃을 정한다
+        async with get_clova_limiter().slot(deadline):
+            timeout = deadline.timeout("clova", cap=DEFAULT_TIMEOUT, min_required=MIN_BUDGET_CLOVA)
+            with use_priority(PRIORITY_CAREER):
+                return await asyncio.to_thread(self.resume_extractor.extract, text, timeout)
+
+    async def extract_career_from_url(self, url: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        deadline = deadline or Deadline()
+        async with span("resume.url", url=url) as url_span:
+            result = await self.url_extraction_service.extract(url, deadline)
+            url_span.set("tier", result.tier)
+        text = result.text
         if not text or not text.strip():
             logger.warning(f"URL에서 추출된 텍스트가 없습니다: {url}")
             return {
@@ -62,135 +97,7 @@ class CareerService:
                 "activities": [],
                 "certifications": []
             }
-        return self.resume_extractor.extract(text)
+        return await self._extract_resume(text, deadline)
 
     async def async_crawler(self, url: str) -> Union[str, None]:
-        logger.info(f"URL 접근 중: {url}")
-
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--disable-gpu',
-                        '--disable-dev-shm-usage',
-                        '--disable-setuid-sandbox',
-                        '--no-sandbox',
-                    ]
-                )
-
-                context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
-                    viewport={"width": 1280, "height": 800},
-                    device_scale_factor=1,
-                )
-
-                context.set_default_timeout(60000)
-                page = await context.new_page()
-
-                try:
-                    if "notion.site" in url:
-                        logger.debug("Notion 페이지 접근 중...")
-                        await page.goto(url, wait_until="load", timeout=45000)
-                        await page.wait_for_timeout(5000)
-
-                        try:
-                            await page.wait_for_selector("div.notion-page-content", timeout=10000)
-                        except Exception:
-                            pass
-                    else:
-                        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-                    await self._scroll_page(page)
-                    text = await self._extract_text_with_fallbacks(page)
-
-                    if text and len(text.strip()) > 0:
-                        logger.info(f"텍스트 추출 성공: {len(text)} 글자")
-                        return text.strip()
-                    else:
-                        raise ValueError("텍스트 추출 실패")
-
-                except Exception as e:
-                    logger.error(f"페이지 접근 중 오류 발생: {str(e)}")
-                    return None
-
-                finally:
-                    await browser.close()
-
-        except Exception as e:
-            logger.error(f"Playwright 실행 중 오류 발생: {str(e)}")
-            return None
-
-    async def _scroll_page(self, page):
-        try:
-            page_height = await page.evaluate("document.body.scrollHeight")
-            view_height = await page.evaluate("window.innerHeight")
-
-            if page_height > view_height:
-                for i in range(0, page_height, view_height):
-                    await page.evaluate(f"window.scrollTo(0, {i})")
-                    await page.wait_for_timeout(300)
-
-                await page.evaluate("window.scrollTo(0, 0)")
-                await page.wait_for_timeout(500)
-
-        except Exception as e:
-            logger.debug(f"스크롤 중 오류: {str(e)}")
-
-    async def _extract_text_with_fallbacks(self, page):
-        # 방법 1: body.innerText
-        try:
-            text = await page.evaluate("document.body.innerText")
-            if text and len(text.strip()) > 0:
-                return text
-        except Exception:
-            pass
-
-        # 방법 2: 모든 텍스트 노드 추출
-        try:
-            text = await page.evaluate("""
-            Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, p, li, td, th, span, div, a'))
-                .map(el => el.textContent)
-                .filter(text => text.trim().length > 0)
-                .join('\\n')
-            """)
-            if text and len(text.strip()) > 0:
-                return text
-        except Exception:
-            pass
-
-        # 방법 3: Notion 특화 선택자
-        if "notion.site" in page.url:
-            try:
-                text = await page.evaluate("""
-                Array.from(document.querySelectorAll('.notion-page-content *'))
-                    .map(el => el.textContent)
-                    .filter(text => text.trim().length > 0)
-                    .join('\\n')
-                """)
-                if text and len(text.strip()) > 0:
-                    return text
-            except Exception:
-                pass
-
-        # 방법 4: HTML 내용으로부터 텍스트 추출
-        try:
-            import re
-            from bs4 import BeautifulSoup
-
-            html = await page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-            text = soup.get_text()
-            text = text.strip()
-
-            # 중복된 공백 제거
-            text = re.sub(r'\s+', ' ', text)
-            # 중복된 빈 줄 제거
-            text = re.sub(r'\n\s*\n', '\n\n', text)
-
-            if text and len(text.strip()) > 0:
-                return text
-        except Exception:
-            pass
-
-        return ""
\ No newline at end of file
+        return await self.url_extraction_service.browser_crawler.crawl(url)
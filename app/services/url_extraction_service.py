@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.util.browser_crawler import BrowserCrawler
+from app.util.deadline import Deadline, MIN_BUDGET_BROWSER, MIN_BUDGET_STATIC
+from app.util.notion_extractor import NotionExtractor, is_notion_url
+from app.util.single_flight import get_single_flight
+from app.util.tracing import span
+from app.util.web_extractor import WebExtractor
+
+logger = logging.getLogger("app")
+
+# 이 점수 미만이면 다음(더 비싼) 단계로 넘어간다
+QUALITY_THRESHOLD = float(os.getenv("URL_EXTRACTION_QUALITY_THRESHOLD", "0.5"))
+
+# 이 길이 이상이면 길이 점수 만점
+GOOD_TEXT_LENGTH = 800
+
+# 단계별 최대 타임아웃(초)과 시작에 필요한 최소 남은 시간(초)
+TIER_TIMEOUTS = {"notion_api": 10.0, "static": 10.0, "browser": 60.0}
+TIER_MIN_BUDGETS = {"notion_api": MIN_BUDGET_STATIC, "static": MIN_BUDGET_STATIC, "browser": MIN_BUDGET_BROWSER}
+
+# 자바스크립트 렌더링 전 셸 페이지에서 보이는 문구 (있으면 점수 0)
+PLACEHOLDER_MARKERS = (
+    "JavaScript must be enabled",
+    "You need to enable JavaScript",
+    "Enable JavaScript",
+    "Please enable JavaScript",
+    "JavaScript를 활성화",
+    "Notion – The all-in-one workspace",
+    "Notion – The AI workspace",
+    "Loading...",
+)
+
+# 본문이 아닌 상용구 줄 패턴
+BOILERPLATE_RE = re.compile(
+    r"(cookie|쿠키|all rights reserved|©|copyright|로그인|회원가입|sign in|sign up|log in|"
+    r"privacy policy|개인정보처리방침|이용약관|terms of (service|use)|skip to content|try notion|"
+    r"subscribe|구독하기)",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class ExtractionResult:
+    text: str
+    tier: str
+    score: float
+    elapsed: float
+
+
+def score_text_quality(text: Optional[str]) -> float:
+    """
+    추출된 텍스트 품질을 0~1 점수로 계산합니다.
+    길이 점수 × (1 - 상용구 줄 비율)이며, 렌더링 전 셸 문구가 있으면 0입니다.
+    """
+    if not text or not text.strip():
+        return 0.0
+
+    stripped = text.strip()
+    if len(stripped) < 2000 and any(marker.lower() in stripped.lower() for marker in PLACEHOLDER_MARKERS):
+        return 0.0
+
+    length_score = min(len(stripped) / GOOD_TEXT_LENGTH, 1.0)
+
+    # 한 줄 전체가 추출되는 정적 경로도 있으므로 문장 단위로도 나눠 본다
+    segments: List[str] = [seg.strip() for seg in re.split(r"[\n|·•]+", stripped) if seg.strip()]
+    boilerplate = sum(1 for seg in segments if len(seg) < 60 and BOILERPLATE_RE.search(seg))
+    boilerplate_ratio = boilerplate / len(segments) if segments else 1.0
+
+    return round(length_score * (1 - boilerplate_ratio), 3)
+
+
+class UrlExtractionService:
+    """
+    URL 이력서 텍스트를 가장 싼 단계부터 추출합니다.
+    notion_api(공개 Notion) → static(정적 HTML) → browser(헤드리스 Chromium) 순서로,
+    품질 점수가 기준 미만일 때만 다음 단계로 넘어갑니다.
+    """
+
+    TIERS = ("notion_api", "static", "browser")
+
+    def __init__(
+        self,
+        notion_extractor: Optional[NotionExtractor] = None,
+        browser_crawler: Optional[BrowserCrawler] = None,
+        quality_threshold: float = QUALITY_THRESHOLD,
+    ):
+        self.notion_extractor = notion_extractor or NotionExtractor()
+        self.browser_crawler = browser_crawler or BrowserCrawler()
+        self.quality_threshold = quality_threshold
+        self.served = Counter()
+        self.attempts = Counter()
+        self.failures = Counter()
+
+    async def _run_tier(self, tier: str, url: str, timeout: float) -> Optional[str]:
+        self.attempts[tier] += 1
+        async with span(f"url.{tier}", timeout=round(timeout, 1)) as tier_span:
+            try:
+                if tier == "notion_api":
+                    coro = self.notion_extractor.extract_text(url, timeout=timeout)
+                elif tier == "static":
+                    coro = WebExtractor.extract_text_from_url(url, timeout=timeout)
+                else:
+                    coro = self.browser_crawler.crawl(url, timeout_ms=int(timeout * 1000))
+                # 단계 내부 타임아웃이 여러 번 겹쳐도 전체가 timeout을 넘지 않도록 한 번 더 제한
+                text = await asyncio.wait_for(coro, timeout=timeout)
+                tier_span.set("chars", len(text or ""))
+                return text
+            except Exception as e:
+                self.failures[tier] += 1
+                tier_span.status = "error"
+                tier_span.set("error", f"{type(e).__name__}: {e}")
+                logger.warning(f"[{tier}] URL 텍스트 추출 실패: {str(e)}")
+                return None
+
+    def _tiers_for(self, url: str) -> List[str]:
+        if is_notion_url(url):
+            # Notion 정적 HTML은 렌더링 전 셸이므로 static 단계는 건너뛴다
+            return ["notion_api", "browser"]
+        return ["static", "browser"]
+
+    async def extract(self, url: str, deadline: Optional[Deadline] = None) -> ExtractionResult:
+        """
+        URL에서 텍스트를 추출합니다. 같은 URL의 동시 요청은 하나의 추출 작업을 공유합니다.
+        deadline이 주어지면 단계별 타임아웃을 남은 시간에 맞추고, 첫 단계를 시작할 시간도 없으면 DeadlineExceeded가 발생합니다.
+        """
+        deadline = deadline or Deadline()
+        extraction = get_single_flight("url_extraction").do(url, lambda: self._extract(url, deadline))
+        # 먼저 시작된 추출에 합류한 경우에도 자신의 기한까지만 기다린다
+        return await deadline.run(extraction, "url_extraction")
+
+    async def _extract(self, url: str, deadline: Deadline) -> ExtractionResult:
+        """단계별로 추출하고 어떤 단계가 응답했는지 기록합니다."""
+        start = time.perf_counter()
+        best: Optional[ExtractionResult] = None
+
+        for tier in self._tiers_for(url):
+            if best is not None and deadline.remaining() < TIER_MIN_BUDGETS[tier]:
+                logger.info(f"[{tier}] 남은 시간 {deadline.remaining():.1f}초로 다음 단계를 건너뜁니다.")
+                break
+            timeout = deadline.timeout(tier, cap=TIER_TIMEOUTS[tier], min_required=TIER_MIN_BUDGETS[tier])
+            text = await self._run_tier(tier, url, timeout)
+            score = score_text_quality(text)
+            result = ExtractionResult(text=(text or "").strip(), tier=tier, score=score, elapsed=time.perf_counter() - start)
+            logger.info(f"[{tier}] 추출 품질 점수: {score} (길이 {len(result.text)}자)")
+
+            if best is None or score > best.score:
+                best = result
+            if score >= self.quality_threshold:
+                break
+
+        best.elapsed = time.perf_counter() - start
+        if best.score == 0:
+            # 셸 페이지 문구 같은 0점 텍스트는 이력서로 사용하지 않는다
+            best.text = ""
+        self.served[best.tier if best.text else "none"] += 1
+        logger.info(f"URL 추출 완료: tier={best.tier}, score={best.score}, {best.elapsed:.2f}s, url={url}")
+        return best
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "served": dict(self.served),
+            "attempts": dict(self.attempts),
+            "failures": dict(self.failures),
+        }
+
+
+_url_extraction_service: Optional[UrlExtractionService] = None
+
+
+def get_url_extraction_service() -> UrlExtractionService:
+    """프로세스 전체에서 공유하는 UrlExtractionService를 반환합니다."""
+    global _url_extraction_service
+    if _url_extraction_service is None:
+        _url_extraction_service = UrlExtractionService()
+    return _url_extraction_service
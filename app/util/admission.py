@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import os
+import time
+from collections import Counter, deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger("app")
+
+# 무거운 엔드포인트 클래스별 동시 처리 수와 대기열 길이
+# report: POST /report, career: POST /career/extract, GET /career/experience/link
+ADMISSION_REPORT_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_REPORT_MAX_IN_FLIGHT", "8"))
+ADMISSION_REPORT_MAX_QUEUE = int(os.getenv("ADMISSION_REPORT_MAX_QUEUE", "16"))
+ADMISSION_CAREER_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_CAREER_MAX_IN_FLIGHT", "8"))
+ADMISSION_CAREER_MAX_QUEUE = int(os.getenv("ADMISSION_CAREER_MAX_QUEUE", "16"))
+# 대기열에서 기다릴 수 있는 최대 시간(초). 넘으면 처리해도 기한 안에 끝나기 어려우므로 바로 거절한다.
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "5"))
+
+
+class AdmissionRejected(Exception):
+    """동시 처리 수와 대기열이 모두 찼거나 대기 시간이 지나 요청을 받지 않을 때 발생합니다. 라우터에서 503으로 변환됩니다."""
+
+    def __init__(self, name: str, reason: str, retry_after: float):
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"서버가 혼잡합니다 ({name}: {reason}). {retry_after:.0f}초 후 다시 시도해 주세요.")
+
+
+class AdmissionTicket:
+    """입장한 요청의 정보입니다. waited는 대기열에서 기다린 시간(초)입니다."""
+
+    __slots__ = ("admitted_at", "waited")
+
+    def __init__(self, waited: float):
+        self.admitted_at = time.monotonic()
+        self.waited = waited
+
+
+class AdmissionController:
+    """
+    엔드포인트 클래스 하나의 입장 제어입니다.
+
+    - 처리 중인 요청이 max_in_flight 미만이면 바로 입장합니다.
+    - 아니면 max_queue까지 도착 순서대로 대기열에서 기다리고, queue_timeout 안에 자리가 나지 않으면 거절합니다.
+    - 대기열도 가득 차 있으면 기다리지 않고 바로 거절합니다.
+    과부하 때 모든 요청이 함께 느려져 nginx 타임아웃으로 한꺼번에 실패하는 대신, 받은 요청은 제시간에 끝내고 나머지는 빠르게 돌려보냅니다.
+    """
+
+    def __init__(self, name: str, max_in_flight: int, max_queue: int, queue_timeout: float = ADMISSION_QUEUE_TIMEOUT):
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.counts = Counter()
+        self._service_time_ewma: Optional[float] = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> float:
+        """대기열이 빠지는 데 걸릴 시간을 평균 처리 시간으로 추정합니다."""
+        service_time = self._service_time_ewma or 1.0
+        return max(1.0, service_time * (self.queued + 1) / max(self.max_in_flight, 1))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        self.counts[f"rejected_{reason}"] += 1
+        retry_after = self.retry_after()
+        logger.debug(f"[admission:{self.name}] 요청 거절 ({reason}): 처리 중 {self.in_flight}, 대기 {self.queued}")
+        return AdmissionRejected(self.name, reason, retry_after)
+
+    async def admit(self) -> AdmissionTicket:
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            self.counts["admitted"] += 1
+            return AdmissionTicket(0.0)
+
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject("queue_full")
+
+        started = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 자리를 받은 직후 시간이 끝났거나 취소된 경우 다음 대기자에게 넘긴다
+                self.in_flight -= 1
+                self._wake()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject("queue_timeout")
+
+        self.counts["admitted"] += 1
+        self.counts["queued"] += 1
+        return AdmissionTicket(time.monotonic() - started)
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        elapsed = time.monotonic() - ticket.admitted_at
+        self._service_time_ewma = elapsed if self._service_time_ewma is None else 0.8 * self._service_time_ewma + 0.2 * elapsed
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.max_in_flight:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> Dict:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "avg_service_seconds": round(self._service_time_ewma, 3) if self._service_time_ewma is not None else None,
+            **self.counts,
+        }
+
+
+_controllers: Dict[str, AdmissionController] = {}
+
+
+def get_admission_controller(name: str) -> AdmissionController:
+    """엔드포인트 클래스별로 공유되는 AdmissionController를 반환합니다."""
+    if name not in _controllers:
+        if name == "report":
+            _controllers[name] = AdmissionController(name, ADMISSION_REPORT_MAX_IN_FLIGHT, ADMISSION_REPORT_MAX_QUEUE)
+        elif name == "career":
+            _controllers[name] = AdmissionController(name, ADMISSION_CAREER_MAX_IN_FLIGHT, ADMISSION_CAREER_MAX_QUEUE)
+        else:
+            raise ValueError(f"알 수 없는 엔드포인트 클래스: {name}")
+    return _controllers[name]
+
+
+def admission_stats() -> Dict[str, Dict]:
+    return {name: controller.stats() for name, controller in _controllers.items()}
@@ -0,0 +1,122 @@
+import logging
+from typing import Optional, Union
+
+from app.util.browser_pool import BrowserPool, get_browser_pool
+from app.util.html_text import html_to_text
+from app.util.notion_extractor import is_notion_url
+from app.util.page_loader import wait_for_dom_quiet
+
+logger = logging.getLogger("app")
+
+
+class BrowserCrawler:
+    """공유 BrowserPool의 헤드리스 Chromium으로 페이지를 렌더링해 텍스트를 추출합니다."""
+
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        self.pool = pool or get_browser_pool()
+
+    async def crawl(self, url: str, timeout_ms: int = 60000) -> Union[str, None]:
+        logger.info(f"URL 접근 중: {url}")
+
+        try:
+            async with self.pool.page(default_timeout=timeout_ms) as page:
+                if is_notion_url(url):
+                    logger.debug("Notion 페이지 접근 중...")
+                    await page.goto(url, wait_until="domcontentloaded", timeout=min(45000, timeout_ms))
+
+                    try:
+                        await page.wait_for_selector("div.notion-page-content", timeout=min(10000, timeout_ms))
+                    except Exception:
+                        pass
+
+                    # 블록 렌더링이 멈출 때까지 대기 (고정 대기 대신 DOM 변경 감지)
+                    readiness = await wait_for_dom_quiet(page, quiet_ms=500, timeout_ms=4000)
+                else:
+                    await page.goto(url, wait_until="domcontentloaded", timeout=min(30000, timeout_ms))
+                    readiness = await wait_for_dom_quiet(page, quiet_ms=300, timeout_ms=3000)
+
+                logger.debug(f"페이지 준비 상태: {readiness}")
+
+                await self._scroll_page(page)
+                text = await self._extract_text_with_fallbacks(page)
+
+                if text and len(text.strip()) > 0:
+                    logger.info(f"텍스트 추출 성공: {len(text)} 글자")
+                    return text.strip()
+                else:
+                    raise ValueError("텍스트 추출 실패")
+
+        except Exception as e:
+            logger.error(f"페이지 접근 중 오류 발생: {str(e)}")
+            return None
+
+    async def _scroll_page(self, page):
+        # 지연 로딩 콘텐츠를 깨우기 위해 한 번의 evaluate 안에서 프레임 단위로 끝까지 스크롤
+        try:
+            scrolled = await page.evaluate("""
+            async () => {
+                const step = window.innerHeight;
+                const height = document.body.scrollHeight;
+                if (height <= step) return false;
+                for (let y = 0; y < height; y += step) {
+                    window.scrollTo(0, y);
+                    await new Promise(requestAnimationFrame);
+                }
+                window.scrollTo(0, 0);
+                return true;
+            }
+            """)
+
+            if scrolled:
+                await wait_for_dom_quiet(page, quiet_ms=200, timeout_ms=1500)
+
+        except Exception as e:
+            logger.debug(f"스크롤 중 오류: {str(e)}")
+
+    async def _extract_text_with_fallbacks(self, page):
+        # 방법 1: body.innerText
+        try:
+            text = await page.evaluate("document.body.innerText")
+            if text and len(text.strip()) > 0:
+                return text
+        except Exception:
+            pass
+
+        # 방법 2: 모든 텍스트 노드 추출
+        try:
+            text = await page.evaluate("""
+            Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, p, li, td, th, span, div, a'))
+                .map(el => el.textContent)
+                .filter(text => text.trim().length > 0)
+                .join('\\n')
+            """)
+            if text and len(text.strip()) > 0:
+                return text
+        except Exception:
+            pass
+
+        # 방법 3: Notion 특화 선택자
+        if is_notion_url(page.url):
+            try:
+                text = await page.evaluate("""
+                Array.from(document.querySelectorAll('.notion-page-content *'))
+                    .map(el => el.textContent)
+                    .filter(text => text.trim().length > 0)
+                    .join('\\n')
+                """)
+                if text and len(text.strip()) > 0:
+                    return text
+            except Exception:
+                pass
+
+        # 방법 4: HTML 내용으로부터 텍스트 추출
+        try:
+            html = await page.content()
+            text = html_to_text(html)
+
+            if text and len(text.strip()) > 0:
+                return text
+        except Exception:
+            pass
+
+        return ""
\ No newline at end of file
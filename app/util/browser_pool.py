@@ -0,0 +1,97 @@
+import asyncio
+import importlib
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from app.util.page_loader import block_heavy_resources
+
+logger = logging.getLogger("app")
+
+BROWSER_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
+BROWSER_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-setuid-sandbox',
+    '--no-sandbox',
+]
+
+
+class BrowserPool:
+    """
+    Chromium 프로세스 하나를 재사용하고, 동시에 열 수 있는 페이지(슬롯) 수를 제한합니다.
+    요청마다 새 브라우저 컨텍스트를 만들어 쿠키/스토리지는 공유하지 않습니다.
+    """
+
+    def __init__(self, size: int = 2):
+        self.size = size
+        self._slots = asyncio.Semaphore(size)
+        self._launch_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self.in_use = 0
+
+    async def _get_browser(self):
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                from playwright.async_api import async_playwright
+
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                logger.info("Chromium 브라우저 실행 중...")
+                self._browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+            return self._browser
+
+    @asynccontextmanager
+    async def page(self, default_timeout: int = 60000):
+        """슬롯을 하나 점유하고 리소스 차단이 적용된 새 페이지를 제공합니다."""
+        async with self._slots:
+            self.in_use += 1
+            context = None
+            try:
+                browser = await self._get_browser()
+                context = await browser.new_context(
+                    user_agent=BROWSER_USER_AGENT,
+                    viewport={"width": 1280, "height": 800},
+                    device_scale_factor=1,
+                )
+                context.set_default_timeout(default_timeout)
+                # 이미지/미디어/폰트와 트래커 요청 차단
+                await block_heavy_resources(context)
+                yield await context.new_page()
+            finally:
+                self.in_use -= 1
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.debug(f"브라우저 컨텍스트 종료 중 오류: {str(e)}")
+
+    async def warm(self) -> None:
+        """Chromium을 미리 실행해 첫 브라우저 추출 요청이 실행 시간을 기다리지 않게 합니다."""
+        # playwright import가 이벤트 루프를 막지 않도록 스레드에서 먼저 가져온다
+        await asyncio.to_thread(importlib.import_module, "playwright.async_api")
+        await self._get_browser()
+
+    def stats(self):
+        return {"size": self.size, "in_use": self.in_use, "launched": self._browser is not None}
+
+    async def aclose(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 전체에서 공유하는 BrowserPool을 반환합니다."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool(size=int(os.getenv("BROWSER_POOL_SIZE", "2")))
+    return _browser_pool
@@ -0,0 +1,183 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger("app")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않고 바로 실패할 때 발생합니다."""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name} 회로 차단 중 ({retry_after:.0f}초 후 재시도)")
+
+
+class LatencyWindow:
+    """최근 성공 호출의 지연 시간을 보관하고 백분위수를 계산합니다."""
+
+    def __init__(self, size: int = 100):
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+class CircuitBreaker:
+    """
+    최근 window개 호출의 오류율 또는 느린 호출 비율이 기준을 넘으면 회로를 엽니다(open).
+    open 상태에서는 호출 없이 CircuitOpenError로 바로 실패하고, open_seconds가 지나면 half_open으로 바뀌어
+    half_open_max_calls개의 시험 호출만 허용합니다. 시험 호출이 half_open_successes번 연속 성공하면 닫히고(closed),
+    하나라도 실패하면 다시 열립니다.
+
+    스레드에서 동기 클라이언트와 함께 쓰므로 상태는 threading.Lock으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 20.0,
+        slow_call_rate: float = 0.8,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        half_open_successes: int = 2,
+    ):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.half_open_successes = half_open_successes
+
+        self.state = CLOSED
+        self._calls: Deque[Tuple[bool, bool]] = deque(maxlen=window)  # (실패 여부, 느린 호출 여부)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        self.trips = 0
+
+    def before_call(self) -> None:
+        """호출 전에 확인합니다. 회로가 열려 있으면 CircuitOpenError가 발생합니다."""
+        with self._lock:
+            if self.state == OPEN:
+                elapsed = time.monotonic() - self._opened_at
+                if elapsed < self.open_seconds:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, self.open_seconds - elapsed)
+                self._transition(HALF_OPEN)
+
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.name, 0)
+                self._probes_in_flight += 1
+
+    def record_success(self, seconds: float) -> None:
+        self._record(failed=False, seconds=seconds)
+
+    def record_failure(self, seconds: float) -> None:
+        self._record(failed=True, seconds=seconds)
+
+    def release(self) -> None:
+        """성공/실패로 세지 않는 결과(예: 잘못된 요청)일 때 시험 호출 슬롯만 반환합니다."""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def _record(self, failed: bool, seconds: float) -> None:
+        slow = seconds >= self.slow_call_seconds
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if failed or slow:
+                    self._transition(OPEN)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_successes:
+                    self._transition(CLOSED)
+                return
+
+            if self.state == OPEN:
+                # 회로가 열리기 전에 시작된 호출의 결과
+                return
+
+            self._calls.append((failed, slow))
+            if len(self._calls) < self.min_calls:
+                return
+            failures = sum(1 for f, _ in self._calls if f)
+            slow_calls = sum(1 for _, s in self._calls if s)
+            if failures / len(self._calls) >= self.failure_rate or slow_calls / len(self._calls) >= self.slow_call_rate:
+                logger.warning(
+                    f"[{self.name}] 회로 열림: 최근 {len(self._calls)}건 중 실패 {failures}건, 느린 호출 {slow_calls}건"
+                )
+                self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        logger.info(f"[{self.name}] 회로 상태 변경: {self.state} → {state}")
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self.trips += 1
+        self._calls.clear()
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            failures = sum(1 for f, _ in self._calls if f)
+            slow_calls = sum(1 for _, s in self._calls if s)
+            return {
+                "state": self.state,
+                "window_calls": len(self._calls),
+                "window_failures": failures,
+                "window_slow_calls": slow_calls,
+                "trips": self.trips,
+                "rejected": self.rejected,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **options) -> CircuitBreaker:
+    """이름별로 공유되는 CircuitBreaker를 반환합니다. options는 처음 만들 때만 적용됩니다."""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name, **options)
+        return _breakers[name]
+
+
+def circuit_breaker_stats() -> Dict[str, Dict]:
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
@@ -1,35 +1,293 @@
+import contextvars
 import os
-import requests
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait
+from typing import Callable, Dict, Optional, TypeVar
+
 import json
-from dotenv import load_dotenv
 
-load_dotenv()
+from app import config  # noqa: F401 (.env를 읽음)
+from app.util.circuit_breaker import CircuitBreaker, LatencyWindow, get_circuit_breaker
+from app.util.concurrency_limiter import (
+    CLOVA_MAX_CONCURRENCY, OUTCOME_IGNORED, OUTCOME_OK, OUTCOME_OVERLOAD, report_outcome, try_extra_slot,
+)
+from app.util.deadline import DeadlineExceeded
+from app.util.quota_scheduler import get_quota_scheduler
+from app.util.tracing import current_trace_id, span
+
+logger = logging.getLogger("app")
+
+T = TypeVar("T")
+
+CLOVA_HOST = 'https://clovastudio.stream.ntruss.com'
+
+# 호출자가 타임아웃을 정하지 않았을 때의 기본값(초)과 연결 타임아웃
+DEFAULT_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 5.0
+
+# 회로 차단기: 최근 호출의 실패율 또는 느린 호출 비율이 기준을 넘으면 open_seconds 동안 호출하지 않음
+CLOVA_BREAKER_FAILURE_RATE = float(os.getenv("CLOVA_BREAKER_FAILURE_RATE", "0.5"))
+CLOVA_BREAKER_SLOW_SECONDS = float(os.getenv("CLOVA_BREAKER_SLOW_SECONDS", "20"))
+CLOVA_BREAKER_OPEN_SECONDS = float(os.getenv("CLOVA_BREAKER_OPEN_SECONDS", "30"))
+
+# 헤징: 응답이 최근 p95 지연 시간보다 늦으면 같은 요청을 한 번 더 보내고 먼저 온 응답을 사용
+CLOVA_HEDGE_ENABLED = os.getenv("CLOVA_HEDGE_ENABLED", "false").lower() == "true"
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY = 1.0
+
+_latency = LatencyWindow(size=200)
+_hedge_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="clova-hedge")
+_hedge_stats = {"hedged": 0, "hedge_wins": 0, "hedge_skipped": 0}
+_hedge_stats_lock = threading.Lock()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_clova_breaker() -> CircuitBreaker:
+    return get_circuit_breaker(
+        "clova",
+        failure_rate=CLOVA_BREAKER_FAILURE_RATE,
+        slow_call_seconds=CLOVA_BREAKER_SLOW_SECONDS,
+        open_seconds=CLOVA_BREAKER_OPEN_SECONDS,
+    )
+
+
+def get_clova_session():
+    """
+    CLOVA 호출에 쓰는 requests.Session을 반환합니다. 호출마다 새로 TLS 연결을 맺지 않도록 연결을 재사용하며,
+    연결 풀 크기는 동시 호출 상한(헤징 포함)에 맞춥니다.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=CLOVA_MAX_CONCURRENCY * 2))
+                _session = session
+    return _session
+
+
+def warm_clova_connection(timeout: float = CONNECT_TIMEOUT) -> int:
+    """CLOVA 호스트에 미리 연결(DNS, TCP, TLS)해 두어 첫 호출이 연결 비용을 치르지 않게 합니다. 응답 상태 코드를 반환합니다."""
+    response = get_clova_session().head(CLOVA_HOST, timeout=timeout)
+    response.close()
+    return response.status_code
+
+
+def close_clova_session() -> None:
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+def _is_upstream_failure(error: Exception) -> bool:
+    """회로 차단기에 실패로 기록할 오류인지 판단합니다. 429/5xx/네트워크 오류/시간 초과만 실패로 봅니다."""
+    # requests는 import에 40ms 넘게 걸려 서버 시작 때가 아니라 CLOVA를 처음 호출할 때 가져온다
+    import requests
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (requests.RequestException, DeadlineExceeded, json.JSONDecodeError))
+
+
+def _is_overload(error: Exception) -> bool:
+    """동시 호출 한도를 줄여야 하는 오류인지 판단합니다. 429/5xx, 연결 실패, 시간 초과가 해당됩니다."""
+    import requests
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, DeadlineExceeded))
+
+
+def hedge_delay(timeout: Optional[float]) -> Optional[float]:
+    """헤지 요청을 보낼 지연 시간(초)을 반환합니다. 헤징을 하지 않을 때는 None입니다."""
+    if not CLOVA_HEDGE_ENABLED or len(_latency) < HEDGE_MIN_SAMPLES:
+        return None
+    delay = max(_latency.percentile(HEDGE_PERCENTILE), HEDGE_MIN_DELAY)
+    # 남은 시간이 너무 적으면 두 번째 요청이 끝날 수 없으므로 보내지 않음
+    if timeout and delay > timeout * 0.5:
+        return None
+    return delay
+
+
+def _count_hedge(name: str) -> None:
+    with _hedge_stats_lock:
+        _hedge_stats[name] += 1
+
+
+def clova_client_stats() -> Dict:
+    with _hedge_stats_lock:
+        hedge_stats = dict(_hedge_stats)
+    return {
+        "latency_p50": _latency.percentile(50),
+        "latency_p95": _latency.percentile(HEDGE_PERCENTILE),
+        "hedge_enabled": CLOVA_HEDGE_ENABLED,
+        **hedge_stats,
+    }
+
 
 class CompletionExecutor:
+    """
+    CLOVA Studio chat-completions 클라이언트입니다.
+    모든 호출은 공유 회로 차단기를 거치며, 회로가 열려 있으면 요청하지 않고 CircuitOpenError가 발생합니다.
+    호출 결과는 현재 점유 중인 동시 호출 제한기 슬롯에도 기록되어 한도 조정에 사용됩니다.
+    호출 전에 호스트 단위 할당량을 use_priority()로 지정된 우선순위 클래스로 임대합니다.
+    X-NCP-CLOVASTUDIO-REQUEST-ID에는 현재 요청의 trace id를 보내고, trace 밖에서는 생성 시 받은 request_id를 씁니다.
+    """
+
     def __init__(self, host: str, api_key: str, request_id: str):
         self.host = host
         self.api_key = api_key
         self.request_id = request_id
 
-    def execute(self, completion_request) -> str:
-        headers = {
+    def _headers(self, accept: str = 'application/json') -> dict:
+        return {
             'Authorization': self.api_key,
-            'X-NCP-CLOVASTUDIO-REQUEST-ID': self.request_id,
+            'X-NCP-CLOVASTUDIO-REQUEST-ID': current_trace_id() or self.request_id,
             'Content-Type': 'application/json; charset=utf-8',
-            'Accept': 'text/event-stream'
+            'Accept': accept
         }
 
+    def execute(self, completion_request, timeout: Optional[float] = DEFAULT_TIMEOUT) -> str:
+        """
+        HCX-DASH-001 SSE 응답에서 event:result 데이터를 반환합니다.
+        timeout은 스트림 전체에 대한 제한(초)이며, 넘으면 DeadlineExceeded가 발생합니다.
+        """
+        return self._call("clova.HCX-DASH-001", lambda t: self._execute_stream(completion_request, t), timeout)
+
+    def execute_json(self, completion_request, model: str = 'HCX-003', timeout: Optional[float] = DEFAULT_TIMEOUT) -> dict:
+        """
+        스트리밍 없이 chat-completions를 호출하고 응답 JSON을 반환합니다.
+        200이 아닌 응답은 requests.HTTPError로 발생시킵니다.
+        """
+        return self._call(f"clova.{model}", lambda t: self._post_json(completion_request, model, t), timeout)
+
+    def _call(self, name: str, call: Callable[[Optional[float]], T], timeout: Optional[float]) -> T:
+        with span(name) as call_span:
+            # 할당량을 기다린 시간만큼 호출 타임아웃을 줄인다
+            queued = time.monotonic()
+            with get_quota_scheduler().lease(timeout=timeout):
+                waited = time.monotonic() - queued
+                call_span.set("quota_wait_ms", round(waited * 1000, 1))
+                if timeout is not None:
+                    timeout -= waited
+                    # 로컬 대기로 시간을 다 쓴 경우이므로 회로 차단기에 CLOVA 실패로 기록하지 않는다
+                    if timeout <= 0:
+                        raise DeadlineExceeded("clova_quota", timeout)
+                return self._call_with_breaker(call, timeout)
+
+    def _call_with_breaker(self, call: Callable[[Optional[float]], T], timeout: Optional[float]) -> T:
+        breaker = get_clova_breaker()
+        breaker.before_call()
+
+        started = time.monotonic()
+        try:
+            result = self._hedged(call, timeout)
+        except Exception as e:
+            elapsed = time.monotonic() - started
+            if _is_upstream_failure(e):
+                breaker.record_failure(elapsed)
+            else:
+                breaker.release()
+            report_outcome(OUTCOME_OVERLOAD if _is_overload(e) else OUTCOME_IGNORED)
+            raise
+
+        elapsed = time.monotonic() - started
+        breaker.record_success(elapsed)
+        _latency.add(elapsed)
+        report_outcome(OUTCOME_OK)
+        return result
+
+    def _hedged(self, call: Callable[[Optional[float]], T], timeout: Optional[float]) -> T:
+        """
+        p95 지연 시간이 지나도 응답이 없으면 같은 요청을 한 번 더 보내고 먼저 성공한 응답을 반환합니다.
+        헤지 요청은 할당량 임대와 동시 호출 슬롯을 하나씩 더 받을 수 있을 때만 보내며, 둘 다 끝날 때까지 점유합니다.
+        """
+        delay = hedge_delay(timeout)
+        if delay is None:
+            return call(timeout)
+
+        started = time.monotonic()
+        # 헤지 스레드에서도 같은 trace id를 보내도록 컨텍스트를 복사해서 실행
+        primary = _hedge_pool.submit(contextvars.copy_context().run, call, timeout)
+        try:
+            return primary.result(timeout=delay)
+        except FuturesTimeoutError:
+            pass
+
+        remaining = timeout - (time.monotonic() - started) if timeout else None
+        if remaining is not None and remaining < HEDGE_MIN_DELAY:
+            return primary.result()
+
+        # 헤지 요청도 할당량 임대와 동시 호출 슬롯을 따로 받아야 보낸다. 여유가 없으면 원래 요청만 기다린다
+        release_hedge = self._reserve_hedge()
+        if release_hedge is None:
+            _count_hedge("hedge_skipped")
+            return primary.result()
+
+        logger.info(f"CLOVA 응답이 {delay:.1f}초(p{HEDGE_PERCENTILE}) 안에 오지 않아 헤지 요청을 보냅니다.")
+        _count_hedge("hedged")
+        hedge = _hedge_pool.submit(contextvars.copy_context().run, call, remaining)
+        # 지는 요청은 취소되지 않고 끝까지 실행되므로, 두 요청이 모두 끝난 뒤에 추가로 받은 임대와 슬롯을 놓는다
+        primary.add_done_callback(lambda _: hedge.add_done_callback(lambda _: release_hedge()))
+
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        _count_hedge("hedge_wins")
+                    return future.result()
+        # 둘 다 실패하면 원래 요청의 오류를 전달
+        return primary.result()
+
+    @staticmethod
+    def _reserve_hedge() -> Optional[Callable[[], None]]:
+        """헤지 요청에 쓸 할당량 임대와 동시 호출 슬롯을 기다리지 않고 받아 둘을 놓는 함수를 반환합니다. 하나라도 못 받으면 None입니다."""
+        scheduler = get_quota_scheduler()
+        granted, lease_id = scheduler.acquire_nowait()
+        if not granted:
+            return None
+        release_slot = try_extra_slot()
+        if release_slot is None:
+            scheduler.release(lease_id)
+            return None
+
+        def release() -> None:
+            release_slot()
+            scheduler.release(lease_id)
+
+        return release
+
+    def _execute_stream(self, completion_request, timeout: Optional[float]) -> str:
         final_result = ""
         is_result_event = False  # event:result 이벤트가 시작되었는지 여부
+        started = time.monotonic()
 
         # SSE 응답 스트림 처리
-        with requests.post(
+        with get_clova_session().post(
             self.host + '/testapp/v1/chat-completions/HCX-DASH-001',
-            headers=headers,
+            headers=self._headers('text/event-stream'),
             json=completion_request,
-            stream=True
+            stream=True,
+            timeout=(min(CONNECT_TIMEOUT, timeout), timeout) if timeout else None
         ) as r:
+            if r.status_code != 200:
+                logger.error(f"Clova API 오류 응답: 상태 코드 {r.status_code}")
+                r.raise_for_status()
             for line in r.iter_lines():
+                # requests의 timeout은 읽기 간격 기준이므로 전체 경과 시간은 직접 확인
+                if timeout and time.monotonic() - started > timeout:
+                    raise DeadlineExceeded("clova_stream", timeout - (time.monotonic() - started))
                 if line:
                     decoded_line = line.decode("utf-8").strip()
                     if decoded_line.startswith("event:result"):
@@ -39,6 +297,19 @@ class CompletionExecutor:
                         is_result_event = False
         return final_result
 
+    def _post_json(self, completion_request, model: str, timeout: Optional[float]) -> dict:
+        response = get_clova_session().post(
+            f"{self.host}/testapp/v1/chat-completions/{model}",
+            headers=self._headers(),
+            json=completion_request,
+            timeout=(min(CONNECT_TIMEOUT, timeout), timeout) if timeout else None
+        )
+        if response.status_code != 200:
+            logger.error(f"Clova API 오류 응답: 상태 코드 {response.status_code}")
+            logger.error(f"응답 내용: {response.text}")
+            response.raise_for_status()
+        return response.json()
+
 class ResumeExtract:
     """
     CLOVA API를 사용하여 텍스트 기반 이력서에서 career, activities, certifications 정보를 추출합니다.
@@ -81,7 +352,7 @@ class ResumeExtract:
             '}'
         )
 
-    def extract(self, resume_text: str) -> dict:
+    def extract(self, resume_text: str, timeout: Optional[float] = DEFAULT_TIMEOUT) -> dict:
         messages = [
             {"role": "system", "content": self.system_prompt},
             {"role": "user", "content": resume_text}
@@ -100,7 +371,7 @@ class ResumeExtract:
         }
 
         # API 요청하여 응답 받기
-        raw_response = self.executor.execute(request_data)
+        raw_response = self.executor.execute(request_data, timeout=timeout)
 
         try:
             # 문자열 응답을 먼저 JSON으로 파싱
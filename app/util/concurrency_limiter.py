@@ -0,0 +1,235 @@
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from typing import Callable, Deque, Dict, Optional
+
+from app.util.deadline import Deadline
+
+logger = logging.getLogger("app")
+
+# CLOVA Studio 동시 호출 한도 (단건/배치 보고서, 경력 추출이 함께 사용)
+# 한도는 CLOVA_INITIAL_CONCURRENCY에서 시작해 응답 상태에 따라 MIN~MAX 사이에서 조정된다.
+CLOVA_INITIAL_CONCURRENCY = int(os.getenv("CLOVA_INITIAL_CONCURRENCY", "4"))
+CLOVA_MIN_CONCURRENCY = int(os.getenv("CLOVA_MIN_CONCURRENCY", "1"))
+CLOVA_MAX_CONCURRENCY = int(os.getenv("CLOVA_MAX_CONCURRENCY", "16"))
+# 이 시간보다 오래 걸린 응답은 지연 급증으로 보고 한도를 줄인다
+CLOVA_LATENCY_TARGET_SECONDS = float(os.getenv("CLOVA_LATENCY_TARGET_SECONDS", "20"))
+
+# 호출 결과 종류
+OUTCOME_OK = "ok"
+OUTCOME_OVERLOAD = "overload"  # 429/5xx, 시간 초과 → 한도 감소
+OUTCOME_IGNORED = "ignored"  # 잘못된 요청, 회로 차단 등 → 한도 유지
+
+_OUTCOME_SEVERITY = {OUTCOME_IGNORED: 0, OUTCOME_OK: 1, OUTCOME_OVERLOAD: 2}
+
+
+class Permit:
+    """슬롯 하나의 점유 정보입니다. 호출 결과는 report_outcome()으로 기록됩니다."""
+
+    __slots__ = ("started_at", "outcome", "limiter", "loop")
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter", loop: asyncio.AbstractEventLoop):
+        self.started_at = time.monotonic()
+        self.outcome: Optional[str] = None
+        # 워커 스레드에서 같은 제한기의 슬롯을 더 점유할 때(try_extra_slot) 사용
+        self.limiter = limiter
+        self.loop = loop
+
+
+# 현재 작업이 점유한 슬롯. asyncio.to_thread는 컨텍스트를 복사하므로 워커 스레드의 동기 클라이언트에서도 보인다.
+_current_permit: contextvars.ContextVar[Optional[Permit]] = contextvars.ContextVar("current_permit", default=None)
+
+
+def report_outcome(outcome: str) -> None:
+    """현재 점유 중인 슬롯에 호출 결과를 기록합니다. 슬롯 밖(배치 스크립트 등)에서는 아무 일도 하지 않습니다."""
+    permit = _current_permit.get()
+    if permit is None:
+        return
+    # 헤징 등으로 한 슬롯에서 여러 번 호출되면 가장 나쁜 결과를 남긴다
+    if permit.outcome is None or _OUTCOME_SEVERITY[outcome] > _OUTCOME_SEVERITY[permit.outcome]:
+        permit.outcome = outcome
+
+
+def try_extra_slot() -> Optional[Callable[[], None]]:
+    """
+    현재 슬롯과 같은 제한기에서 슬롯 하나를 기다리지 않고 더 점유합니다. 헤지 요청처럼 워커 스레드에서 추가로 보내는 호출에 씁니다.
+    한도가 차 있거나 대기자가 있으면 None을, 점유했으면 슬롯을 놓는 함수(어느 스레드에서나 호출 가능)를 반환합니다.
+    슬롯 밖(배치 스크립트 등)에서는 점유할 제한기가 없으므로 아무 일도 하지 않는 함수를 반환합니다.
+    """
+    permit = _current_permit.get()
+    if permit is None:
+        return lambda: None
+    limiter, loop = permit.limiter, permit.loop
+
+    async def acquire_nowait() -> Optional[Permit]:
+        return limiter.acquire_nowait()
+
+    try:
+        extra = asyncio.run_coroutine_threadsafe(acquire_nowait(), loop).result()
+    except RuntimeError:
+        # 이벤트 루프가 이미 닫힌 경우(종료 중)
+        return None
+    if extra is None:
+        return None
+
+    def release() -> None:
+        try:
+            loop.call_soon_threadsafe(limiter.release, extra)
+        except RuntimeError:
+            pass
+
+    return release
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 방식으로 동시 실행 한도를 조정합니다.
+
+    - 정상 응답(지연 시간이 latency_target 이하)마다 한도를 1/limit씩 늘립니다. (한도만큼 성공하면 +1)
+    - 과부하 응답(429/5xx/시간 초과) 또는 지연 급증이면 한도를 decrease_factor배로 줄입니다.
+      마지막 감소 이후에 시작된 호출의 결과만 반영해, 같은 과부하로 여러 번 줄어들지 않게 합니다.
+    - 대기자는 도착 순서(FIFO)대로 슬롯을 받습니다.
+
+        async with get_clova_limiter().slot(deadline):
+            await asyncio.to_thread(executor.execute, request)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_target: float = 20.0,
+        decrease_factor: float = 0.5,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+
+        self.in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease_at = 0.0
+        self.outcomes = Counter()
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def effective_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def acquire_nowait(self) -> Optional[Permit]:
+        """기다리지 않고 슬롯을 점유합니다. 한도가 차 있거나 대기자가 있으면 None입니다. 이벤트 루프 스레드에서 호출합니다."""
+        if self.in_use < self.effective_limit and not self._waiters:
+            self.in_use += 1
+            return Permit(self, asyncio.get_running_loop())
+        return None
+
+    async def acquire(self) -> Permit:
+        permit = self.acquire_nowait()
+        if permit is not None:
+            return permit
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 다음 대기자에게 넘긴다
+                self.in_use -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return Permit(self, asyncio.get_running_loop())
+
+    def release(self, permit: Permit) -> None:
+        self.in_use -= 1
+        self._adjust(permit)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_use < self.effective_limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_use += 1
+                waiter.set_result(None)
+
+    def _adjust(self, permit: Permit) -> None:
+        outcome = permit.outcome or OUTCOME_IGNORED
+        latency = time.monotonic() - permit.started_at
+        if outcome == OUTCOME_OK and latency > self.latency_target:
+            outcome = OUTCOME_OVERLOAD
+        self.outcomes[outcome] += 1
+
+        if outcome == OUTCOME_OK:
+            if self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self.increases += 1
+        elif outcome == OUTCOME_OVERLOAD and permit.started_at >= self._last_decrease_at:
+            previous = self.effective_limit
+            self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+            self._last_decrease_at = time.monotonic()
+            self.decreases += 1
+            logger.warning(
+                f"[{self.name}] 동시 호출 한도 감소: {previous} → {self.effective_limit} (응답 {latency:.1f}초)"
+            )
+
+    @asynccontextmanager
+    async def slot(self, deadline: Optional[Deadline] = None, stage: str = "queue"):
+        """
+        슬롯을 점유합니다. deadline이 주어지면 남은 시간 안에 슬롯을 얻지 못할 때 DeadlineExceeded가 발생합니다.
+        블록 안의 호출 결과는 report_outcome()으로 기록되어 한도 조정에 사용됩니다.
+        """
+        if deadline is None:
+            permit = await self.acquire()
+        else:
+            permit = await deadline.run(self.acquire(), f"{self.name}_{stage}")
+        token = _current_permit.set(permit)
+        try:
+            yield permit
+        finally:
+            _current_permit.reset(token)
+            self.release(permit)
+
+    def stats(self) -> Dict:
+        return {
+            "limit": round(self.limit, 2),
+            "effective_limit": self.effective_limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "outcomes": dict(self.outcomes),
+        }
+
+
+_clova_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+
+
+def get_clova_limiter() -> AdaptiveConcurrencyLimiter:
+    """프로세스 전체에서 공유하는 CLOVA 호출 제한기를 반환합니다."""
+    global _clova_limiter
+    if _clova_limiter is None:
+        _clova_limiter = AdaptiveConcurrencyLimiter(
+            "clova",
+            initial_limit=CLOVA_INITIAL_CONCURRENCY,
+            min_limit=CLOVA_MIN_CONCURRENCY,
+            max_limit=CLOVA_MAX_CONCURRENCY,
+            latency_target=CLOVA_LATENCY_TARGET_SECONDS,
+        )
+    return _clova_limiter
@@ -0,0 +1,76 @@
+import asyncio
+import inspect
+import logging
+import os
+import time
+from typing import Awaitable, Optional, TypeVar
+
+logger = logging.getLogger("app")
+
+T = TypeVar("T")
+
+# 요청 전체 처리 시간 예산 (nginx proxy_read_timeout 60초보다 조금 짧게)
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "55"))
+
+# 단계별로 시작하는 데 필요한 최소 남은 시간(초). 이보다 적게 남으면 시작하지 않고 바로 실패한다.
+MIN_BUDGET_PDF = 1.0
+MIN_BUDGET_STATIC = 1.0
+MIN_BUDGET_BROWSER = 5.0
+MIN_BUDGET_CLOVA = 5.0
+
+
+class DeadlineExceeded(Exception):
+    """요청 처리 시간 예산이 부족하거나 초과되었을 때 발생합니다. 라우터에서 504로 변환됩니다."""
+
+    def __init__(self, stage: str, remaining: float):
+        self.stage = stage
+        self.remaining = remaining
+        super().__init__(f"처리 시간 초과: {stage} 단계 (남은 시간 {max(remaining, 0):.1f}초)")
+
+
+class Deadline:
+    """
+    요청 하나의 처리 기한입니다. 라우터에서 만들어 각 단계에 넘기면,
+    단계마다 남은 시간으로 자신의 타임아웃을 정하고 시간이 부족하면 DeadlineExceeded로 바로 실패합니다.
+
+        deadline = Deadline(REQUEST_DEADLINE_SECONDS)
+        text = await deadline.run(fetch(url), "static", cap=10)
+        timeout = deadline.timeout("clova", cap=30, min_required=MIN_BUDGET_CLOVA)
+    """
+
+    def __init__(self, budget: float = REQUEST_DEADLINE_SECONDS):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, stage: str, min_required: float = 0.0) -> None:
+        """남은 시간이 min_required보다 적으면 DeadlineExceeded를 발생시킵니다."""
+        remaining = self.remaining()
+        if remaining <= 0 or remaining < min_required:
+            logger.warning(f"[deadline] {stage} 단계 시작 불가: 남은 시간 {remaining:.2f}초 (필요 {min_required:.1f}초)")
+            raise DeadlineExceeded(stage, remaining)
+
+    def timeout(self, stage: str, cap: Optional[float] = None, min_required: float = 0.0) -> float:
+        """단계에서 사용할 타임아웃(초)을 남은 시간과 cap 중 작은 값으로 계산합니다."""
+        self.check(stage, min_required)
+        remaining = self.remaining()
+        return min(cap, remaining) if cap is not None else remaining
+
+    async def run(self, awaitable: Awaitable[T], stage: str, cap: Optional[float] = None, min_required: float = 0.0) -> T:
+        """awaitable을 남은 시간 안에서 실행합니다. 시간이 지나면 취소하고 DeadlineExceeded를 발생시킵니다."""
+        try:
+            timeout = self.timeout(stage, cap, min_required)
+        except DeadlineExceeded:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise
+
+        try:
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(stage, self.remaining())
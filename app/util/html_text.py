@@ -0,0 +1,117 @@
+import logging
+import os
+from typing import Dict, Optional, Protocol
+
+logger = logging.getLogger("app")
+
+# 텍스트 추출 전에 제거하는 태그 (모든 백엔드 공통 규칙)
+STRIP_TAGS = ("script", "style", "meta", "noscript", "template", "svg", "header", "footer", "nav", "aside")
+
+
+# 앞뒤에서 줄을 바꾸는 블록 요소 (모든 백엔드 공통 규칙)
+BLOCK_TAGS = (
+    "address", "article", "blockquote", "br", "dd", "details", "div", "dl", "dt", "fieldset", "figcaption", "figure",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "li", "main", "ol", "p", "pre", "section", "summary",
+    "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+)
+# 블록 경계를 표시하는 문자. HTML 소스의 줄바꿈은 공백과 같으므로 줄바꿈 대신 이 문자로 경계를 구분한다
+_BLOCK_BREAK = "\u2029"
+
+
+def normalize_whitespace(text: str) -> str:
+    """연속된 공백/줄바꿈을 하나의 공백으로 합칩니다."""
+    return " ".join(text.split())
+
+
+def _join_blocks(raw: str) -> str:
+    """블록 경계마다 한 줄이 되도록, 경계 사이의 공백은 하나로 합치고 빈 줄은 버립니다."""
+    lines = (normalize_whitespace(part) for part in raw.split(_BLOCK_BREAK))
+    return "\n".join(line for line in lines if line)
+
+
+class HtmlTextBackend(Protocol):
+    """HTML 문자열에서 본문 텍스트를 추출하는 백엔드 인터페이스입니다."""
+    name: str
+
+    def extract(self, html: str) -> str:
+        pass
+
+
+class SelectolaxBackend:
+    """lexbor(C) 기반 selectolax 파서를 사용하는 기본 백엔드입니다."""
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser = LexborHTMLParser
+
+    def extract(self, html: str) -> str:
+        tree = self._parser(html)
+        tree.strip_tags(list(STRIP_TAGS))
+        if tree.root is None:
+            return ""
+        for node in tree.root.css(",".join(BLOCK_TAGS)):
+            node.insert_before(_BLOCK_BREAK)
+            node.insert_after(_BLOCK_BREAK)
+        return _join_blocks(tree.root.text(separator="", strip=False))
+
+
+class BeautifulSoupBackend:
+    """순수 파이썬 html.parser를 사용하는 BeautifulSoup 폴백 백엔드입니다."""
+    name = "beautifulsoup"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        self._soup = BeautifulSoup
+
+    def extract(self, html: str) -> str:
+        soup = self._soup(html, "html.parser")
+        for tag in soup(list(STRIP_TAGS)):
+            tag.extract()
+        for tag in soup(list(BLOCK_TAGS)):
+            tag.insert_before(_BLOCK_BREAK)
+            tag.insert_after(_BLOCK_BREAK)
+        return _join_blocks(soup.get_text())
+
+
+_BACKENDS = {
+    SelectolaxBackend.name: SelectolaxBackend,
+    BeautifulSoupBackend.name: BeautifulSoupBackend,
+}
+_instances: Dict[str, HtmlTextBackend] = {}
+
+
+def get_html_text_backend(name: Optional[str] = None) -> HtmlTextBackend:
+    """
+    HTML 텍스트 추출 백엔드를 반환합니다.
+    name이 없으면 HTML_TEXT_BACKEND 환경 변수, 그다음 selectolax → beautifulsoup 순으로 선택합니다.
+    """
+    candidates = [name or os.getenv("HTML_TEXT_BACKEND") or SelectolaxBackend.name, BeautifulSoupBackend.name]
+    for candidate in candidates:
+        if candidate in _instances:
+            return _instances[candidate]
+        backend_cls = _BACKENDS.get(candidate)
+        if backend_cls is None:
+            logger.warning(f"알 수 없는 HTML 텍스트 백엔드: {candidate}")
+            continue
+        try:
+            _instances[candidate] = backend_cls()
+            return _instances[candidate]
+        except ImportError as e:
+            logger.warning(f"HTML 텍스트 백엔드 '{candidate}'를 사용할 수 없습니다: {str(e)}")
+    raise RuntimeError("사용 가능한 HTML 텍스트 백엔드가 없습니다.")
+
+
+def html_to_text(html: str, backend: Optional[HtmlTextBackend] = None) -> str:
+    """
+    기본 백엔드로 텍스트를 추출하고, 실패하면 BeautifulSoup 백엔드로 다시 시도합니다.
+    블록 요소(BLOCK_TAGS)마다 줄을 바꾸고, 한 줄 안의 공백은 하나로 합칩니다.
+    """
+    backend = backend or get_html_text_backend()
+    try:
+        return backend.extract(html)
+    except Exception as e:
+        if backend.name == BeautifulSoupBackend.name:
+            raise
+        logger.warning(f"{backend.name} 파싱 실패, BeautifulSoup으로 재시도: {str(e)}")
+        return get_html_text_backend(BeautifulSoupBackend.name).extract(html)
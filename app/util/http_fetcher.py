@@ -0,0 +1,232 @@
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger("app")
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; PotenCheckBot/1.0; +https://potencheck.site)"
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)", re.IGNORECASE)
+
+
+class ResponseTooLargeError(ValueError):
+    """응답 본문이 허용된 최대 크기를 넘었을 때 발생합니다."""
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status_code: int
+    content: bytes
+    text: str
+    content_type: str
+    encoding: str
+    from_cache: bool = False
+
+
+@dataclass
+class _CacheEntry:
+    result: FetchResult
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+    size: int = field(init=False)
+
+    def __post_init__(self):
+        self.size = len(self.result.content)
+
+
+class ResponseCache:
+    """ETag / Last-Modified 재검증을 위한 작은 LRU 응답 캐시입니다."""
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def get(self, url: str) -> Optional[_CacheEntry]:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def put(self, url: str, entry: _CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._entries[url] = entry
+        self._bytes += entry.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
+
+
+def _decode(content: bytes, content_type: str) -> Tuple[str, str]:
+    """Content-Type 헤더 → HTML meta 태그 → UTF-8 순서로 문자셋을 결정해 디코딩합니다."""
+    candidates = []
+    header_match = _CHARSET_RE.search(content_type or "")
+    if header_match:
+        candidates.append(header_match.group(1))
+    meta_match = _META_CHARSET_RE.search(content[:4096])
+    if meta_match:
+        candidates.append(meta_match.group(1).decode("ascii", "ignore"))
+    candidates.append("utf-8")
+
+    for encoding in candidates:
+        try:
+            return content.decode(encoding), encoding
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return content.decode("utf-8", errors="replace"), "utf-8"
+
+
+def _freshness(headers: httpx.Headers) -> float:
+    """Cache-Control max-age 기준으로 응답이 신선한 시간(초)을 반환합니다."""
+    cache_control = headers.get("Cache-Control", "")
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    return float(match.group(1)) if match else 0.0
+
+
+class StaticFetcher:
+    """
+    커넥션 풀을 공유하는 비동기 정적 페이지 fetcher입니다.
+    스트리밍 중 최대 크기를 강제하고, 응답을 캐시해 ETag/Last-Modified로 재검증합니다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 2 * 1024 * 1024,
+        timeout: float = 10.0,
+        max_connections: int = 50,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.cache = cache or ResponseCache()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections // 2,
+                ),
+                headers={"User-Agent": DEFAULT_USER_AGENT},
+            )
+        return self._client
+
+    async def fetch(self, url: str, timeout: Optional[float] = None) -> FetchResult:
+        entry = self.cache.get(url)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self.cache.hits += 1
+            logger.debug(f"캐시된 응답 사용: {url}")
+            return entry.result
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        async with self.client.stream("GET", url, headers=headers, timeout=timeout or self.timeout) as response:
+            if response.status_code == 304 and entry is not None:
+                self.cache.revalidated += 1
+                entry.expires_at = time.monotonic() + _freshness(response.headers)
+                logger.debug(f"캐시 재검증 완료(304): {url}")
+                return entry.result
+
+            response.raise_for_status()
+
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+                raise ResponseTooLargeError(f"응답 크기가 너무 큽니다: {content_length} 바이트 (최대 {self.max_bytes})")
+
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > self.max_bytes:
+                    raise ResponseTooLargeError(f"응답 크기가 최대 {self.max_bytes} 바이트를 초과했습니다")
+                chunks.append(chunk)
+
+        content = b"".join(chunks)
+        content_type = response.headers.get("Content-Type", "")
+        text, encoding = _decode(content, content_type)
+        result = FetchResult(
+            url=str(response.url),
+            status_code=response.status_code,
+            content=content,
+            text=text,
+            content_type=content_type,
+            encoding=encoding,
+        )
+
+        self.cache.misses += 1
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        freshness = _freshness(response.headers)
+        if "no-store" not in response.headers.get("Cache-Control", "") and (etag or last_modified or freshness):
+            cached_result = FetchResult(**{**result.__dict__, "from_cache": True})
+            self.cache.put(url, _CacheEntry(cached_result, etag, last_modified, time.monotonic() + freshness))
+
+        return result
+
+    async def post_json(self, url: str, payload: Dict, timeout: Optional[float] = None) -> Dict:
+        """JSON 요청을 보내고 크기 제한을 적용해 JSON 응답을 반환합니다 (캐시하지 않음)."""
+        async with self.client.stream("POST", url, json=payload, timeout=timeout or self.timeout) as response:
+            response.raise_for_status()
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > self.max_bytes:
+                    raise ResponseTooLargeError(f"응답 크기가 최대 {self.max_bytes} 바이트를 초과했습니다")
+                chunks.append(chunk)
+        return json.loads(b"".join(chunks))
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_static_fetcher: Optional[StaticFetcher] = None
+
+
+def get_static_fetcher() -> StaticFetcher:
+    """프로세스 전체에서 공유하는 StaticFetcher를 반환합니다."""
+    global _static_fetcher
+    if _static_fetcher is None:
+        _static_fetcher = StaticFetcher()
+    return _static_fetcher
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger("app")
+
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+# 이벤트 루프가 이 시간 이상 멈추면 멈춘 지점의 스택을 남긴다
+LOOP_BLOCK_THRESHOLD_SECONDS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100")) / 1000
+# 하트비트 간격. 지연 시간은 이 간격으로 잰다.
+LOOP_MONITOR_INTERVAL_SECONDS = float(os.getenv("LOOP_MONITOR_INTERVAL_MS", "20")) / 1000
+# 보관할 최근 블로킹 기록 수와 기록마다 남길 스택 프레임 수
+LOOP_BLOCK_HISTORY = int(os.getenv("LOOP_BLOCK_HISTORY", "50"))
+LOOP_BLOCK_STACK_DEPTH = 30
+
+# 지연 시간 히스토그램 구간 상한(ms)
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class EventLoopBlocked(AssertionError):
+    """watch_event_loop 블록 안에서 이벤트 루프가 기준 시간 이상 멈췄을 때 발생합니다."""
+
+    def __init__(self, blocks: List[Dict]):
+        self.blocks = blocks
+        worst = max(blocks, key=lambda block: block["duration_ms"])
+        stack = "".join(worst["stack"] or ["(스택 없음)\n"])
+        super().__init__(
+            f"이벤트 루프가 {len(blocks)}번 멈췄습니다. 가장 긴 블로킹 {worst['duration_ms']}ms:\n{stack}"
+        )
+
+
+class LoopMonitor:
+    """
+    이벤트 루프 지연 감시기입니다.
+
+    - 루프 안의 하트비트 작업이 interval마다 깨어나, 예정보다 늦게 깨어난 만큼을 지연 시간으로 히스토그램에 기록합니다.
+    - 별도 감시 스레드가 마지막 하트비트 이후 threshold 이상 지나면 그 순간 루프 스레드의 스택을 떠 둡니다.
+      루프를 막고 있는 동기 호출(requests.post, PyPDF2 등)과 그것을 부른 코루틴이 스택에 그대로 보입니다.
+    - 하트비트가 다시 돌면 멈춘 시간과 떠 둔 스택을 블로킹 기록으로 남기고 경고 로그를 씁니다.
+    """
+
+    def __init__(
+        self,
+        threshold: float = LOOP_BLOCK_THRESHOLD_SECONDS,
+        interval: float = LOOP_MONITOR_INTERVAL_SECONDS,
+        history: int = LOOP_BLOCK_HISTORY,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.lag_buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.max_lag_ms = 0.0
+        self.beats = 0
+        self.blocks: Deque[Dict] = deque(maxlen=history)
+        self.block_count = 0
+
+        self._lock = threading.Lock()
+        self._last_beat = 0.0
+        self._pending_stack: Optional[List[str]] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """실행 중인 이벤트 루프에서 감시를 시작합니다."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat(), name="loop-monitor")
+        self._watcher = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watcher.start()
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._stop_event.set()
+        self._watcher.join()
+        # 마지막 하트비트 뒤에 멈춘 구간도 기록한다
+        self._beat(time.monotonic(), self._last_beat + self.interval)
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self._beat(time.monotonic(), expected)
+
+    def _beat(self, now: float, expected: float) -> None:
+        lag = max(0.0, now - expected)
+        lag_ms = lag * 1000
+        self.beats += 1
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self.lag_buckets[_bucket_index(lag_ms)] += 1
+
+        with self._lock:
+            stack, self._pending_stack = self._pending_stack, None
+            self._last_beat = now
+        if lag < self.threshold:
+            return
+
+        block = {
+            "started_at": round(time.time() - lag, 3),
+            "duration_ms": round(lag_ms, 1),
+            # 감시 스레드가 확인하기 전에 풀린 짧은 블로킹은 스택이 없다
+            "stack": stack,
+        }
+        self.blocks.append(block)
+        self.block_count += 1
+        logger.warning(
+            f"이벤트 루프가 {lag_ms:.0f}ms 동안 멈춤"
+            + (f":\n{''.join(stack)}" if stack else " (스택 없음)")
+        )
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            with self._lock:
+                stalled = time.monotonic() - self._last_beat - self.interval
+                if stalled < self.threshold or self._pending_stack is not None:
+                    continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.format_stack(frame)[-LOOP_BLOCK_STACK_DEPTH:]
+            with self._lock:
+                # 스택을 뜨는 사이 루프가 풀렸으면 이미 끝난 블로킹이므로 버린다
+                if time.monotonic() - self._last_beat - self.interval >= self.threshold:
+                    self._pending_stack = stack
+
+    def stats(self) -> Dict:
+        labels = [f"le_{bound}ms" for bound in LAG_BUCKETS_MS] + ["inf"]
+        return {
+            "running": self.running,
+            "threshold_ms": self.threshold * 1000,
+            "beats": self.beats,
+            "max_lag_ms": round(self.max_lag_ms, 1),
+            "lag_histogram": dict(zip(labels, self.lag_buckets)),
+            "blocks": self.block_count,
+            "recent_blocks": list(self.blocks)[-10:],
+        }
+
+
+def _bucket_index(lag_ms: float) -> int:
+    for i, bound in enumerate(LAG_BUCKETS_MS):
+        if lag_ms <= bound:
+            return i
+    return len(LAG_BUCKETS_MS)
+
+
+@asynccontextmanager
+async def watch_event_loop(threshold: float = 0.1, interval: float = 0.01):
+    """
+    블록 안에서 이벤트 루프가 threshold(초) 이상 멈추면 EventLoopBlocked를 발생시킵니다.
+    테스트에서 핸들러가 루프를 막지 않는지 확인할 때 씁니다.
+
+        async with watch_event_loop():
+            await create_report(...)
+    """
+    monitor = LoopMonitor(threshold=threshold, interval=interval)
+    monitor.start()
+    try:
+        yield monitor
+    finally:
+        await monitor.stop()
+    if monitor.blocks:
+        raise EventLoopBlocked(list(monitor.blocks))
+
+
+_loop_monitor: Optional[LoopMonitor] = None
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """프로세스 전체에서 공유하는 LoopMonitor를 반환합니다."""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopMonitor()
+    return _loop_monitor
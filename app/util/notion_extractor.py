@@ -0,0 +1,200 @@
+import logging
+import os
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+from app.util.http_fetcher import get_static_fetcher
+
+logger = logging.getLogger("app")
+
+# 공개 Notion 페이지 데이터 API 주소 (테스트 시 로컬 픽스처 서버로 대체)
+NOTION_API_BASE = os.getenv("NOTION_API_BASE", "")
+
+_PAGE_ID_RE = re.compile(r"([0-9a-f]{32})$|([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$", re.IGNORECASE)
+
+# 블록 유형별 텍스트 접두사 (없으면 접두사 없이 출력)
+BLOCK_PREFIXES = {
+    "header": "# ",
+    "sub_header": "## ",
+    "sub_sub_header": "### ",
+    "bulleted_list": "- ",
+    "numbered_list": "1. ",
+    "to_do": "[ ] ",
+    "quote": "> ",
+}
+
+CONTAINER_TYPES = frozenset({"column_list", "column", "table"})
+
+MAX_CHUNKS = 10
+MAX_BLOCKS = 3000
+SYNC_BATCH_SIZE = 100
+NOTION_DOMAINS = ("notion.site", "notion.so")
+
+
+def is_notion_url(url: str) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == domain or host.endswith("." + domain) for domain in NOTION_DOMAINS)
+
+
+def parse_page_id(url: str) -> Optional[str]:
+    """Notion URL에서 페이지 ID를 찾아 하이픈이 포함된 UUID 형식으로 반환합니다."""
+    parsed = urlparse(url)
+    candidates = parse_qs(parsed.query).get("p", []) + [parsed.path.rstrip("/").split("/")[-1]]
+    for candidate in candidates:
+        match = _PAGE_ID_RE.search(candidate)
+        if not match:
+            continue
+        raw = (match.group(1) or match.group(2)).replace("-", "").lower()
+        return f"{raw[:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:]}"
+    return None
+
+
+def _record_value(record: Dict) -> Optional[Dict]:
+    # 응답 형식에 따라 {"value": {...}} 또는 {"value": {"value": {...}, "role": ...}} 구조
+    value = record.get("value") if isinstance(record, dict) else None
+    if isinstance(value, dict) and isinstance(value.get("value"), dict):
+        value = value["value"]
+    return value
+
+
+def _rich_text(segments) -> str:
+    if not isinstance(segments, list):
+        return ""
+    return "".join(segment[0] for segment in segments if isinstance(segment, list) and segment and isinstance(segment[0], str))
+
+
+def blocks_to_text(blocks: Dict[str, Dict], root_id: str) -> str:
+    """recordMap.block 사전을 루트 페이지부터 깊이 우선으로 순회해 텍스트로 변환합니다."""
+    lines: List[str] = []
+    stack = [(root_id, 0)]
+    visited = set()
+
+    while stack:
+        block_id, depth = stack.pop()
+        if block_id in visited or block_id not in blocks:
+            continue
+        visited.add(block_id)
+
+        block = blocks[block_id]
+        block_type = block.get("type", "")
+        properties = block.get("properties") or {}
+
+        if block_type == "table_row":
+            text = " | ".join(_rich_text(cell) for cell in properties.values())
+        else:
+            text = _rich_text(properties.get("title"))
+
+        if text.strip():
+            prefix = BLOCK_PREFIXES.get(block_type, "")
+            lines.append("  " * depth + prefix + text.strip())
+
+        # 하위 페이지는 제목만 포함하고 내용은 따라가지 않음
+        if block_type == "page" and block_id != root_id:
+            continue
+
+        # 컬럼/표 같은 레이아웃 블록의 자식은 들여쓰지 않음
+        if block_id == root_id or block_type in CONTAINER_TYPES:
+            child_depth = depth
+        else:
+            child_depth = depth + 1
+        for child_id in reversed(block.get("content") or []):
+            stack.append((child_id, child_depth))
+
+    return "\n".join(lines)
+
+
+class NotionExtractor:
+    """공개 Notion 페이지의 블록 데이터를 HTTP API로 받아 브라우저 없이 텍스트로 변환합니다."""
+
+    def __init__(self, api_base: Optional[str] = None, timeout: float = 10.0):
+        self.api_base = api_base or NOTION_API_BASE
+        self.timeout = timeout
+
+    def _api_url(self, url: str, endpoint: str) -> str:
+        if self.api_base:
+            return f"{self.api_base.rstrip('/')}/{endpoint}"
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}/api/v3/{endpoint}"
+
+    async def _load_blocks(self, url: str, page_id: str, timeout: float) -> Dict[str, Dict]:
+        fetcher = get_static_fetcher()
+        blocks: Dict[str, Dict] = {}
+        cursor = {"stack": []}
+
+        # 1) loadPageChunk로 페이지 블록을 청크 단위로 수집
+        for chunk_number in range(MAX_CHUNKS):
+            data = await fetcher.post_json(
+                self._api_url(url, "loadPageChunk"),
+                {
+                    "pageId": page_id,
+                    "limit": 100,
+                    "cursor": cursor,
+                    "chunkNumber": chunk_number,
+                    "verticalColumns": False,
+                },
+                timeout=timeout,
+            )
+            for block_id, record in (data.get("recordMap", {}).get("block") or {}).items():
+                value = _record_value(record)
+                if value:
+                    blocks[block_id] = value
+
+            cursor = data.get("cursor") or {"stack": []}
+            if not cursor.get("stack") or len(blocks) >= MAX_BLOCKS:
+                break
+
+        # 2) 청크에 포함되지 않은 하위 블록은 syncRecordValues로 보충
+        for _ in range(MAX_CHUNKS):
+            missing = [
+                child_id
+                for block in blocks.values()
+                if block.get("type") != "page" or block.get("id") == page_id
+                for child_id in (block.get("content") or [])
+                if child_id not in blocks
+            ]
+            if not missing or len(blocks) >= MAX_BLOCKS:
+                break
+
+            found = 0
+            for i in range(0, len(missing), SYNC_BATCH_SIZE):
+                data = await fetcher.post_json(
+                    self._api_url(url, "syncRecordValues"),
+                    {
+                        "requests": [
+                            {"pointer": {"table": "block", "id": block_id}, "version": -1}
+                            for block_id in missing[i:i + SYNC_BATCH_SIZE]
+                        ]
+                    },
+                    timeout=timeout,
+                )
+                for block_id, record in (data.get("recordMap", {}).get("block") or {}).items():
+                    value = _record_value(record)
+                    if value:
+                        blocks[block_id] = value
+                        found += 1
+            if found == 0:
+                break
+
+        return blocks
+
+    async def extract_text(self, url: str, timeout: Optional[float] = None) -> str:
+        """
+        Notion 페이지 텍스트를 반환합니다. 페이지 ID를 찾을 수 없거나 API 호출이 실패하면 ValueError가 발생합니다.
+        timeout은 API 요청 하나당 제한(초)이며, 없으면 생성 시 지정한 값을 사용합니다.
+        """
+        page_id = parse_page_id(url)
+        if not page_id:
+            raise ValueError(f"Notion 페이지 ID를 찾을 수 없습니다: {url}")
+
+        try:
+            blocks = await self._load_blocks(url, page_id, timeout or self.timeout)
+        except Exception as e:
+            raise ValueError(f"Notion 페이지 데이터를 불러올 수 없습니다: {str(e)}")
+
+        if page_id not in blocks:
+            raise ValueError(f"Notion 페이지 블록을 찾을 수 없습니다: {page_id}")
+
+        text = blocks_to_text(blocks, page_id)
+        logger.info(f"Notion API에서 추출된 텍스트 길이: {len(text)} 문자 (블록 {len(blocks)}개)")
+        return text
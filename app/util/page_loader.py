@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from typing import Dict
+from urllib.parse import urlparse
+
+logger = logging.getLogger("app")
+
+# 텍스트 추출에 필요 없는 리소스 유형
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# 차단할 서드파티 트래커/분석 도메인 (하위 도메인 포함)
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "segment.io",
+    "segment.com",
+    "amplitude.com",
+    "mixpanel.com",
+    "hotjar.com",
+    "intercom.io",
+    "sentry.io",
+    "datadoghq.com",
+    "nr-data.net",
+    "clarity.ms",
+    "statsig.com",
+)
+
+# MutationObserver로 DOM 변경이 quietMs 동안 없으면 완료, timeoutMs가 지나면 강제 종료
+WAIT_FOR_DOM_QUIET_JS = """
+({quietMs, timeoutMs}) => new Promise((resolve) => {
+    const start = performance.now();
+    let mutations = 0;
+    let quietTimer = null;
+    let deadlineTimer = null;
+    const observer = new MutationObserver((records) => {
+        mutations += records.length;
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => done("quiet"), quietMs);
+    });
+    const done = (reason) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadlineTimer);
+        resolve({reason, mutations, elapsed: Math.round(performance.now() - start)});
+    };
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    quietTimer = setTimeout(() => done("quiet"), quietMs);
+    deadlineTimer = setTimeout(() => done("deadline"), timeoutMs);
+})
+"""
+
+
+def is_tracker_url(url: str) -> bool:
+    host = urlparse(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in TRACKER_DOMAINS)
+
+
+async def _route_handler(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or is_tracker_url(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_heavy_resources(context) -> None:
+    """이미지/미디어/폰트와 트래커 요청을 차단하는 라우트를 브라우저 컨텍스트에 등록합니다."""
+    await context.route("**/*", _route_handler)
+
+
+async def wait_for_dom_quiet(page, quiet_ms: int = 300, timeout_ms: int = 3000) -> Dict:
+    """
+    DOM 변경이 quiet_ms 동안 멈출 때까지 기다립니다. timeout_ms가 지나면 그대로 진행합니다.
+
+    Returns:
+        {"reason": "quiet" | "deadline" | "error", "mutations": int, "elapsed": int(ms)}
+    """
+    try:
+        # 페이지 쪽 타이머가 동작하지 않는 경우를 대비해 파이썬 쪽에도 데드라인을 둔다
+        return await asyncio.wait_for(
+            page.evaluate(WAIT_FOR_DOM_QUIET_JS, {"quietMs": quiet_ms, "timeoutMs": timeout_ms}),
+            timeout=timeout_ms / 1000 + 1,
+        )
+    except Exception as e:
+        logger.debug(f"DOM 안정화 대기 중 오류: {str(e)}")
+        return {"reason": "error", "mutations": 0, "elapsed": timeout_ms}
@@ -1,22 +1,133 @@
+import asyncio
+import hashlib
+import io
 import logging
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List, Optional, BinaryIO, Tuple
+
 from fastapi import UploadFile
-import PyPDF2
+
+from app.util.single_flight import get_single_flight
+from app.util.tracing import span
+
+if TYPE_CHECKING:
+    import PyPDF2
 
 logger = logging.getLogger("app")
 
+# 이력서는 보통 10페이지 이내이므로 그 이후 페이지는 읽지 않는다
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "10"))
+# 추출 텍스트 상한 (도달하면 남은 페이지는 건너뛴다)
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "30000"))
+# 페이지 병렬 추출 워커 수와 병렬 처리를 시작할 최소 페이지 수
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", "4"))
+PARALLEL_MIN_PAGES = 4
+# 페이지 사이에 넣는 구분 문자 (pdftotext와 같은 form feed). 이력서 정규화에서 페이지별 머리글/바닥글을 찾을 때 쓴다.
+PAGE_SEPARATOR = "\f"
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=PDF_EXTRACT_WORKERS, thread_name_prefix="pdf-extract")
+        return _executor
+
+
+def read_upload(file: UploadFile) -> Tuple[bytes, str]:
+    """업로드 파일 내용을 메모리로 읽어 sha256 해시와 함께 반환하고 파일 포인터를 되돌립니다."""
+    file.file.seek(0)
+    data = file.file.read()
+    file.file.seek(0)
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def file_size(file: UploadFile) -> int:
+    """파일 내용을 읽지 않고 크기를 구합니다."""
+    file.file.seek(0, os.SEEK_END)
+    size = file.file.tell()
+    file.file.seek(0)
+    return size
+
+
+def _stream_factory(file: UploadFile) -> Callable[[], BinaryIO]:
+    """
+    워커 스레드마다 독립된 읽기 스트림을 만드는 함수를 반환합니다.
+    PdfReader는 스트림 위치를 공유하므로 스레드 간에 같은 파일 객체를 쓸 수 없습니다.
+    메모리에 있는 업로드는 같은 bytes 버퍼를, 디스크로 넘어간 업로드는 mmap을 공유해 복사하지 않습니다.
+    """
+    raw = file.file
+    inner = getattr(raw, "_file", raw)  # SpooledTemporaryFile 내부 파일
+
+    if isinstance(inner, io.BytesIO):
+        data = inner.getvalue()
+        return lambda: io.BytesIO(data)
+
+    fileno = inner.fileno()
+    return lambda: mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+
+def _extract_page(reader: "PyPDF2.PdfReader", index: int) -> str:
+    try:
+        page_text = reader.pages[index].extract_text() or ""
+        logger.debug(f"페이지 {index + 1} 텍스트 길이: {len(page_text)} 문자")
+        return page_text
+    except Exception as page_error:
+        logger.error(f"페이지 {index + 1} 텍스트 추출 오류: {str(page_error)}")
+        return ""
+
+
+class _ThreadLocalReaders:
+    """워커 스레드별로 PdfReader를 한 번만 열고, 끝나면 스트림을 닫습니다."""
+
+    def __init__(self, open_stream: Callable[[], BinaryIO]):
+        self._open_stream = open_stream
+        self._local = threading.local()
+        self._streams: List[BinaryIO] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> "PyPDF2.PdfReader":
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            stream = self._open_stream()
+            with self._lock:
+                self._streams.append(stream)
+            from PyPDF2 import PdfReader
+            reader = self._local.reader = PdfReader(stream)
+        return reader
+
+    def close(self) -> None:
+        for stream in self._streams:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
 
 class PDFExtractor:
     @staticmethod
-    def extract_text_from_pdf(file: UploadFile) -> str:
+    def extract_text_from_pdf(
+        file: UploadFile,
+        max_pages: int = PDF_MAX_PAGES,
+        max_chars: int = PDF_MAX_CHARS,
+    ) -> str:
+        """
+        업로드된 PDF에서 최대 max_pages 페이지, max_chars 문자까지 텍스트를 추출합니다.
+        페이지가 많으면 워커 스레드에서 페이지 단위로 나눠 추출하고, 문자 상한에 도달하면 중단합니다.
+        """
         try:
-            # 파일 내용을 읽고 포인터 위치 리셋
-            file_content = file.file.read()
-            file.file.seek(0)
-
-            logger.info(f"PDF 파일 크기: {len(file_content)} 바이트")
+            size = file_size(file)
+            logger.info(f"PDF 파일 크기: {size} 바이트")
 
-            # PDF 읽기
-            pdf_reader = PyPDF2.PdfReader(file.file)
+            # PDF 읽기 (PyPDF2는 import에 50ms 정도 걸려 처음 PDF를 받을 때 가져온다)
+            from PyPDF2 import PdfReader
+            pdf_reader = PdfReader(file.file)
             page_count = len(pdf_reader.pages)
             logger.info(f"PDF 페이지 수: {page_count}")
 
@@ -24,18 +135,23 @@ class PDFExtractor:
                 logger.warning("PDF에 페이지가 없습니다.")
                 return ""
 
-            text = ""
-            for i, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text() or ""
-                    text += page_text
-                    logger.info(f"페이지 {i + 1} 텍스트 길이: {len(page_text)} 문자")
-                except Exception as page_error:
-                    logger.error(f"페이지 {i + 1} 텍스트 추출 오류: {str(page_error)}")
+            pages_to_read = min(page_count, max_pages)
+            if pages_to_read < page_count:
+                logger.info(f"페이지 상한 적용: 앞의 {pages_to_read}페이지만 추출합니다.")
+
+            if pages_to_read >= PARALLEL_MIN_PAGES and PDF_EXTRACT_WORKERS > 1:
+                parts = PDFExtractor._extract_pages_parallel(file, pages_to_read, max_chars)
+            else:
+                parts = PDFExtractor._extract_pages_sequential(pdf_reader, pages_to_read, max_chars)
+
+            text = PAGE_SEPARATOR.join(parts)
+            if len(text) > max_chars:
+                logger.info(f"문자 상한 적용: {len(text)} → {max_chars} 문자")
+                text = text[:max_chars]
 
             # 추출된 텍스트 로깅
             total_text_length = len(text)
-            logger.info(f"전체 추출된 텍스트 길이: {total_text_length} 문자")
+            logger.info(f"전체 추출된 텍스트 길이: {total_text_length} 문자 ({len(parts)}/{page_count} 페이지)")
 
             if total_text_length == 0:
                 logger.warning("PDF에서 텍스트를 추출할 수 없습니다. 이미지 기반 PDF일 수 있습니다.")
@@ -48,4 +164,56 @@ class PDFExtractor:
 
         except Exception as e:
             logger.error(f"PDF 처리 중 오류 발생: {str(e)}")
-            raise e
\ No newline at end of file
+            raise e
+
+    @staticmethod
+    def _extract_pages_sequential(pdf_reader: "PyPDF2.PdfReader", pages_to_read: int, max_chars: int) -> List[str]:
+        parts: List[str] = []
+        total = 0
+        for i in range(pages_to_read):
+            page_text = _extract_page(pdf_reader, i)
+            parts.append(page_text)
+            total += len(page_text)
+            if total >= max_chars:
+                break
+        return parts
+
+    @staticmethod
+    def _extract_pages_parallel(file: UploadFile, pages_to_read: int, max_chars: int) -> List[str]:
+        """워커 수만큼의 페이지 묶음을 순서대로 처리하고, 묶음이 끝날 때마다 문자 상한을 확인합니다."""
+        executor = _get_executor()
+        readers = _ThreadLocalReaders(_stream_factory(file))
+        parts: List[str] = []
+        total = 0
+        try:
+            for start in range(0, pages_to_read, PDF_EXTRACT_WORKERS):
+                indexes = range(start, min(start + PDF_EXTRACT_WORKERS, pages_to_read))
+                batch = list(executor.map(lambda i: _extract_page(readers.get(), i), indexes))
+                parts.extend(batch)
+                total += sum(len(page_text) for page_text in batch)
+                if total >= max_chars:
+                    break
+        finally:
+            readers.close()
+        return parts
+
+
+def _extract_bytes(data: bytes, filename: Optional[str]) -> str:
+    return PDFExtractor.extract_text_from_pdf(UploadFile(io.BytesIO(data), filename=filename))
+
+
+async def _extract_shared(data: bytes, filename: Optional[str]) -> str:
+    async with span("resume.pdf", filename=filename) as pdf_span:
+        text = await asyncio.to_thread(_extract_bytes, data, filename)
+        pdf_span.set("chars", len(text))
+    return text
+
+
+async def extract_text_shared(data: bytes, digest: str, filename: Optional[str] = None) -> str:
+    """
+    read_upload()로 읽은 PDF 내용에서 텍스트를 추출합니다. 같은 내용(digest)을 동시에 추출하는 호출들은 하나의 작업을 공유합니다.
+    공유 작업은 요청의 UploadFile이 아니라 이 버퍼를 읽고 어느 호출자의 기한에도 묶이지 않으므로,
+    먼저 온 요청이 기한 초과로 끝나거나 파일을 닫아도 다른 호출자는 영향을 받지 않습니다.
+    기한은 호출자가 deadline.run()으로 자신의 대기에만 적용합니다.
+    """
+    return await get_single_flight("pdf_text").do(digest, lambda: _extract_shared(data, filename))
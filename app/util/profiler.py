@@ -0,0 +1,223 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Optional
+
+from app.util.tracing import current_trace_id, is_valid_trace_id
+
+logger = logging.getLogger("app")
+
+# 요청을 무작위로 골라 프로파일링할 비율 (0이면 X-Profile 헤더로 요청한 경우만)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_INTERVAL_SECONDS = float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000
+# 동시에 프로파일링할 최대 요청 수와 보관할 최대 프로파일 수
+PROFILE_MAX_CONCURRENT = int(os.getenv("PROFILE_MAX_CONCURRENT", "2"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "200"))
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+
+# 맨 위 프레임이 이 함수들이면 일을 하지 않고 기다리는 스레드로 보고 따로 센다
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),  # 이벤트 루프가 I/O를 기다리는 중
+    ("threading.py", "wait"),
+    ("thread.py", "_worker"),  # 일감을 기다리는 ThreadPoolExecutor 워커
+    ("queue.py", "get"),
+}
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler(threading.Thread):
+    """
+    interval마다 sys._current_frames()로 모든 스레드의 스택을 떠서 folded 형식(스레드;바깥 프레임;...;안쪽 프레임)으로 셉니다.
+    결과는 flamegraph.pl이나 speedscope에서 그대로 읽을 수 있습니다.
+    같은 프로세스의 다른 요청도 함께 잡히므로, 스레드 이름으로 이벤트 루프(MainThread)와 워커 스레드를 구분해서 봅니다.
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL_SECONDS):
+        super().__init__(name="profiler", daemon=True)
+        self.interval = interval
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == self.ident:
+                continue
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+                self.idle_samples += 1
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            self.counts[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+
+class ProfileStore:
+    """
+    {profile_id}.folded(스택) 과 {profile_id}.json(요청 정보) 파일로 프로파일을 저장합니다.
+    trace id는 클라이언트가 X-Request-ID로 정할 수 있어 기존 파일을 덮어쓸 수 있으므로, 파일 이름에는 서버가 만든 id를 씁니다.
+    """
+
+    def __init__(self, directory: str = PROFILE_DIR, max_files: int = PROFILE_MAX_FILES):
+        self.directory = directory
+        self.max_files = max_files
+
+    def _path(self, profile_id: str, suffix: str) -> str:
+        if not is_valid_trace_id(profile_id):
+            raise ValueError(f"잘못된 프로파일 id: {profile_id}")
+        return os.path.join(self.directory, f"{profile_id}{suffix}")
+
+    def save(self, profile_id: str, sampler: StackSampler, meta: Dict) -> None:
+        """파일을 쓰고 오래된 프로파일을 지우므로 이벤트 루프 밖(asyncio.to_thread)에서 호출합니다."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(profile_id, ".folded"), "w", encoding="utf-8") as f:
+            f.write(sampler.folded())
+        meta = {**meta, "profile_id": profile_id, "samples": sampler.samples, "idle_samples": sampler.idle_samples}
+        with open(self._path(profile_id, ".json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        self._prune()
+
+    def _prune(self) -> None:
+        metas = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in metas[:max(0, len(metas) - self.max_files)]:
+            profile_id = entry.name[:-len(".json")]
+            for suffix in (".json", ".folded"):
+                try:
+                    os.unlink(self._path(profile_id, suffix))
+                except (OSError, ValueError):
+                    pass
+
+    def list(self) -> List[Dict]:
+        """저장된 프로파일 정보를 최신순으로 반환합니다."""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        profiles.append(json.load(f))
+                except (OSError, json.JSONDecodeError):
+                    continue
+        return sorted(profiles, key=lambda meta: meta.get("started_at", 0), reverse=True)
+
+    def folded_path(self, profile_id: str) -> Optional[str]:
+        path = self._path(profile_id, ".folded")
+        return path if os.path.exists(path) else None
+
+
+class ProfilingMiddleware:
+    """
+    요청 단위 통계 프로파일링 ASGI 미들웨어입니다.
+    관리자가 X-Admin-Token과 함께 X-Profile: 1 헤더를 보내거나 PROFILE_SAMPLE_RATE 비율로 뽑힌 요청만
+    StackSampler로 감싸고, 결과를 새 프로파일 id로 저장한 뒤 응답에 X-Profile-Id 헤더를 붙입니다.
+    프로파일링하지 않는 요청은 헤더 확인만 하고 그대로 넘깁니다.
+    TracingMiddleware 안쪽에 있어야 요청의 trace id를 프로파일 정보에 남길 수 있습니다.
+    """
+
+    def __init__(self, app, store: Optional[ProfileStore] = None):
+        self.app = app
+        self.store = store or get_profile_store()
+        self._active = 0
+
+    def _requested(self, scope) -> bool:
+        profile = token = None
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_HEADER:
+                profile = value
+            elif name == ADMIN_TOKEN_HEADER:
+                token = value
+        if profile is not None and profile not in (b"0", b"false"):
+            # 순환 import를 피하려고 프로파일 요청이 있을 때만 가져온다
+            from app.dependencies.dependency import is_admin_token
+            return token is not None and is_admin_token(token.decode("latin-1"))
+        return PROFILE_SAMPLE_RATE > 0 and not scope["path"].startswith("/admin") and random.random() < PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if self._active >= PROFILE_MAX_CONCURRENT:
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": None}
+        trace_id = current_trace_id()
+        profile_id = uuid.uuid4().hex
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        self._active += 1
+        sampler = StackSampler()
+        started_at = time.time()
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            self._active -= 1
+            meta = {
+                "trace_id": trace_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status["code"],
+                "started_at": round(started_at, 3),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+                "interval_ms": sampler.interval * 1000,
+            }
+            try:
+                await asyncio.to_thread(self.store.save, profile_id, sampler, meta)
+                logger.info(f"프로파일 저장: {profile_id} ({sampler.samples}개 샘플, {meta['duration_ms']}ms)")
+            except OSError as e:
+                logger.warning(f"프로파일 저장 실패: {e}")
+
+
+_profile_store: Optional[ProfileStore] = None
+
+
+def get_profile_store() -> ProfileStore:
+    """프로세스 전체에서 공유하는 ProfileStore를 반환합니다."""
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = ProfileStore()
+    return _profile_store
@@ -0,0 +1,291 @@
+import contextvars
+import fcntl
+import json
+import logging
+import math
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+from app.util.deadline import DeadlineExceeded
+
+logger = logging.getLogger("app")
+
+# 우선순위 클래스 (앞쪽일수록 우선)
+PRIORITY_INTERACTIVE = "interactive"  # 단건 보고서 생성
+PRIORITY_CAREER = "career"  # 경력 추출
+PRIORITY_BATCH = "batch"  # 배치 보고서
+PRIORITY_OFFLINE = "offline"  # jd_analyzer, key_skill_extractor 등 오프라인 파이프라인
+PRIORITY_CLASSES = (PRIORITY_INTERACTIVE, PRIORITY_CAREER, PRIORITY_BATCH, PRIORITY_OFFLINE)
+_ONLINE_CLASSES = (PRIORITY_INTERACTIVE, PRIORITY_CAREER)
+
+# 클래스별로 쓸 수 있는 최대 비율. 자신보다 낮은 우선순위 클래스의 사용량과 합쳐서 계산한다.
+CLASS_SHARES = {
+    PRIORITY_INTERACTIVE: 1.0,
+    PRIORITY_CAREER: 1.0,
+    PRIORITY_BATCH: 0.5,
+    PRIORITY_OFFLINE: 0.5,
+}
+
+# 같은 호스트의 모든 프로세스(API 워커, 오프라인 스크립트)가 함께 쓰는 CLOVA 동시 호출 수. 0이면 사용하지 않는다.
+CLOVA_HOST_QUOTA = int(os.getenv("CLOVA_HOST_QUOTA", "8"))
+QUOTA_STATE_PATH = os.getenv("QUOTA_STATE_PATH", os.path.join(tempfile.gettempdir(), "clova_quota.json"))
+
+# 임대(lease)는 반환되지 않아도 이 시간이 지나면 만료된다 (프로세스가 죽은 경우 대비)
+LEASE_TTL_SECONDS = 180.0
+# 대기자는 폴링할 때마다 갱신하며, 갱신이 끊기면 만료된다
+WAITER_TTL_SECONDS = 5.0
+POLL_INTERVAL_MIN = 0.05
+POLL_INTERVAL_MAX = 0.2
+
+_priority: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("clova_priority", default=None)
+# use_priority() 밖에서 시작된 호출의 우선순위. API 프로세스는 interactive로 정하고, 오프라인 스크립트는 정하지 않는다
+_default_priority: Optional[str] = None
+
+
+def _check_priority(priority: str) -> None:
+    if priority not in CLASS_SHARES:
+        raise ValueError(f"알 수 없는 우선순위 클래스: {priority}")
+
+
+def set_default_priority(priority: Optional[str]) -> None:
+    """use_priority()로 지정하지 않은 CLOVA 호출에 쓸 프로세스 기본 우선순위를 정합니다."""
+    global _default_priority
+    if priority is not None:
+        _check_priority(priority)
+    _default_priority = priority
+
+
+@contextmanager
+def use_priority(priority: str):
+    """블록 안에서 시작되는 CLOVA 호출의 우선순위 클래스를 지정합니다. (asyncio.to_thread로 넘긴 호출에도 적용)"""
+    _check_priority(priority)
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    """
+    현재 CLOVA 호출의 우선순위 클래스입니다. use_priority()도 프로세스 기본값도 없으면 RuntimeError가 발생합니다.
+    (지정을 빠뜨린 호출이 조용히 offline으로 밀리지 않도록)
+    """
+    priority = _priority.get() or _default_priority
+    if priority is None:
+        raise RuntimeError("CLOVA 호출 우선순위가 지정되지 않았습니다. use_priority()나 lease(priority)로 지정하세요.")
+    return priority
+
+
+class QuotaScheduler:
+    """
+    호스트 단위 CLOVA 호출 할당량을 우선순위 클래스별로 나눠 줍니다.
+
+    상태(임대 중인 호출과 대기자)는 JSON 파일에 두고 fcntl 잠금으로 여러 프로세스가 함께 갱신합니다.
+    - 더 높은 우선순위 클래스의 대기자가 있으면 낮은 클래스는 기다립니다. 같은 클래스는 도착 순서대로 받습니다.
+    - 각 클래스는 자신과 그보다 낮은 클래스의 사용량 합이 capacity * CLASS_SHARES를 넘지 않게 받습니다.
+    - offline 클래스의 몫은 온라인(interactive/career) 사용량과 대기자 수만큼 줄어들어,
+      사용자 요청이 늘면 오프라인 작업은 다음 호출부터 자동으로 양보합니다.
+
+        with get_quota_scheduler().lease(PRIORITY_OFFLINE):
+            requests.post(...)
+    """
+
+    def __init__(self, capacity: int, state_path: str = QUOTA_STATE_PATH):
+        self.capacity = capacity
+        self.state_path = state_path
+        self.lock_path = state_path + ".lock"
+        self._host = socket.gethostname()
+        self._stats_lock = threading.Lock()
+        self.granted = Counter()
+        self.timeouts = Counter()
+        self.wait_seconds = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    @contextmanager
+    def _locked_state(self):
+        """상태 파일을 잠그고 읽은 뒤, 블록이 끝나면 저장하고 잠금을 풉니다."""
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                state = self._load()
+                self._purge(state, time.time())
+                yield state
+                self._save(state)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        state.setdefault("leases", {})
+        state.setdefault("waiters", {})
+        return state
+
+    def _save(self, state: Dict) -> None:
+        directory = os.path.dirname(self.state_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".quota-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _is_dead(self, entry: Dict) -> bool:
+        # 같은 호스트(컨테이너)의 프로세스만 생존 여부를 확인할 수 있다
+        if entry.get("host") != self._host:
+            return False
+        try:
+            os.kill(entry["pid"], 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def _purge(self, state: Dict, now: float) -> None:
+        for key in ("leases", "waiters"):
+            entries = state[key]
+            for entry_id in [i for i, e in entries.items() if e["expires"] < now or self._is_dead(e)]:
+                del entries[entry_id]
+
+    def _can_grant(self, state: Dict, waiter_id: str, priority: str) -> bool:
+        rank = PRIORITY_CLASSES.index(priority)
+        me = state["waiters"][waiter_id]
+        for other_id, other in state["waiters"].items():
+            other_rank = PRIORITY_CLASSES.index(other["class"])
+            if other_rank < rank or (other_rank == rank and other["since"] < me["since"] and other_id != waiter_id):
+                return False
+
+        leases = state["leases"].values()
+        if len(leases) >= self.capacity:
+            return False
+
+        share = max(1, math.floor(self.capacity * CLASS_SHARES[priority]))
+        if priority == PRIORITY_OFFLINE:
+            online_demand = sum(1 for e in leases if e["class"] in _ONLINE_CLASSES)
+            online_demand += sum(1 for e in state["waiters"].values() if e["class"] in _ONLINE_CLASSES)
+            share = self.capacity * CLASS_SHARES[priority] - online_demand
+        in_use = sum(1 for e in leases if PRIORITY_CLASSES.index(e["class"]) >= rank)
+        return in_use < share
+
+    def try_acquire(self, waiter_id: str, priority: str, since: float) -> Optional[str]:
+        """한 번 시도해서 임대를 받으면 lease id를, 아니면 None을 반환합니다. 대기자 등록도 함께 갱신합니다."""
+        now = time.time()
+        entry = {"pid": os.getpid(), "host": self._host, "class": priority}
+        with self._locked_state() as state:
+            state["waiters"][waiter_id] = {**entry, "since": since, "expires": now + WAITER_TTL_SECONDS}
+            if not self._can_grant(state, waiter_id, priority):
+                return None
+            del state["waiters"][waiter_id]
+            lease_id = uuid.uuid4().hex
+            state["leases"][lease_id] = {**entry, "expires": now + LEASE_TTL_SECONDS}
+            return lease_id
+
+    def _withdraw(self, waiter_id: str) -> None:
+        with self._locked_state() as state:
+            state["waiters"].pop(waiter_id, None)
+
+    def acquire(self, priority: str, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        임대를 받을 때까지 기다립니다. 워커 스레드나 동기 스크립트에서 호출합니다.
+        timeout(초) 안에 받지 못하면 DeadlineExceeded가 발생합니다.
+        """
+        if not self.enabled:
+            return None
+
+        waiter_id = uuid.uuid4().hex
+        since = time.time()
+        started = time.monotonic()
+        interval = POLL_INTERVAL_MIN
+        try:
+            while True:
+                lease_id = self.try_acquire(waiter_id, priority, since)
+                if lease_id is not None:
+                    break
+                waited = time.monotonic() - started
+                if timeout is not None and waited + interval > timeout:
+                    with self._stats_lock:
+                        self.timeouts[priority] += 1
+                    raise DeadlineExceeded("clova_quota", timeout - waited)
+                time.sleep(interval)
+                interval = min(POLL_INTERVAL_MAX, interval * 2)
+        except BaseException:
+            # 시간 초과나 KeyboardInterrupt로 그만 기다리면 대기자 등록을 지운다
+            self._withdraw(waiter_id)
+            raise
+
+        waited = time.monotonic() - started
+        with self._stats_lock:
+            self.granted[priority] += 1
+            self.wait_seconds[priority] += waited
+        if waited > 1:
+            logger.info(f"[quota] {priority} 호출이 할당량을 {waited:.1f}초 기다렸습니다.")
+        return lease_id
+
+    def acquire_nowait(self, priority: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """
+        기다리지 않고 임대를 한 번 시도해 (받았는지, lease id)를 반환합니다. 할당량이 꺼져 있으면 (True, None)입니다.
+        먼저 기다리는 호출이 있으면 받지 못하므로, 헤지 요청처럼 할당량이 남을 때만 보내는 호출에 씁니다.
+        """
+        if not self.enabled:
+            return True, None
+        waiter_id = uuid.uuid4().hex
+        lease_id = self.try_acquire(waiter_id, priority or current_priority(), time.time())
+        if lease_id is None:
+            self._withdraw(waiter_id)
+            return False, None
+        return True, lease_id
+
+    def release(self, lease_id: Optional[str]) -> None:
+        if lease_id is None:
+            return
+        with self._locked_state() as state:
+            state["leases"].pop(lease_id, None)
+
+    @contextmanager
+    def lease(self, priority: Optional[str] = None, timeout: Optional[float] = None):
+        """할당량 하나를 임대합니다. priority를 생략하면 use_priority()로 지정된 클래스를 사용합니다."""
+        lease_id = self.acquire(priority or current_priority(), timeout)
+        try:
+            yield
+        finally:
+            self.release(lease_id)
+
+    def stats(self) -> Dict:
+        result = {"capacity": self.capacity, "enabled": self.enabled}
+        if self.enabled:
+            with self._locked_state() as state:
+                result["leases"] = dict(Counter(e["class"] for e in state["leases"].values()))
+                result["waiting"] = dict(Counter(e["class"] for e in state["waiters"].values()))
+        with self._stats_lock:
+            result["granted"] = dict(self.granted)
+            result["timeouts"] = dict(self.timeouts)
+            result["avg_wait_seconds"] = {
+                priority: round(self.wait_seconds[priority] / count, 3) for priority, count in self.granted.items()
+            }
+        return result
+
+
+_quota_scheduler: Optional[QuotaScheduler] = None
+_quota_scheduler_lock = threading.Lock()
+
+
+def get_quota_scheduler() -> QuotaScheduler:
+    """프로세스 전체에서 공유하는 QuotaScheduler를 반환합니다."""
+    global _quota_scheduler
+    with _quota_scheduler_lock:
+        if _quota_scheduler is None:
+            _quota_scheduler = QuotaScheduler(CLOVA_HOST_QUOTA)
+        return _quota_scheduler
@@ -0,0 +1,294 @@
+import hashlib
+import ipaddress
+import json
+import logging
+import math
+import os
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger("app")
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# 상태를 유지할 최대 클라이언트 수. 넘으면 가장 오래 요청하지 않은 클라이언트부터 지운다 (지워진 클라이언트는 가득 찬 버킷으로 다시 시작)
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# 클라이언트별로 따로 셀 API 키 (쉼표로 구분). 등록되지 않은 X-API-Key는 무시하고 IP로 센다
+RATE_LIMIT_API_KEYS = os.getenv("RATE_LIMIT_API_KEYS", "")
+# X-Real-IP를 믿을 프록시(nginx)의 주소 대역 (쉼표로 구분). 다른 곳에서 온 연결은 연결 주소로 센다
+RATE_LIMIT_TRUSTED_PROXIES = os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "127.0.0.1/32,::1/128")
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    name: str
+    capacity: float
+    refill_per_second: float
+
+    @property
+    def window_seconds(self) -> int:
+        """빈 버킷이 가득 찰 때까지 걸리는 시간(초)"""
+        return math.ceil(self.capacity / self.refill_per_second)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    name: str
+    method: str
+    path: str
+    bucket: int  # BUCKETS 인덱스
+    cost: float
+    prefix: bool = False
+
+    def matches(self, method: str, path: str) -> bool:
+        if method != self.method:
+            return False
+        return path.startswith(self.path) if self.prefix else path.rstrip("/") == self.path
+
+
+# 버킷: 일반 요청과, 브라우저/CLOVA를 쓰는 추출 요청을 따로 센다
+BUCKETS = (
+    BucketPolicy(
+        "default",
+        capacity=float(os.getenv("RATE_LIMIT_DEFAULT_CAPACITY", "120")),
+        refill_per_second=float(os.getenv("RATE_LIMIT_DEFAULT_REFILL", "2")),
+    ),
+    BucketPolicy(
+        "extract",
+        capacity=float(os.getenv("RATE_LIMIT_EXTRACT_CAPACITY", "30")),
+        refill_per_second=float(os.getenv("RATE_LIMIT_EXTRACT_REFILL", "0.5")),
+    ),
+)
+_DEFAULT_BUCKET, _EXTRACT_BUCKET = 0, 1
+
+# 규칙별 비용은 RATE_LIMIT_COSTS='{"career_link": 15}'처럼 바꿀 수 있다
+_COST_OVERRIDES: Dict[str, float] = json.loads(os.getenv("RATE_LIMIT_COSTS", "{}"))
+
+
+def _rule(name: str, method: str, path: str, bucket: int, cost: float, prefix: bool = False) -> RateLimitRule:
+    return RateLimitRule(name, method, path, bucket, float(_COST_OVERRIDES.get(name, cost)), prefix)
+
+
+RULES = (
+    _rule("career_link", "GET", "/career/experience/link/", _EXTRACT_BUCKET, 10, prefix=True),  # 브라우저 추출 가능
+    _rule("career_extract", "POST", "/career/extract", _EXTRACT_BUCKET, 5),
+    # 배치는 요청이 들어올 때 항목 하나 값을 받고, 핸들러가 항목 수를 확인한 뒤 charge_extra()로 나머지를 받는다
+    _rule("report_batch", "POST", "/report/batch", _EXTRACT_BUCKET, 5),
+    _rule("report_create", "POST", "/report", _EXTRACT_BUCKET, 5),
+)
+DEFAULT_RULE = _rule("default", "*", "", _DEFAULT_BUCKET, 1)
+EXEMPT_PREFIXES = ("/admin", "/healthz", "/readyz")
+
+
+def match_rule(method: str, path: str) -> Optional[RateLimitRule]:
+    """요청에 적용할 규칙을 찾습니다. 제한하지 않는 요청(CORS preflight, 관리자 API, 헬스 체크)은 None입니다."""
+    if method == "OPTIONS" or path.startswith(EXEMPT_PREFIXES):
+        return None
+    for rule in RULES:
+        if rule.matches(method, path):
+            return rule
+    return DEFAULT_RULE
+
+
+@dataclass
+class RateLimitDecision:
+    allowed: bool
+    policy: BucketPolicy
+    remaining: float
+    retry_after: float
+
+    def headers(self) -> List[Tuple[bytes, bytes]]:
+        """IETF RateLimit 헤더 초안 형식의 응답 헤더"""
+        reset = math.ceil((self.policy.capacity - self.remaining) / self.policy.refill_per_second)
+        headers = [
+            (b"ratelimit-limit", str(int(self.policy.capacity)).encode()),
+            (b"ratelimit-remaining", str(max(0, int(self.remaining))).encode()),
+            (b"ratelimit-reset", str(reset).encode()),
+            (b"ratelimit-policy", f"{int(self.policy.capacity)};w={self.policy.window_seconds}".encode()),
+        ]
+        if not self.allowed:
+            headers.append((b"retry-after", str(max(1, math.ceil(self.retry_after))).encode()))
+        return headers
+
+
+class TokenBucketLimiter:
+    """
+    클라이언트별 토큰 버킷입니다. 요청마다 규칙의 비용만큼 토큰을 쓰고, 토큰은 버킷 정책의 속도로 다시 찹니다.
+
+    클라이언트 하나의 상태는 (마지막 갱신 시각, 버킷별 남은 토큰) 튜플 하나이고,
+    LRU(OrderedDict)로 max_keys개까지만 유지합니다. (10만 키 ≈ 17 MiB, benchmarks/bench_rate_limiter.py 참고)
+    """
+
+    def __init__(self, buckets=BUCKETS, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.buckets = buckets
+        self.max_keys = max_keys
+        self._state: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self.allowed = Counter()
+        self.limited = Counter()
+        self.evicted = 0
+
+    def hit(
+        self,
+        client: str,
+        rule: RateLimitRule,
+        now: Optional[float] = None,
+        cost: Optional[float] = None,
+        allow_debt: bool = False,
+    ) -> RateLimitDecision:
+        """
+        rule의 버킷에서 cost(기본값은 규칙의 비용)만큼 토큰을 씁니다.
+        allow_debt이면 남은 토큰이 있기만 하면 통과시키고 비용 전체를 빼서, 버킷이 음수가 되면 다시 찰 때까지 막습니다.
+        (버킷보다 큰 비용을 한 번에 받아야 하는 배치 항목 비용용)
+        """
+        now = time.monotonic() if now is None else now
+        entry = self._state.get(client)
+        if entry is None:
+            tokens = [policy.capacity for policy in self.buckets]
+        else:
+            elapsed = now - entry[0]
+            tokens = [
+                min(policy.capacity, entry[i + 1] + elapsed * policy.refill_per_second)
+                for i, policy in enumerate(self.buckets)
+            ]
+
+        policy = self.buckets[rule.bucket]
+        cost = rule.cost if cost is None else cost
+        if allow_debt:
+            allowed = tokens[rule.bucket] > 0
+        else:
+            # 비용이 버킷보다 크면 영원히 통과할 수 없으므로 버킷 크기로 자른다
+            cost = min(cost, policy.capacity)
+            allowed = tokens[rule.bucket] >= cost
+        retry_after = 0.0
+        if allowed:
+            tokens[rule.bucket] -= cost
+            self.allowed[rule.name] += 1
+        else:
+            retry_after = (min(cost, policy.capacity) - tokens[rule.bucket]) / policy.refill_per_second
+            self.limited[rule.name] += 1
+
+        self._state[client] = (now, *tokens)
+        self._state.move_to_end(client)
+        if len(self._state) > self.max_keys:
+            self._state.popitem(last=False)
+            self.evicted += 1
+        return RateLimitDecision(allowed, policy, tokens[rule.bucket], retry_after)
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": RATE_LIMIT_ENABLED,
+            "tracked_clients": len(self._state),
+            "max_keys": self.max_keys,
+            "evicted": self.evicted,
+            "allowed": dict(self.allowed),
+            "limited": dict(self.limited),
+        }
+
+
+def _api_key_hash(api_key: bytes) -> str:
+    return hashlib.blake2b(api_key, digest_size=8).hexdigest()
+
+
+_api_key_hashes = frozenset(_api_key_hash(key.strip().encode()) for key in RATE_LIMIT_API_KEYS.split(",") if key.strip())
+_trusted_proxies = tuple(
+    ipaddress.ip_network(network.strip(), strict=False)
+    for network in RATE_LIMIT_TRUSTED_PROXIES.split(",") if network.strip()
+)
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _trusted_proxies)
+
+
+def client_key(scope) -> str:
+    """
+    RATE_LIMIT_API_KEYS에 등록된 X-API-Key가 있으면 그 키(해시)로, 아니면 IP로 클라이언트를 구분합니다.
+    IP는 연결이 신뢰하는 프록시(nginx)에서 왔을 때만 X-Real-IP를 쓰고, 그 밖에는 연결 주소를 씁니다.
+    (클라이언트가 임의의 키나 X-Real-IP를 바꿔 보내며 새 버킷을 받지 못하도록)
+    API 키 원문은 메모리에 남기지 않도록 짧은 해시로 바꿉니다.
+    """
+    api_key = real_ip = None
+    for name, value in scope.get("headers", []):
+        if name == b"x-api-key":
+            api_key = value
+        elif name == b"x-real-ip":
+            real_ip = value
+    if api_key and _api_key_hashes:
+        key_hash = _api_key_hash(api_key)
+        if key_hash in _api_key_hashes:
+            return "key:" + key_hash
+    client = scope.get("client")
+    peer = client[0] if client else "unknown"
+    if real_ip and _is_trusted_proxy(peer):
+        return "ip:" + real_ip.decode("latin-1")
+    return "ip:" + peer
+
+
+def charge_extra(scope, rule_name: str, units: float) -> Optional[RateLimitDecision]:
+    """
+    요청 본문을 읽은 뒤에야 알 수 있는 비용(배치 항목 수 등)을 규칙 비용 × units만큼 더 받습니다.
+    버킷에 토큰이 남아 있으면 통과시키고 비용 전체를 빼므로, 큰 배치 뒤에는 버킷이 다시 찰 때까지 막힙니다.
+    요청 제한을 쓰지 않거나 받을 비용이 없으면 None입니다.
+    """
+    rule = next((rule for rule in RULES if rule.name == rule_name), None)
+    if not RATE_LIMIT_ENABLED or rule is None or units <= 0:
+        return None
+    return get_rate_limiter().hit(client_key(scope), rule, cost=rule.cost * units, allow_debt=True)
+
+
+class RateLimitMiddleware:
+    """
+    토큰 버킷 요청 제한 ASGI 미들웨어입니다. 제한된 요청은 429와 Retry-After로 바로 응답하고,
+    통과한 요청의 응답에는 RateLimit-* 헤더를 붙입니다.
+    (스트리밍 응답을 그대로 흘려보내도록 BaseHTTPMiddleware 대신 ASGI로 구현)
+    """
+
+    def __init__(self, app, limiter: Optional[TokenBucketLimiter] = None):
+        self.app = app
+        self.limiter = limiter or get_rate_limiter()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        rule = match_rule(scope["method"], scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        decision = self.limiter.hit(client_key(scope), rule)
+        headers = decision.headers()
+        if not decision.allowed:
+            response = JSONResponse(
+                {"detail": f"요청이 너무 많습니다. {max(1, math.ceil(decision.retry_after))}초 후 다시 시도해 주세요."},
+                status_code=429,
+            )
+            response.raw_headers.extend(headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+_rate_limiter: Optional[TokenBucketLimiter] = None
+
+
+def get_rate_limiter() -> TokenBucketLimiter:
+    """프로세스 전체에서 공유하는 TokenBucketLimiter를 반환합니다."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = TokenBucketLimiter()
+    return _rate_limiter
@@ -0,0 +1,108 @@
+import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional, Type, get_args, get_origin
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, ValidationError
+
+from app.schemas.report_schema import Report, ReportInput
+
+logger = logging.getLogger("app")
+
+Serializer = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _compile(annotation: Any) -> Serializer:
+    """타입 주석을 보고 값을 스키마 모양으로 정리하는 함수를 미리 만들어 둡니다."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return compile_model_serializer(annotation)
+
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        item = _compile(args[0]) if args else _identity
+        if item is _identity:
+            return _identity
+        return lambda value: [item(v) for v in value] if isinstance(value, list) else value
+
+    return _identity
+
+
+def compile_model_serializer(model: Type[BaseModel]) -> Callable[[Dict], Dict]:
+    """
+    pydantic 모델의 필드 목록으로 dict 정리 함수를 만듭니다.
+    스키마에 없는 키(예: _id, 내부 메타데이터)는 버리고, 문서에 없는 필드는 건너뜁니다.
+    값의 타입은 검사하거나 변환하지 않으므로 pydantic 검증을 대신하지 않습니다.
+    """
+    plan = [(name, _compile(field.annotation)) for name, field in model.model_fields.items()]
+
+    def serialize(doc: Dict) -> Dict:
+        if not isinstance(doc, dict):
+            return doc
+        out = {}
+        for name, convert in plan:
+            if name in doc:
+                out[name] = convert(doc[name])
+        return out
+
+    return serialize
+
+
+REPORT_FIELDS = frozenset(Report.model_fields)
+REPORT_CONTENT_FIELDS = frozenset(ReportInput.model_fields)
+_serialize_report = compile_model_serializer(Report)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    ?fields=user,ai_summary 형태의 희소 필드 목록을 검증합니다.
+    비어 있으면 None(전체 필드)을, 알 수 없는 필드가 있으면 ValueError를 반환합니다.
+    """
+    if not fields:
+        return None
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in REPORT_FIELDS]
+    if unknown:
+        raise ValueError(f"알 수 없는 필드: {', '.join(unknown)}")
+    return requested
+
+
+def build_projection(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+    """요청 필드를 MongoDB projection으로 변환합니다. id는 항상 포함됩니다."""
+    if not fields:
+        return None
+    projection = {name: 1 for name in fields if name != "id"}
+    projection["id"] = 1
+    projection["_id"] = 1
+    return projection
+
+
+def serialize_report(doc: Dict) -> bytes:
+    """MongoDB 보고서 문서를 Report 스키마 모양의 JSON 바이트로 직렬화합니다."""
+    if "_id" in doc:
+        doc["id"] = str(doc.pop("_id"))
+    return orjson.dumps(_serialize_report(doc), default=str)
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """orjson으로 직렬화한 JSON 응답을 만듭니다."""
+    body = content if isinstance(content, bytes) else orjson.dumps(content, default=str)
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def report_content_hash(report: Dict) -> Optional[str]:
+    """
+    보고서 내용의 정규화된 sha256 해시를 계산합니다.
+    ReportInput으로 검증한 model_dump()를 키 정렬해 해시하므로, 생성 시 저장한 해시와 공유 요청의 해시가 같은 기준으로 계산됩니다.
+    ReportInput으로 검증되지 않는 문서는 공유 요청과 일치할 수 없으므로 None을 반환합니다.
+    """
+    try:
+        content = ReportInput.model_validate(report).model_dump()
+    except ValidationError:
+        return None
+    canonical = orjson.dumps(content, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(canonical).hexdigest()
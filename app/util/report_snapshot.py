@@ -0,0 +1,97 @@
+import gzip
+import logging
+import os
+import re
+import tempfile
+from typing import Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 .br 파일을 만들지 않음)
+    brotli = None
+
+logger = logging.getLogger("app")
+
+# nginx와 공유하는 스냅샷 디렉터리 (docker-compose의 shared_snapshots 볼륨)
+SHARED_SNAPSHOT_DIR = os.getenv("SHARED_SNAPSHOT_DIR", "snapshots/shared")
+
+# 공유 ID는 내용이 바뀌지 않으므로 1년 동안 캐시 가능
+SNAPSHOT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_SHARE_ID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
+def is_valid_share_id(share_id: str) -> bool:
+    """공유 ID(uuid4 문자열)만 파일 이름으로 사용해 경로 조작을 막습니다."""
+    return bool(_SHARE_ID_RE.match(share_id))
+
+
+class ReportSnapshotStore:
+    """
+    공유 보고서의 직렬화된 JSON을 {share_id}.json(.gz/.br) 파일로 저장합니다.
+    nginx가 이 디렉터리를 직접 서빙하고, 파이썬 조회 경로도 같은 바이트를 응답합니다.
+    """
+
+    def __init__(self, directory: str = SHARED_SNAPSHOT_DIR):
+        self.directory = directory
+
+    def _path(self, share_id: str, suffix: str = "") -> str:
+        if not is_valid_share_id(share_id):
+            raise ValueError(f"잘못된 공유 ID: {share_id}")
+        return os.path.join(self.directory, f"{share_id}.json{suffix}")
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        # 임시 파일에 쓴 뒤 교체해서 nginx가 쓰다 만 파일을 읽지 않게 한다
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def exists(self, share_id: str) -> bool:
+        return os.path.exists(self._path(share_id))
+
+    def write(self, share_id: str, body: bytes) -> None:
+        """스냅샷을 저장합니다. 압축본을 먼저 쓰고 원본 .json을 마지막에 써서 완성 여부를 표시합니다."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._write_atomic(self._path(share_id, ".gz"), gzip.compress(body, compresslevel=9, mtime=0))
+        if brotli is not None:
+            self._write_atomic(self._path(share_id, ".br"), brotli.compress(body, quality=11))
+        self._write_atomic(self._path(share_id), body)
+        logger.info(f"공유 보고서 스냅샷 저장: {share_id} ({len(body)} 바이트)")
+
+    def read(self, share_id: str, accept_encoding: str = "") -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        클라이언트가 받을 수 있는 가장 작은 인코딩의 스냅샷을 읽습니다.
+
+        Returns:
+            (본문, Content-Encoding 또는 None), 스냅샷이 없으면 None
+        """
+        if not self.exists(share_id):
+            return None
+
+        accepted = {token.split(";")[0].strip() for token in accept_encoding.lower().split(",")}
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            path = self._path(share_id, suffix)
+            if encoding in accepted and os.path.exists(path):
+                with open(path, "rb") as f:
+                    return f.read(), encoding
+
+        with open(self._path(share_id), "rb") as f:
+            return f.read(), None
+
+
+_snapshot_store: Optional[ReportSnapshotStore] = None
+
+
+def get_snapshot_store() -> ReportSnapshotStore:
+    """프로세스 전체에서 공유하는 ReportSnapshotStore를 반환합니다."""
+    global _snapshot_store
+    if _snapshot_store is None:
+        _snapshot_store = ReportSnapshotStore()
+    return _snapshot_store
@@ -0,0 +1,237 @@
+import logging
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+
+from app.util.pdf_extractor import PAGE_SEPARATOR
+
+logger = logging.getLogger("app")
+
+RESUME_NORMALIZE_ENABLED = os.getenv("RESUME_NORMALIZE_ENABLED", "true").lower() == "true"
+
+# 페이지 머리글/바닥글로 볼 페이지 앞뒤 줄 수와, 반복으로 볼 최소 페이지 비율
+EDGE_LINES = 3
+REPEATED_PAGE_RATIO = 0.5
+
+_INVISIBLE_RE = re.compile("[\u200b-\u200d\u2060\ufeff\u00ad]")
+_SPACES_RE = re.compile("[ \t\u00a0\u2000-\u200a\u3000]+")
+_PAGE_NUMBER_RE = re.compile(
+    r"^(?:[-–—]\s*)?(?:page\s*|p\.\s*)?\d{1,3}(?:\s*(?:/|of)\s*\d{1,3})?(?:\s*페이지)?(?:\s*[-–—])?$",
+    re.IGNORECASE,
+)
+_EMAIL = r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"
+_PHONE = r"(?:\+82[-.\s]?|0)1[016789][-.\s)]?\d{3,4}[-.\s]?\d{4}|\b0\d{1,2}[-.)]\s?\d{3,4}[-.]\d{4}\b"
+# 연락처 표기(Email:, 전화 등)는 단어 경계에서 시작하고 이메일/전화번호 바로 앞에 있을 때만 함께 지운다
+_CONTACT_RE = re.compile(
+    r"(?:(?<!\w)(?:e-?mail|phone|mobile|tel|contact|이메일|메일|전화(?:번호)?|휴대(?:폰|전화)|연락처|핸드폰)\s*[:：]?\s*)?"
+    rf"(?:{_EMAIL}|{_PHONE})",
+    re.IGNORECASE,
+)
+_EMPTY_BRACKETS_RE = re.compile(r"[(\[]\s*[)\]]")
+# 줄바꿈이 문장 중간이 아니라 새 항목의 시작임을 나타내는 줄머리
+_ITEM_START_RE = re.compile(r"^(?:[-•·▪■□◦●○※*>]|\d{1,2}[.)]|\(?\d{4}[.\-/])")
+_SENTENCE_END = tuple(".!?:;)]」』”\"'다요음임함됨")
+# 이보다 짧고 문장 끝 문자로 끝나지 않는 줄은 제목(경력사항, 프로젝트 등)으로 보고 앞줄에 잇지 않는다
+HEADING_MAX_CHARS = 12
+_HANGUL_WORD_RE = re.compile("[\uac00-\ud7a3]+")
+_HANGUL_HEAD_RE = re.compile("[\uac00-\ud7a3]+$")
+_HANGUL_TAIL_RE = re.compile("^[\uac00-\ud7a3]+")
+
+
+@dataclass
+class NormalizedText:
+    """정규화 결과입니다. removed는 규칙별로 지운 문자 수, rejoined_lines는 이어 붙인 줄 수입니다."""
+
+    text: str
+    original_chars: int
+    removed: Dict[str, int] = field(default_factory=dict)
+    rejoined_lines: int = 0
+
+    @property
+    def removed_chars(self) -> int:
+        return self.original_chars - len(self.text)
+
+
+_stats = Counter()
+
+
+def _line_key(line: str) -> str:
+    """
+    공백과 페이지 번호 같은 짧은 숫자를 무시하고 같은 머리글/바닥글인지 비교하기 위한 키.
+    날짜(2021.03)나 연도처럼 내용을 구분하는 숫자는 그대로 둔다.
+    """
+    return re.sub(r"(?<![\d.])\d{1,3}(?![\d.])", "#", re.sub(r"\s+", "", line)).lower()
+
+
+def _remove_repeated_edges(pages: List[List[str]], removed: Counter) -> List[List[str]]:
+    """여러 페이지의 앞뒤 EDGE_LINES줄에 반복되는 줄(머리글/바닥글)을 첫 번째만 남기고 지웁니다."""
+    if len(pages) < 2:
+        return pages
+
+    def edge_indexes(lines: List[str]) -> List[int]:
+        filled = [i for i, line in enumerate(lines) if line]
+        return sorted(set(filled[:EDGE_LINES] + filled[-EDGE_LINES:]))
+
+    page_counts = Counter()
+    for lines in pages:
+        page_counts.update({_line_key(lines[i]) for i in edge_indexes(lines)})
+    threshold = max(2, round(len(pages) * REPEATED_PAGE_RATIO))
+    repeated = {key for key, count in page_counts.items() if count >= threshold}
+    if not repeated:
+        return pages
+
+    seen = set()
+    result = []
+    for lines in pages:
+        drop = set()
+        for i in edge_indexes(lines):
+            key = _line_key(lines[i])
+            if key in repeated:
+                if key in seen:
+                    drop.add(i)
+                    removed["repeated_lines"] += len(lines[i]) + 1
+                seen.add(key)
+        result.append([line for i, line in enumerate(lines) if i not in drop])
+    return result
+
+
+def _strip_contact(line: str, removed: Counter) -> str:
+    """이메일과 전화번호를 지우고, 연락처 표기만 남은 줄은 비웁니다. (분석에 쓰이지 않는 개인정보)"""
+    stripped = _CONTACT_RE.sub("", line)
+    if stripped == line:
+        return line
+    # "홍길동 | 010-... | a@b.com"처럼 구분자로 나열된 줄은 빈 칸을 빼고 다시 잇는다 (Java·Spring 같은 가운뎃점은 그대로 둔다)
+    pieces = [piece.strip(" ,/-·") for piece in _EMPTY_BRACKETS_RE.sub("", stripped).split("|")]
+    stripped = " | ".join(_SPACES_RE.sub(" ", piece) for piece in pieces if piece)
+    removed["contact"] += len(line) - len(stripped)
+    return stripped
+
+
+def _is_hangul(char: str) -> bool:
+    return "\uac00" <= char <= "\ud7a3"
+
+
+def _join_separator(previous: str, line: str, full_line: bool, vocabulary: Set[str]) -> str:
+    """
+    자동 줄바꿈으로 끊긴 두 줄을 이을 때 사이에 넣을 문자를 정합니다. 기본은 공백 하나입니다.
+    한글 PDF는 어절 중간(있도/록)에서도, 어절 사이(개발하고/운영했습니다)에서도 줄이 바뀌고 추출된 텍스트로는 둘을 구분할 수 없으므로,
+    한글과 한글 사이는 어절 중간에서 끊겼다는 근거가 있을 때만 공백 없이 잇습니다.
+    - full_line: 앞줄이 원문에서 끝에 공백 없이 페이지의 긴 줄들만큼 꽉 찼습니다. (다음 글자가 폭에 밀려 넘어간 경우)
+    - 앞줄 끝 어절과 다음 줄 첫 어절을 붙인 형태가 같은 문서의 다른 곳에 한 어절로 나옵니다.
+    """
+    if not (_is_hangul(previous[-1]) and _is_hangul(line[0])):
+        return " "
+    if full_line:
+        return ""
+    head = _HANGUL_HEAD_RE.search(previous)
+    tail = _HANGUL_TAIL_RE.match(line)
+    if head and tail and head.group() + tail.group() in vocabulary:
+        return ""
+    return " "
+
+
+def _rejoin(lines: List[str], removed: Counter, vocabulary: Set[str]) -> Tuple[List[str], int]:
+    """
+    PDF 줄바꿈 때문에 끊긴 문장을 다시 잇습니다. lines는 앞 공백만 지운 줄이며, 끝 공백은 원문에 있던 경우 하나로 남아 있습니다.
+    - 영어 단어가 하이픈으로 끊겼으면(devel-/opment) 하이픈을 빼고 붙입니다.
+    - 앞줄이 문장 끝 문자로 끝나지 않고 다음 줄이 새 항목(글머리표, 번호, 날짜)으로 시작하지 않으며,
+      다음 줄이 제목이 아니고, 앞줄이 페이지의 긴 줄들과 길이가 비슷하면(자동 줄바꿈) 공백 하나로 잇습니다.
+      한글끼리는 어절 중간에서 끊겼다는 근거가 있을 때만 공백 없이 잇습니다. (_join_separator)
+    """
+    lengths = sorted(len(line.rstrip()) for line in lines if line.strip())
+    if not lengths:
+        return [line.rstrip() for line in lines], 0
+    full_width = lengths[int(len(lengths) * 0.9)]
+    wrap_width = full_width * 0.8
+
+    result: List[str] = []
+    joined = 0
+    # 마지막으로 이은 원문 줄의 길이와, 원문에서 끝에 공백이 있었는지
+    last_width, last_spaced = 0, False
+    for raw_line in lines:
+        line = raw_line.rstrip()
+        if result and result[-1] and line:
+            previous = result[-1]
+            if re.search(r"[A-Za-z]-$", previous) and line[0].islower():
+                result[-1] = previous[:-1] + line
+                removed["hyphenation"] += 1
+                joined += 1
+                last_width, last_spaced = len(line), raw_line != line
+                continue
+            if (
+                last_width >= wrap_width
+                and not previous.endswith(_SENTENCE_END)
+                and not _ITEM_START_RE.match(line)
+                and (len(line) > HEADING_MAX_CHARS or line.endswith(_SENTENCE_END))
+            ):
+                full_line = last_width >= full_width and not last_spaced
+                result[-1] = previous + _join_separator(previous, line, full_line, vocabulary) + line
+                joined += 1
+                last_width, last_spaced = len(line), raw_line != line
+                continue
+        result.append(line)
+        last_width, last_spaced = len(line), raw_line != line
+    return result, joined
+
+
+def normalize_resume_text(text: str) -> NormalizedText:
+    """
+    LLM에 보내기 전에 이력서 텍스트를 정리합니다.
+
+    1. 보이지 않는 문자를 지우고 연속 공백을 하나로 줄입니다.
+    2. 페이지 번호 줄과 여러 페이지에 반복되는 머리글/바닥글을 지웁니다. (페이지는 PAGE_SEPARATOR로 구분)
+    3. 이메일/전화번호와 연락처 표기만 있는 줄을 지웁니다.
+    4. 줄바꿈으로 끊긴 문장과 하이픈으로 끊긴 단어를 잇습니다.
+    5. 빈 줄은 연속해서 하나까지만 남깁니다.
+    """
+    original_chars = len(text)
+    if not RESUME_NORMALIZE_ENABLED or not text:
+        return NormalizedText(text, original_chars)
+
+    removed = Counter()
+    text = _INVISIBLE_RE.sub("", text)
+    # 줄바꿈으로 끊긴 한글 어절을 공백 없이 이을지 판단할 때 쓰는 문서 안의 어절 목록
+    vocabulary = set(_HANGUL_WORD_RE.findall(text))
+    pages: List[List[str]] = []
+    for page in text.split(PAGE_SEPARATOR):
+        lines = []
+        for raw in page.splitlines():
+            # 원문 줄 끝의 공백은 어절 사이에서 줄이 바뀌었다는 근거이므로 _rejoin까지 하나로 남긴다
+            line = _SPACES_RE.sub(" ", raw).lstrip()
+            if _PAGE_NUMBER_RE.match(line.rstrip()):
+                removed["page_numbers"] += len(line.rstrip()) + 1
+                continue
+            lines.append(line)
+        pages.append(lines)
+    pages = _remove_repeated_edges(pages, removed)
+
+    rejoined_lines = 0
+    out: List[str] = []
+    for lines in pages:
+        lines, joined = _rejoin([_strip_contact(line, removed) for line in lines], removed, vocabulary)
+        rejoined_lines += joined
+        for line in lines:
+            if line or (out and out[-1]):
+                out.append(line)
+    normalized = "\n".join(out).strip()
+
+    result = NormalizedText(normalized, original_chars, dict(removed), rejoined_lines)
+    # 공백 정리로 줄어든 양은 전체 감소분에서 규칙별 감소분을 뺀 나머지
+    result.removed["whitespace"] = max(0, result.removed_chars - sum(removed.values()))
+    _stats["documents"] += 1
+    _stats["chars_in"] += original_chars
+    _stats["chars_out"] += len(normalized)
+    _stats["rejoined_lines"] += rejoined_lines
+    _stats.update({f"removed_{rule}": chars for rule, chars in result.removed.items()})
+    logger.info(
+        f"이력서 텍스트 정규화: {original_chars} → {len(normalized)}자 ({result.removed_chars}자 제거, "
+        + ", ".join(f"{rule} {chars}" for rule, chars in result.removed.items() if chars)
+        + ")"
+    )
+    return result
+
+
+def normalizer_stats() -> Dict:
+    return {"enabled": RESUME_NORMALIZE_ENABLED, **_stats}
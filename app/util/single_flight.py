@@ -0,0 +1,71 @@
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger("app")
+
+T = TypeVar("T")
+
+
+def hash_key(*parts: Any) -> str:
+    """임의의 JSON 직렬화 가능한 값들로 single-flight 키(sha256)를 만듭니다."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 작업을 하나의 in-flight 태스크로 합칩니다.
+    뒤따라온 호출은 먼저 시작된 태스크의 결과나 예외를 그대로 공유합니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug(f"[{self.name}] 진행 중인 작업에 합류: {str(key)[:16]}")
+        else:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+
+        # 호출자 하나가 취소되어도 다른 대기자를 위해 작업은 계속 진행한다
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+        }
+
+
+_flights: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """이름별로 공유되는 SingleFlight 인스턴스를 반환합니다."""
+    if name not in _flights:
+        _flights[name] = SingleFlight(name)
+    return _flights[name]
+
+
+def single_flight_stats() -> Dict[str, Dict[str, int]]:
+    return {name: flight.stats() for name, flight in _flights.items()}
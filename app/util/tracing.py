@@ -0,0 +1,283 @@
+import contextvars
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger("app")
+
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "true").lower() == "true"
+# 메모리에 보관할 최근 span 수 (GET /admin/traces에서 조회)
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", "5000"))
+# 지정하면 끝난 span을 한 줄씩 JSONL로 추가 기록한다. TRACE_EXPORT_MAX_BYTES를 넘으면 .1로 옮기고 새로 쓴다.
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "")
+TRACE_EXPORT_MAX_BYTES = int(os.getenv("TRACE_EXPORT_MAX_BYTES", str(50 * 2**20)))
+# 파일 기록 스레드가 밀렸을 때 쌓아 둘 최대 span 수. 넘으면 파일 기록만 버린다 (ring buffer에는 남음)
+TRACE_EXPORT_QUEUE_SIZE = int(os.getenv("TRACE_EXPORT_QUEUE_SIZE", "10000"))
+
+TRACE_HEADER = "x-request-id"
+# 오케스트레이터가 몇 초마다 호출하는 헬스 체크는 ring buffer를 채우지 않도록 기록하지 않는다
+TRACE_EXCLUDED_PATHS = ("/healthz", "/readyz")
+_TRACE_ID_RE = re.compile(r"^[0-9A-Za-z_-]{8,64}$")
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+def new_trace_id() -> str:
+    return uuid.uuid4().hex
+
+
+def is_valid_trace_id(value: str) -> bool:
+    """외부에서 받은 trace id(X-Request-ID)나 파일 이름으로 쓸 trace id가 안전한 형식인지 확인합니다."""
+    return bool(_TRACE_ID_RE.match(value))
+
+
+def current_span() -> Optional["Span"]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+class Span:
+    """
+    작업 한 단계의 실행 시간 기록입니다. with/async with로 감싸면 현재 span의 자식이 되고,
+    끝날 때 내보내기(ring buffer, JSONL)로 전달됩니다. 컨텍스트 변수로 전파되므로
+    asyncio.gather로 만든 작업이나 asyncio.to_thread로 넘긴 함수 안의 span도 같은 trace에 속합니다.
+
+        with span("clova.chat", model="HCX-003") as s:
+            s.set("status_code", 200)
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "started_at", "duration_ms", "status", "_start", "_token")
+
+    def __init__(self, name: str, trace_id: Optional[str] = None, **attributes: Any):
+        self.name = name
+        self.attributes = attributes
+        self.trace_id = trace_id
+        self.span_id = ""
+        self.parent_id: Optional[str] = None
+        self.started_at = 0.0
+        self.duration_ms = 0.0
+        self.status = "ok"
+        self._start = 0.0
+        self._token = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        if parent is not None and self.trace_id is None:
+            self.trace_id = parent.trace_id
+            self.parent_id = parent.span_id
+        self.trace_id = self.trace_id or new_trace_id()
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+        if exc_type is not None:
+            self.status = "error"
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        if TRACE_ENABLED:
+            get_span_exporter().export(self)
+
+    async def __aenter__(self) -> "Span":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.started_at, 6),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+span = Span
+
+
+class SpanExporter:
+    """
+    끝난 span을 메모리 ring buffer에 보관하고, 설정되어 있으면 JSONL 파일에도 기록합니다.
+    파일 기록은 이벤트 루프를 막지 않도록 큐에 넣고 백그라운드 스레드가 모아서 씁니다.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = TRACE_BUFFER_SIZE,
+        path: str = TRACE_EXPORT_PATH,
+        max_bytes: int = TRACE_EXPORT_MAX_BYTES,
+        queue_size: int = TRACE_EXPORT_QUEUE_SIZE,
+    ):
+        self._spans: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self.exported = 0
+        self.dropped = 0
+
+    def export(self, finished: Span) -> None:
+        record = finished.to_dict()
+        with self._lock:
+            self._spans.append(record)
+            self.exported += 1
+            if self.path and self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="span-writer", daemon=True)
+                self._writer.start()
+        if self.path:
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+
+    def _write_loop(self) -> None:
+        """큐에 쌓인 span을 한 번에 모아 쓰고, 파일이 max_bytes를 넘으면 .1로 옮기고 새로 씁니다."""
+        stopping = False
+        while not stopping:
+            records = [self._queue.get()]
+            while len(records) < 1000:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in records:
+                stopping = True
+                records = [record for record in records if record is not None]
+            if records:
+                self._write(records)
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                os.replace(self.path, self.path + ".1")
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records))
+        except OSError as e:
+            logger.warning(f"span 기록 실패: {e}")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """큐에 남은 span을 파일에 쓰고 기록 스레드를 멈춥니다."""
+        writer = self._writer
+        if writer is None:
+            return
+        self._queue.put(None)
+        writer.join(timeout)
+        with self._lock:
+            self._writer = None
+
+    def traces(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 trace 요약(루트 span 기준)을 최신순으로 반환합니다."""
+        with self._lock:
+            spans = list(self._spans)
+        summaries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        for record in reversed(spans):
+            summary = summaries.setdefault(record["trace_id"], {"trace_id": record["trace_id"], "spans": 0, "errors": 0})
+            summary["spans"] += 1
+            summary["errors"] += record["status"] == "error"
+            if record["parent_id"] is None:
+                summary.update(name=record["name"], start=record["start"], duration_ms=record["duration_ms"], status=record["status"])
+        return list(summaries.values())[:limit]
+
+    def trace(self, trace_id: str) -> List[Dict[str, Any]]:
+        """trace 하나의 span을 시작 시각 순으로 반환합니다."""
+        with self._lock:
+            spans = [record for record in self._spans if record["trace_id"] == trace_id]
+        return sorted(spans, key=lambda record: record["start"])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": TRACE_ENABLED,
+            "buffered_spans": len(self._spans),
+            "exported": self.exported,
+            "export_path": self.path or None,
+            "export_queue": self._queue.qsize(),
+            "export_dropped": self.dropped,
+        }
+
+
+_span_exporter: Optional[SpanExporter] = None
+_span_exporter_lock = threading.Lock()
+
+
+def get_span_exporter() -> SpanExporter:
+    """프로세스 전체에서 공유하는 SpanExporter를 반환합니다."""
+    global _span_exporter
+    if _span_exporter is None:
+        with _span_exporter_lock:
+            if _span_exporter is None:
+                _span_exporter = SpanExporter()
+    return _span_exporter
+
+
+def _install_log_record_factory() -> None:
+    """모든 로그 레코드에 trace_id 속성을 넣어 로그 형식에서 %(trace_id)s를 쓸 수 있게 합니다."""
+    default_factory = logging.getLogRecordFactory()
+    if getattr(default_factory, "_with_trace_id", False):
+        return
+
+    def factory(*args, **kwargs):
+        record = default_factory(*args, **kwargs)
+        record.trace_id = current_trace_id() or "-"
+        return record
+
+    factory._with_trace_id = True
+    logging.setLogRecordFactory(factory)
+
+
+_install_log_record_factory()
+
+
+class TracingMiddleware:
+    """
+    요청마다 루트 span을 만드는 ASGI 미들웨어입니다. X-Request-ID 헤더가 있으면 그 값을 trace id로 이어 쓰고,
+    응답에 X-Request-ID를 붙여 로그와 /admin/traces에서 같은 요청을 찾을 수 있게 합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in TRACE_EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = None
+        for name, value in scope.get("headers", []):
+            if name == TRACE_HEADER.encode():
+                candidate = value.decode("latin-1")
+                if is_valid_trace_id(candidate):
+                    trace_id = candidate
+                break
+
+        with span(f"{scope['method']} {scope['path']}", trace_id=trace_id or new_trace_id()) as root:
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    root.set("status_code", message["status"])
+                    message["headers"] = list(message.get("headers", [])) + [(TRACE_HEADER.encode(), root.trace_id.encode())]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
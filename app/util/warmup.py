@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger("app")
+
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+# 의존성 하나의 예열에 허용하는 시간(초)
+WARMUP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_TIMEOUT_SECONDS", "30"))
+# 필수 의존성 예열이 실패했을 때 /readyz 호출에서 다시 시도하는 최소 간격(초)
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", "10"))
+WARMUP_RECHECK_TIMEOUT_SECONDS = 2.0
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+# 준비되기 전에도 받는 경로 (프로브와 운영 지표)
+READINESS_EXEMPT_PREFIXES = ("/healthz", "/readyz", "/admin")
+READINESS_RETRY_AFTER_SECONDS = 5
+
+
+@dataclass(frozen=True)
+class WarmupCheck:
+    """
+    예열할 의존성 하나입니다. required인 의존성이 준비되지 않으면 워커는 준비되지 않은 것으로 봅니다.
+    (선택 의존성은 실패해도 첫 사용 때 다시 연결되므로 트래픽을 막지 않습니다.)
+    """
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    required: bool = False
+
+
+class Warmup:
+    """
+    서버 시작 시 의존성들을 병렬로 예열하고 의존성별 상태와 소요 시간을 기록합니다.
+    /readyz는 예열이 끝나고 필수 의존성이 모두 준비되었을 때만 200을 반환합니다.
+    """
+
+    def __init__(self, checks: List[WarmupCheck], timeout: float = WARMUP_TIMEOUT_SECONDS, enabled: bool = WARMUP_ENABLED):
+        self.checks = {check.name: check for check in checks}
+        self.timeout = timeout
+        self.enabled = enabled
+        self.results: Dict[str, Dict[str, Any]] = {
+            check.name: {"status": STATUS_PENDING, "required": check.required} for check in checks
+        }
+        self.started_at: Optional[float] = None
+        self.elapsed_ms: Optional[float] = None
+        self._attempted_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.elapsed_ms is not None
+
+    @property
+    def ready(self) -> bool:
+        return self.finished and all(
+            result["status"] in (STATUS_READY, STATUS_SKIPPED)
+            for result in self.results.values() if result["required"]
+        )
+
+    def start(self) -> None:
+        """예열을 백그라운드 작업으로 시작합니다. 그동안 /healthz는 응답하고 /readyz는 503을 반환합니다."""
+        if not self.enabled:
+            for result in self.results.values():
+                result["status"] = STATUS_SKIPPED
+            self.elapsed_ms = 0.0
+            return
+        self._task = asyncio.get_running_loop().create_task(self.run(), name="warmup")
+
+    async def run(self) -> None:
+        self.started_at = time.time()
+        start = time.perf_counter()
+        await asyncio.gather(*(self._run_check(check) for check in self.checks.values()))
+        self.elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        failed = [name for name, result in self.results.items() if result["status"] == STATUS_FAILED]
+        logger.info(
+            f"예열 완료: {self.elapsed_ms}ms, "
+            + ", ".join(f"{name} {result['status']} {result.get('duration_ms')}ms" for name, result in self.results.items())
+        )
+        if failed:
+            logger.warning(f"예열 실패: {', '.join(failed)}")
+
+    async def _run_check(self, check: WarmupCheck, timeout: Optional[float] = None) -> None:
+        result = self.results[check.name]
+        result["status"] = STATUS_RUNNING
+        self._attempted_at[check.name] = time.monotonic()
+        start = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(check.run(), timeout=timeout or self.timeout)
+            result["status"] = STATUS_READY
+            result.pop("error", None)
+            if detail is not None:
+                result["detail"] = detail
+        except Exception as e:
+            result["status"] = STATUS_FAILED
+            result["error"] = (f"{type(e).__name__}: {e}" if str(e) else type(e).__name__)[:300]
+        result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+
+    async def recheck(self) -> None:
+        """실패한 필수 의존성을 WARMUP_RETRY_SECONDS 간격으로 다시 예열합니다. (DB가 늦게 뜬 경우 복구)"""
+        if not self.finished:
+            return
+        now = time.monotonic()
+        retry = [
+            check for name, check in self.checks.items()
+            if check.required and self.results[name]["status"] == STATUS_FAILED
+            and now - self._attempted_at.get(name, 0.0) >= WARMUP_RETRY_SECONDS
+        ]
+        if retry:
+            # 프로브 요청 안에서 실행되므로 프로브 타임아웃보다 짧게 기다린다
+            await asyncio.gather(*(self._run_check(check, timeout=min(self.timeout, WARMUP_RECHECK_TIMEOUT_SECONDS)) for check in retry))
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "finished": self.finished,
+            "elapsed_ms": self.elapsed_ms,
+            "dependencies": self.results,
+        }
+
+    async def aclose(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+class ReadinessMiddleware:
+    """
+    예열이 끝나고 필수 의존성이 준비되기 전에는 프로브와 운영 경로를 제외한 요청에 503과 Retry-After로 응답하는 ASGI 미들웨어입니다.
+    nginx는 API 준비를 기다리지 않고 뜨므로(정적 공유 스냅샷은 API 없이 제공), 프록시된 요청은 여기서 막습니다.
+    준비되지 않은 동안에는 /readyz와 같이 실패한 필수 의존성을 다시 확인합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"].startswith(READINESS_EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        warmup: Optional[Warmup] = getattr(scope["app"].state, "warmup", None)
+        if warmup is not None and not warmup.ready:
+            await warmup.recheck()
+            if not warmup.ready:
+                response = JSONResponse(
+                    {"detail": "서버가 아직 준비되지 않았습니다. 잠시 후 다시 시도해 주세요."},
+                    status_code=503,
+                    headers={"Retry-After": str(READINESS_RETRY_AFTER_SECONDS)},
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
@@ -1,18 +1,24 @@
 import logging
-import requests
-from bs4 import BeautifulSoup
+from typing import Optional
+
+import httpx
 from urllib.parse import urlparse
 
+from app.util.http_fetcher import get_static_fetcher
+from app.util.html_text import html_to_text
+
 logger = logging.getLogger("app")
 
 class WebExtractor:
     @staticmethod
-    def extract_text_from_url(url: str) -> str:
+    async def extract_text_from_url(url: str, timeout: Optional[float] = None) -> str:
         """
         URL에서 웹 페이지 콘텐츠를 가져와 텍스트를 추출합니다.
+        공유 커넥션 풀과 응답 캐시를 사용하는 StaticFetcher로 요청합니다.
         
         Args:
             url: 텍스트를 추출할 웹 페이지의 URL
+            timeout: 요청 타임아웃(초), 없으면 StaticFetcher 기본값
             
         Returns:
             추출된 텍스트
@@ -26,32 +32,24 @@ class WebExtractor:
             
             # 웹 페이지 요청
             logger.info(f"웹 페이지 요청: {url}")
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()  # 4xx, 5xx 응답 확인
+            response = await get_static_fetcher().fetch(url, timeout=timeout)
+            if response.from_cache:
+                logger.info(f"캐시된 웹 페이지 사용: {url}")
             
             # 콘텐츠 타입 확인
-            content_type = response.headers.get('Content-Type', '')
+            content_type = response.content_type
             if 'text/html' not in content_type and 'application/xhtml+xml' not in content_type:
                 logger.warning(f"웹 페이지가 HTML이 아닙니다. Content-Type: {content_type}")
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 불필요한 요소 제거
-            for tag in soup(["script", "style", "meta", "noscript", "header", "footer", "aside"]):
-                tag.extract()
-            
-            # 텍스트 추출 및 정리
-            text = soup.get_text(separator=' ', strip=True)
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            text = "\n".join(lines)
+            # HTML 파싱 및 텍스트 추출 (script/style/nav 등 제거 규칙은 html_text 모듈 공통)
+            text = html_to_text(response.text)
             
             total_text_length = len(text)
             logger.info(f"웹 페이지에서 추출된 텍스트 길이: {total_text_length} 문자")
             
             return text
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"웹 페이지 요청 중 오류: {str(e)}")
             raise ValueError(f"웹 페이지를 불러올 수 없습니다: {str(e)}")
         except Exception as e:
@@ -0,0 +1,102 @@
+"""
+입장 제어 벤치마크: 처리 용량의 2배로 요청이 들어올 때 입장 제어가 없는 경우와
+AdmissionController(동시 처리 수 + 제한된 대기열)를 거치는 경우의 goodput을 비교합니다.
+
+서버는 동시에 CAPACITY개 요청만 제 속도로 처리하고, 그보다 많으면 모두 함께 느려진다고 가정합니다.
+(CLOVA/브라우저 슬롯을 나눠 쓰는 상황) 시간은 1/50로 줄였습니다: 처리 10초 → 0.2초, nginx 60초 → 1.2초.
+nginx 기한을 넘긴 응답은 실패로 세지만, 서버는 그 요청을 끝까지 처리합니다.
+
+실행: python -m benchmarks.bench_admission --rate-multiplier 2 --duration 5
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from app.util.admission import AdmissionController, AdmissionRejected
+
+SCALE = 50
+CAPACITY = 4
+SERVICE_SECONDS = 10 / SCALE
+CLIENT_TIMEOUT = 60 / SCALE
+QUEUE_TIMEOUT = 5 / SCALE
+TICK = 0.005
+
+
+class SharedServer:
+    """동시 요청 수가 CAPACITY를 넘으면 각 요청의 진행 속도가 CAPACITY/동시 요청 수로 줄어드는 서버"""
+
+    def __init__(self):
+        self.active = 0
+
+    async def handle(self):
+        self.active += 1
+        try:
+            done = 0.0
+            while done < SERVICE_SECONDS:
+                await asyncio.sleep(TICK)
+                done += TICK * min(1.0, CAPACITY / self.active)
+        finally:
+            self.active -= 1
+
+
+async def run(admission: bool, rate: float, duration: float, seed: int):
+    random.seed(seed)
+    server = SharedServer()
+    controller = AdmissionController("bench", CAPACITY, CAPACITY * 2, QUEUE_TIMEOUT)
+    results = []
+
+    async def request():
+        start = time.monotonic()
+        try:
+            if admission:
+                ticket = await controller.admit()
+                try:
+                    await server.handle()
+                finally:
+                    controller.release(ticket)
+            else:
+                await server.handle()
+        except AdmissionRejected:
+            results.append(("rejected", time.monotonic() - start))
+            return
+        elapsed = time.monotonic() - start
+        results.append(("ok" if elapsed <= CLIENT_TIMEOUT else "timeout", elapsed))
+
+    tasks = []
+    start = time.monotonic()
+    while time.monotonic() - start < duration:
+        tasks.append(asyncio.create_task(request()))
+        await asyncio.sleep(random.expovariate(rate))
+    await asyncio.gather(*tasks)
+    return results
+
+
+def summarize(label: str, results, duration: float):
+    ok = sorted(elapsed for status, elapsed in results if status == "ok")
+    timeouts = sum(1 for status, _ in results if status == "timeout")
+    rejected = [elapsed for status, elapsed in results if status == "rejected"]
+    p50 = ok[len(ok) // 2] * SCALE if ok else float("nan")
+    reject_p50 = sorted(rejected)[len(rejected) // 2] * SCALE if rejected else 0.0
+    print(
+        f"{label:<12} 요청 {len(results):>4}  성공 {len(ok):>4} ({len(ok) / duration:5.1f}/s)  "
+        f"nginx 타임아웃 {timeouts:>4}  503 {len(rejected):>4} (p50 {reject_p50:4.1f}s)  성공 p50 {p50:5.1f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="입장 제어 goodput 벤치마크")
+    parser.add_argument("--rate-multiplier", type=float, default=2.0, help="처리 용량 대비 도착률 배수")
+    parser.add_argument("--duration", type=float, default=5.0, help="요청을 보내는 시간(초, 축소된 시간)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rate = CAPACITY / SERVICE_SECONDS * args.rate_multiplier
+    print(f"용량 {CAPACITY / SERVICE_SECONDS:.0f}/s, 도착률 {rate:.0f}/s, 시간은 실제 기준(x{SCALE})으로 표시")
+    for label, admission in (("제어 없음", False), ("입장 제어", True)):
+        results = asyncio.run(run(admission, rate, args.duration, args.seed))
+        summarize(label, results, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+HTML 텍스트 추출 백엔드 벤치마크: 저장된 이력서/Notion HTML 픽스처로 시간과 결과 일치 여부를 비교합니다.
+
+실행: python -m benchmarks.bench_html_text --repeat 50
+"""
+import argparse
+import glob
+import os
+import time
+
+from app.util.html_text import BeautifulSoupBackend, SelectolaxBackend
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "html")
+
+
+def measure(backend, html, repeat):
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = backend.extract(html)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return text, timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 텍스트 추출 백엔드 벤치마크")
+    parser.add_argument("--repeat", type=int, default=50, help="픽스처별 반복 횟수")
+    args = parser.parse_args()
+
+    backends = [SelectolaxBackend(), BeautifulSoupBackend()]
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+
+        results = {backend.name: measure(backend, html, args.repeat) for backend in backends}
+        fast_text, fast_time = results[SelectolaxBackend.name]
+        slow_text, slow_time = results[BeautifulSoupBackend.name]
+
+        print(f"{os.path.basename(path)} ({len(html) // 1024} KB)")
+        for name, (text, elapsed) in results.items():
+            print(f"  {name:<14} 중앙값 {elapsed * 1000:7.2f}ms  텍스트 {len(text)}자")
+        print(f"  속도 향상 {slow_time / fast_time:.1f}배, 결과 일치: {'예' if fast_text == slow_text else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
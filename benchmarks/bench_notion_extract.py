@@ -0,0 +1,58 @@
+"""
+Notion 브라우저리스 추출 경로를 로컬 픽스처 서버로 검증하고 시간을 측정합니다.
+
+실행: python -m benchmarks.bench_notion_extract --repeat 20
+"""
+import argparse
+import asyncio
+import time
+
+from app.util.notion_extractor import NotionExtractor
+from benchmarks.notion_fixture_server import load_fixture, start_server
+
+EXPECTED_LINES = [
+    "홍길동 · Backend Engineer",
+    "# 경력",
+    "## KakaoEnterprise · KakaoCloud Technical Documentation Assistant - Intern",
+    "- KakaoCloud Docs Tutorial 기획 & 구현",
+    "  - 사용 기술: Java, Spring Boot, Redis",
+    "Cloud Club | AWS/Terraform 스터디",
+    "AWS Certified Solutions Architect Associate | 2023.05",
+    "블로그 글 모음",
+]
+
+
+async def run(repeat):
+    fixture = load_fixture()
+    server, api_base = start_server(fixture=fixture)
+    url = f"https://example.notion.site/Resume-{fixture['page_id'].replace('-', '')}"
+    extractor = NotionExtractor(api_base=api_base)
+
+    try:
+        timings = []
+        text = ""
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = await extractor.extract_text(url)
+            timings.append(time.perf_counter() - start)
+    finally:
+        server.shutdown()
+
+    lines = text.splitlines()
+    missing = [line for line in EXPECTED_LINES if line not in lines]
+    timings.sort()
+    print(text)
+    print(f"\n블록→텍스트 {len(text)}자, 중앙값 {timings[len(timings) // 2] * 1000:.1f}ms")
+    print("기대 라인 모두 포함" if not missing else f"누락된 라인: {missing}")
+    return not missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Notion 브라우저리스 추출 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(run(args.repeat)) else 1)
+
+
+if __name__ == "__main__":
+    main()
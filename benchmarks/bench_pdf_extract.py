@@ -0,0 +1,95 @@
+"""
+PDF 텍스트 추출 벤치마크: 합성 PDF로 전체 페이지 순차 추출과 페이지 상한/병렬 추출을 비교합니다.
+
+실행: python -m benchmarks.bench_pdf_extract --pages 2 12 40 --repeat 5
+"""
+import argparse
+import io
+import tempfile
+import time
+
+import PyPDF2
+from fastapi import UploadFile
+
+from app.util.pdf_extractor import PAGE_SEPARATOR, PDFExtractor
+
+
+def build_pdf(page_count: int, lines_per_page: int = 45) -> bytes:
+    """Helvetica 텍스트 줄로 채운 최소 PDF를 만듭니다."""
+    font_id = 3 + 2 * page_count
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(page_count))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>",
+    ]
+    for i in range(page_count):
+        lines = " ".join(
+            f"(Page {i + 1} line {j}: Python FastAPI MongoDB backend project experience) Tj 0 -14 Td"
+            for j in range(lines_per_page)
+        )
+        content = f"BT /F1 10 Tf 20 800 Td {lines} ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+def extract_all_pages(data: bytes) -> str:
+    """기존 방식: 전체를 읽고 모든 페이지를 순차로 이어 붙입니다."""
+    text = ""
+    for page in PyPDF2.PdfReader(io.BytesIO(data)).pages:
+        text += page.extract_text() or ""
+    return text
+
+
+def extract_upload(data: bytes) -> str:
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    spooled.write(data)
+    spooled.seek(0)
+    return PDFExtractor.extract_text_from_pdf(UploadFile(spooled, filename="bench.pdf"))
+
+
+def median_time(fn, data, repeat):
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn(data)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return text, timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 텍스트 추출 벤치마크")
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 12, 40], help="합성 PDF 페이지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    for page_count in args.pages:
+        data = build_pdf(page_count)
+        old_text, old_time = median_time(extract_all_pages, data, args.repeat)
+        new_text, new_time = median_time(extract_upload, data, args.repeat)
+
+        print(f"{page_count}페이지 ({len(data) // 1024} KB)")
+        print(f"  전체 순차   중앙값 {old_time * 1000:8.2f}ms  텍스트 {len(old_text)}자")
+        print(f"  상한/병렬   중앙값 {new_time * 1000:8.2f}ms  텍스트 {len(new_text)}자")
+        # 새 추출기는 페이지 사이에 PAGE_SEPARATOR를 넣으므로 빼고 비교한다
+        print(f"  앞부분 일치: {'예' if old_text.startswith(new_text.replace(PAGE_SEPARATOR, '')) else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+요청 제한기 벤치마크: 활성 클라이언트 10만 개의 상태 메모리와 요청당 판정 시간을 측정합니다.
+
+실행: python -m benchmarks.bench_rate_limiter --keys 100000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from app.util.rate_limiter import DEFAULT_RULE, RULES, TokenBucketLimiter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 제한기 메모리/속도 벤치마크")
+    parser.add_argument("--keys", type=int, default=100_000, help="활성 클라이언트 수")
+    parser.add_argument("--hits", type=int, default=500_000, help="판정 횟수")
+    args = parser.parse_args()
+
+    clients = [f"ip:10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}" for i in range(args.keys)]
+
+    tracemalloc.start()
+    limiter = TokenBucketLimiter(max_keys=args.keys)
+    now = 0.0
+    for client in clients:
+        limiter.hit(client, DEFAULT_RULE, now)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # 클라이언트 키 문자열은 요청 헤더에서 오므로 제한기 상태 크기에서 뺀다
+    key_bytes = sum(len(client) + 49 for client in clients)
+    print(f"클라이언트 {args.keys:,}개 상태: {current / 2**20:.1f} MiB (키 문자열 포함), "
+          f"{(current - key_bytes) / args.keys:.0f} B/클라이언트 (키 제외)")
+
+    rules = RULES + (DEFAULT_RULE,) * 6
+    random.seed(1)
+    picks = [(random.choice(clients), random.choice(rules)) for _ in range(args.hits)]
+    start = time.perf_counter()
+    for i, (client, rule) in enumerate(picks):
+        limiter.hit(client, rule, now + i * 1e-4)
+    elapsed = time.perf_counter() - start
+    print(f"판정 {args.hits:,}회: 요청당 {elapsed / args.hits * 1e6:.2f}µs, 제외된 클라이언트 {limiter.evicted}")
+    print(limiter.stats())
+
+
+if __name__ == "__main__":
+    main()
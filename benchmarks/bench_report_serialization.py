@@ -0,0 +1,93 @@
+"""
+보고서 응답 직렬화 벤치마크: FastAPI response_model 검증 + 표준 json 경로와
+미리 만든 스키마 직렬화 함수 + orjson 경로를 비교합니다.
+
+실행: python -m benchmarks.bench_report_serialization --repeat 2000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.schemas.report_schema import Report
+from app.util.report_serializer import build_projection, parse_fields, serialize_report
+
+REPORT_FIELD = create_model_field(name="Response_get_report", type_=Report, mode="serialization")
+LOOP = asyncio.new_event_loop()
+
+
+def sample_report() -> dict:
+    """create_report가 저장하는 것과 같은 모양의 보고서 문서"""
+    return {
+        "_id": ObjectId(),
+        "user": {"name": "홍길동", "exp": "new", "job": "backend"},
+        "career_fitness": 78,
+        "trend_jd": [{"name": f"스킬 {i}", "keyword": 100 - i} for i in range(10)],
+        "trend_skill": ["Java", "Spring Boot", "MySQL", "AWS", "Docker", "Kubernetes", "Redis", "Kafka"],
+        "my_trend_skill": ["Java", "Spring Boot", "MySQL", "AWS"],
+        "personal_skill": [
+            {"skill": f"역량 {i}", "description": "대규모 트래픽 환경에서 API 서버를 설계하고 운영한 경험이 있습니다. " * 3}
+            for i in range(3)
+        ],
+        "ai_summary": "안정적인 서버 구축의 달인",
+        "ai_review": "백엔드 개발에 필요한 핵심 기술을 보유하고 있습니다. " * 10,
+    }
+
+
+def legacy_path(doc: dict) -> bytes:
+    """기존 방식: _id 변환 → response_model 검증/직렬화 → JSONResponse(json.dumps)"""
+    doc["id"] = str(doc.pop("_id"))
+    content = LOOP.run_until_complete(serialize_response(field=REPORT_FIELD, response_content=doc))
+    return JSONResponse(content).body
+
+
+def fast_path(doc: dict) -> bytes:
+    return serialize_report(doc)
+
+
+def sparse_path(doc: dict) -> bytes:
+    # projection이 적용되었다고 가정하고 요청 필드만 남긴 문서를 직렬화
+    projection = build_projection(parse_fields("user,career_fitness,ai_summary"))
+    return serialize_report({key: value for key, value in doc.items() if key in projection})
+
+
+def measure(fn, repeat):
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        doc = sample_report()
+        start = time.perf_counter()
+        body = fn(doc)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return body, timings[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보고서 응답 직렬화 벤치마크")
+    parser.add_argument("--repeat", type=int, default=2000, help="반복 횟수")
+    args = parser.parse_args()
+
+    legacy_body, legacy_time = measure(legacy_path, args.repeat)
+    fast_body, fast_time = measure(fast_path, args.repeat)
+    sparse_body, sparse_time = measure(sparse_path, args.repeat)
+
+    print(f"기존(response_model + json)   중앙값 {legacy_time * 1e6:8.1f}µs  {len(legacy_body)} 바이트")
+    print(f"orjson 직렬화                 중앙값 {fast_time * 1e6:8.1f}µs  {len(fast_body)} 바이트")
+    print(f"orjson + fields 3개           중앙값 {sparse_time * 1e6:8.1f}µs  {len(sparse_body)} 바이트")
+    print(f"속도 향상 {legacy_time / fast_time:.1f}배")
+
+    legacy = json.loads(legacy_body)
+    fast = json.loads(fast_body)
+    legacy.pop("id")
+    fast.pop("id")
+    print(f"결과 일치(id 제외): {'예' if legacy == fast else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+스킬 통계 엔진 벤치마크: 실제 JD 코퍼스를 목표 공고 수(기본 약 50만 개, 코퍼스 5천 개의 100배)까지 복제해
+compute_skill_stats() 시간을 측정하고 예산과 비교합니다.
+
+실행: python -m benchmarks.bench_skill_stats --postings 500000 --budget-ms 1000
+"""
+import argparse
+import glob
+import json
+import math
+import sys
+import time
+
+import numpy as np
+
+from app.jd.skill_stats import SkillMatrix, compute_skill_stats
+
+
+def load_corpus():
+    jd_list = []
+    for path in sorted(glob.glob("jobs/*/jd_analysis_result.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            jd_list.extend(json.load(f))
+    return jd_list
+
+
+def scale_matrix(matrix, scale):
+    """공고 행을 scale배 복제한 행렬을 만듭니다."""
+    n = matrix.n_postings
+    offsets = np.repeat(np.arange(scale, dtype=np.int64) * n, len(matrix.rows))
+    return SkillMatrix(
+        np.tile(matrix.rows, scale) + offsets,
+        np.tile(matrix.cols, scale),
+        np.tile(matrix.scores, scale),
+        matrix.skills,
+        n * scale,
+        np.tile(matrix.is_new, scale),
+        np.tile(matrix.is_old, scale),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스킬 통계 엔진 벤치마크")
+    parser.add_argument("--postings", type=int, default=500_000, help="복제 후 공고 수 (코퍼스 배수로 올림)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--budget-ms", type=float, default=1000, help="스킬 종류별 허용 시간(ms, 중앙값 기준)")
+    args = parser.parse_args()
+
+    jd_list = load_corpus()
+    scale = max(1, math.ceil(args.postings / len(jd_list)))
+    over_budget = []
+    for field in ("하드 스킬", "소프트 스킬"):
+        matrix = scale_matrix(SkillMatrix.from_jd_list(jd_list, field), scale)
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            compute_skill_stats(matrix)
+            timings.append(time.perf_counter() - start)
+        median_ms = sorted(timings)[len(timings) // 2] * 1000
+        print(
+            f"{field}: 공고 {matrix.n_postings}개, 스킬 {matrix.n_skills}개, 항목 {len(matrix.rows)}개 "
+            f"- 최소 {min(timings) * 1000:.1f}ms / 중앙값 {median_ms:.1f}ms"
+        )
+        if median_ms > args.budget_ms:
+            over_budget.append(field)
+
+    for field in over_budget:
+        print(f"실패: {field} 통계가 예산 {args.budget_ms:.0f}ms 초과")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+서버 시작 시간 벤치마크: `python -X importtime`으로 app.main import 시간을 패키지별로 나누어 보고,
+새 프로세스에서 첫 요청(GET /)을 처리하기까지의 시간을 예산과 비교합니다.
+무거운 의존성(motor, PyPDF2, requests, playwright 등)이 시작 시점에 import되면 실패로 처리합니다.
+
+실행: python -m benchmarks.bench_startup --repeat 5 --budget-ms 700
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+# 처음 쓰는 시점에 가져와야 하는 모듈
+LAZY_MODULES = ("motor", "pymongo", "PyPDF2", "requests", "playwright", "bs4", "selectolax", "pandas", "numpy")
+
+FIRST_REQUEST_SCRIPT = """
+import time
+start = time.perf_counter()
+import json, sys
+from fastapi.testclient import TestClient
+import app.main
+imported = time.perf_counter()
+with TestClient(app.main.app) as client:
+    response = client.get("/")
+    first_request = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (first_request - start) * 1000,
+    "status": response.status_code,
+    "eager": [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+def _env():
+    # 예열은 시작 후 백그라운드에서 무거운 모듈을 가져오므로 import/첫 요청 측정에서는 끈다
+    return {**os.environ, "WARMUP_ENABLED": "false"}
+
+
+def import_profile() -> dict:
+    """python -X importtime 출력에서 최상위 패키지별 self 시간(µs)과 app.main 누적 시간을 모읍니다."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, env=_env(), check=True,
+    )
+    by_package = defaultdict(int)
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        by_package[name.split(".")[0]] += int(self_us)
+        if name == "app.main":
+            total = int(cumulative_us)
+    return {"total_us": total, "by_package": by_package}
+
+
+def first_request() -> dict:
+    """새 인터프리터에서 app.main을 import하고 첫 요청에 응답하기까지의 시간을 잽니다."""
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST_SCRIPT % (LAZY_MODULES,)],
+        capture_output=True, text=True, env=_env(), check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=12, help="출력할 패키지 수")
+    parser.add_argument("--budget-ms", type=float, default=700, help="첫 요청까지 허용하는 시간(ms, 중앙값 기준)")
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.repeat)]
+    totals = [profile["total_us"] / 1000 for profile in profiles]
+    print(f"import app.main: 중앙값 {statistics.median(totals):.0f}ms (최소 {min(totals):.0f}ms)")
+    packages = defaultdict(list)
+    for profile in profiles:
+        for package, self_us in profile["by_package"].items():
+            packages[package].append(self_us / 1000)
+    ranked = sorted(packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for package, times in ranked[:args.top]:
+        print(f"  {package:<28} {statistics.median(times):7.1f}ms")
+
+    runs = [first_request() for _ in range(args.repeat)]
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    first_request_ms = statistics.median(run["first_request_ms"] for run in runs)
+    print(f"첫 요청까지: 중앙값 {first_request_ms:.0f}ms (import {import_ms:.0f}ms), 예산 {args.budget_ms:.0f}ms")
+
+    failures = []
+    eager = sorted({name for run in runs for name in run["eager"]})
+    if eager:
+        failures.append(f"시작 시점에 import된 무거운 모듈: {', '.join(eager)}")
+    if first_request_ms > args.budget_ms:
+        failures.append(f"첫 요청까지 {first_request_ms:.0f}ms로 예산 {args.budget_ms:.0f}ms 초과")
+    for failure in failures:
+        print(f"실패: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
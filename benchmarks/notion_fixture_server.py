@@ -0,0 +1,86 @@
+"""
+Notion 공개 페이지 데이터 API(loadPageChunk / syncRecordValues)를 흉내 내는 로컬 픽스처 서버입니다.
+
+NOTION_API_BASE=http://127.0.0.1:8765/api/v3 로 지정하면 NotionExtractor가 이 서버를 사용합니다.
+실행: python -m benchmarks.notion_fixture_server --port 8765
+"""
+import argparse
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "notion", "resume_record_map.json")
+
+# 첫 청크에 담을 블록 수 (나머지는 다음 청크 / syncRecordValues로 제공)
+FIRST_CHUNK_SIZE = 8
+
+
+def load_fixture(path=FIXTURE_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_handler(fixture):
+    page_id = fixture["page_id"]
+    blocks = fixture["block"]
+    # 루트 페이지와 직계 자식 일부만 청크로 제공해 하위 블록 보충 경로도 거치도록 한다
+    ordered = [page_id] + blocks[page_id]["content"]
+    chunks = [ordered[:FIRST_CHUNK_SIZE], ordered[FIRST_CHUNK_SIZE:]]
+
+    def record_map(ids):
+        return {"block": {bid: {"role": "reader", "value": blocks[bid]} for bid in ids if bid in blocks}}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+
+            if self.path.endswith("/loadPageChunk"):
+                if request.get("pageId") != page_id:
+                    return self._send(404, {"errorId": "not-found", "name": "ValidationError"})
+                chunk_number = request.get("chunkNumber", 0)
+                ids = chunks[chunk_number] if chunk_number < len(chunks) else []
+                has_more = chunk_number + 1 < len(chunks)
+                cursor = {"stack": [[{"table": "block", "id": page_id, "index": FIRST_CHUNK_SIZE}]]} if has_more else {"stack": []}
+                return self._send(200, {"recordMap": record_map(ids), "cursor": cursor})
+
+            if self.path.endswith("/syncRecordValues"):
+                ids = [r["pointer"]["id"] for r in request.get("requests", [])]
+                return self._send(200, {"recordMap": record_map(ids)})
+
+            self._send(404, {"errorId": "unknown-endpoint"})
+
+    return Handler
+
+
+def start_server(port=0, fixture=None):
+    """백그라운드 스레드에서 서버를 띄우고 (server, api_base)를 반환합니다."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(fixture or load_fixture()))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/v3"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Notion 페이지 데이터 API 픽스처 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(load_fixture()))
+    print(f"Notion 픽스처 서버 실행 중: http://127.0.0.1:{args.port}/api/v3")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()